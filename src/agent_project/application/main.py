@@ -10,9 +10,24 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from prometheus_client import make_asgi_app
 
-from agent_project.application.routers import admin, chat, health
+from agent_project.application.middleware import (
+    MetricsMiddleware,
+    TimingMiddleware,
+    TracingMiddleware,
+)
+from agent_project.application.readiness import readiness
+from agent_project.application.routers import admin, chat, clauses, health, suggest
 from agent_project.config import settings
-from agent_project.core.utils.logging import setup_logging
+from agent_project.core.tools.autocomplete import autocomplete
+from agent_project.core.utils.logging import setup_logging, shutdown_logging
+from agent_project.core.utils.loop_monitor import event_loop_monitor
+from agent_project.core.utils.profiler import continuous_profiler
+from agent_project.core.utils.tracing import setup_tracing, shutdown_tracing
+from agent_project.infrastructure.auth.jwks import jwks_manager
+from agent_project.infrastructure.health import health_monitor
+from agent_project.infrastructure.vector_db.client import close_vector_client
+from agent_project.infrastructure.vector_db.local_index import local_index
+from agent_project.infrastructure.vector_db.section_index import section_index
 
 
 @asynccontextmanager
@@ -22,11 +37,29 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     setup_logging(level=settings.log_level)
     logger = structlog.get_logger()
     logger.info("Starting Code Vision Agent API", version=settings.app_version)
+    setup_tracing()
+    if settings.loop_monitor_enabled:
+        event_loop_monitor.start()
+    if settings.continuous_profiling_enabled:
+        continuous_profiler.start()
+    # Warm pools, agents and keys in the background; see /api/health/startup
+    readiness.start_warm_up()
 
     yield
 
     # Shutdown
     logger.info("Shutting down Code Vision Agent API")
+    await readiness.drain()
+    await health_monitor.stop()
+    await local_index.stop()
+    await section_index.stop()
+    await autocomplete.stop()
+    await close_vector_client()
+    await event_loop_monitor.stop()
+    continuous_profiler.stop()
+    await jwks_manager.close()
+    shutdown_tracing()
+    shutdown_logging()
 
 
 def create_app() -> FastAPI:
@@ -50,10 +83,26 @@ def create_app() -> FastAPI:
         allow_headers=["*"],
     )
 
+    # Opt-in latency breakdown (X-Debug-Timing header / ?timing=true)
+    app.add_middleware(TimingMiddleware)
+
+    # Request metrics
+    app.add_middleware(MetricsMiddleware)
+
+    # Request tracing
+    if settings.enable_tracing:
+        app.add_middleware(TracingMiddleware)
+
     # Include routers
     app.include_router(
         chat.router, prefix=f"/api/{settings.api_version}", tags=["chat"]
     )
+    app.include_router(
+        clauses.router, prefix=f"/api/{settings.api_version}", tags=["clauses"]
+    )
+    app.include_router(
+        suggest.router, prefix=f"/api/{settings.api_version}", tags=["suggest"]
+    )
     app.include_router(health.router, prefix="/api", tags=["health"])
     app.include_router(
         admin.router, prefix=f"/api/{settings.api_version}/admin", tags=["admin"]
@@ -0,0 +1,149 @@
+"""
+ASGI middleware for request instrumentation.
+"""
+
+import time
+from urllib.parse import parse_qs
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from agent_project.core.utils.metrics import (
+    HTTP_REQUEST_DURATION,
+    HTTP_REQUESTS,
+    HTTP_REQUESTS_IN_FLIGHT,
+)
+from agent_project.core.utils.timing import clear_request_timings, start_request_timings
+from agent_project.core.utils.tracing import server_span
+
+
+class MetricsMiddleware:
+    """
+    Records request count, duration and in-flight requests per route.
+
+    Implemented as plain ASGI middleware so streaming responses are timed
+    until their last chunk is sent. Routes are labelled by their path
+    template (e.g. ``/api/v1/chat/session/{session_id}``) to keep label
+    cardinality bounded.
+    """
+
+    def __init__(self, app: ASGIApp, excluded_paths: tuple[str, ...] = ("/metrics",)):
+        self.app = app
+        self.excluded_paths = excluded_paths
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"].startswith(self.excluded_paths):
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        HTTP_REQUESTS_IN_FLIGHT.inc()
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            duration = time.perf_counter() - start
+            HTTP_REQUESTS_IN_FLIGHT.dec()
+
+            route = scope.get("route")
+            route_path = getattr(route, "path", None) or "unmatched"
+            method = scope["method"]
+
+            HTTP_REQUEST_DURATION.labels(method, route_path).observe(duration)
+            HTTP_REQUESTS.labels(method, route_path, str(status_code)).inc()
+
+
+class TracingMiddleware:
+    """
+    Wraps each HTTP request in an OpenTelemetry server span.
+
+    Incoming W3C ``traceparent`` headers are honoured, and the span is
+    renamed to the matched route template once routing has happened.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        headers = {
+            key.decode("latin-1"): value.decode("latin-1")
+            for key, value in scope["headers"]
+        }
+
+        with server_span(f"{method} {scope['path']}", headers) as span:
+            if span is None:
+                await self.app(scope, receive, send)
+                return
+
+            async def send_wrapper(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    span.set_attribute("http.status_code", message["status"])
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_wrapper)
+            finally:
+                route_path = getattr(scope.get("route"), "path", None)
+                span.set_attribute("http.method", method)
+                if route_path:
+                    span.set_attribute("http.route", route_path)
+                    span.update_name(f"{method} {route_path}")
+
+
+class TimingMiddleware:
+    """
+    Opt-in per-request latency breakdown.
+
+    Requests sent with an ``X-Debug-Timing: 1`` header or a ``timing=true``
+    query parameter get a ``RequestTimings`` collector bound to their
+    context and a ``Server-Timing`` response header. Endpoints may also
+    include the breakdown in their response body.
+    """
+
+    TRUTHY = {"1", "true", "yes"}
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    def _is_requested(self, scope: Scope) -> bool:
+        for key, value in scope["headers"]:
+            if key == b"x-debug-timing":
+                return value.decode("latin-1").lower() in self.TRUTHY
+
+        query_string = scope.get("query_string", b"")
+        if b"timing" not in query_string:
+            return False
+        values = parse_qs(query_string.decode("latin-1")).get("timing", [])
+        return any(value.lower() in self.TRUTHY for value in values)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not self._is_requested(scope):
+            await self.app(scope, receive, send)
+            return
+
+        timings = start_request_timings()
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = list(message.get("headers", []))
+                headers.append(
+                    (b"server-timing", timings.server_timing_header().encode("latin-1"))
+                )
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            clear_request_timings()
@@ -0,0 +1,192 @@
+"""
+Instance warm-up and readiness state behind the startup and readiness probes.
+
+Warm-up runs in the background after the server starts listening, so the
+liveness probe answers immediately while the startup probe holds traffic
+back until pools, agents and keys are loaded.
+"""
+
+import asyncio
+import importlib
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+import structlog
+
+from agent_project.config import settings
+from agent_project.infrastructure.auth.dependencies import get_signing_keys
+from agent_project.infrastructure.auth.jwks import jwks_manager
+from agent_project.infrastructure.health import health_monitor
+from agent_project.infrastructure.vector_db.client import get_vector_client
+
+logger = structlog.get_logger()
+
+SPECIALIST_AGENTS = [
+    "code_b",
+    "code_c",
+    "code_d",
+    "code_e",
+    "code_f",
+    "code_g",
+    "code_h",
+]
+
+
+class ReadinessState:
+    """
+    Tracks warm-up progress and shutdown draining for this instance.
+
+    The instance is ready once every warm-up step has finished (failures
+    are logged rather than blocking forever), it is not draining, and no
+    critical dependency is unhealthy.
+    """
+
+    def __init__(self):
+        self.started = False
+        self.draining = False
+        self.steps: Dict[str, Dict[str, Any]] = {}
+        self._warmups: Dict[str, Callable[[], Awaitable[None]]] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    def add_step(self, name: str, step: Callable[[], Awaitable[None]]) -> None:
+        """Register a warm-up step to run before the instance reports ready."""
+        self._warmups[name] = step
+
+    @property
+    def ready(self) -> bool:
+        return (
+            self.started
+            and not self.draining
+            and health_monitor.overall_status() != "unhealthy"
+        )
+
+    async def warm_up(self) -> None:
+        """Run all warm-up steps concurrently, then mark the instance started."""
+        start = time.perf_counter()
+        await asyncio.gather(*(self._run_step(name) for name in self._warmups))
+        self.started = True
+
+        logger.info(
+            "Warm-up complete",
+            duration_ms=round((time.perf_counter() - start) * 1000, 3),
+            failed=[n for n, s in self.steps.items() if s["status"] != "ok"],
+        )
+
+    async def _run_step(self, name: str) -> None:
+        start = time.perf_counter()
+        try:
+            await asyncio.wait_for(
+                self._warmups[name](), timeout=settings.warmup_timeout_seconds
+            )
+            self.steps[name] = {"status": "ok"}
+        except asyncio.TimeoutError:
+            self.steps[name] = {"status": "failed", "error": "timeout"}
+        except Exception as e:
+            self.steps[name] = {"status": "failed", "error": str(e)}
+
+        self.steps[name]["duration_ms"] = round((time.perf_counter() - start) * 1000, 3)
+        if self.steps[name]["status"] != "ok":
+            logger.warning("Warm-up step failed", step=name, **self.steps[name])
+
+    def start_warm_up(self) -> None:
+        """Start warm-up in the background."""
+        self.started = False
+        self.draining = False
+        self._task = asyncio.get_running_loop().create_task(self.warm_up())
+
+    async def drain(self) -> None:
+        """Report not-ready from now on and stop any unfinished warm-up."""
+        self.draining = True
+        logger.info("Draining instance")
+
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+        self._task = None
+
+
+def _load_agents() -> None:
+    # Importing the agent modules pulls in LangGraph/LangChain, which
+    # dominates cold-start time, and building the orchestrator compiles its graph
+    from agent_project.core.agents.orchestrator.agent import OrchestratorAgent
+
+    for agent_type in SPECIALIST_AGENTS:
+        importlib.import_module(f"agent_project.core.agents.{agent_type}.agent")
+    OrchestratorAgent()
+
+
+async def warm_agents() -> None:
+    """Import agent modules and build the orchestrator off the event loop."""
+    await asyncio.to_thread(_load_agents)
+
+
+async def warm_vector_db() -> None:
+    """Open vector DB connections."""
+    client = await asyncio.to_thread(get_vector_client)
+    await client.warm_up()
+
+
+async def warm_jwks() -> None:
+    """Fetch the JWKS and precompute signing keys."""
+    get_signing_keys(await jwks_manager.get_keys())
+
+
+async def load_local_index() -> None:
+    """Build the in-process vector index and watch for new artifact versions."""
+    from agent_project.infrastructure.vector_db.local_index import local_index
+
+    await local_index.start()
+
+
+async def load_section_index() -> None:
+    """Load the section index for direct clause lookups."""
+    from agent_project.infrastructure.vector_db.section_index import section_index
+
+    await section_index.start()
+
+
+async def build_autocomplete() -> None:
+    """Build the suggest index once clause titles are available."""
+    from agent_project.core.tools.autocomplete import autocomplete
+
+    if "section_index" in readiness._warmups:
+        # Titles come from the section index, which loads concurrently
+        while "section_index" not in readiness.steps:
+            await asyncio.sleep(0.05)
+    await autocomplete.start()
+
+
+async def load_tokenizer() -> None:
+    """Load the default model's tokenizer for context assembly."""
+    from agent_project.core.tools.context_assembler import load_token_counter
+
+    await load_token_counter(settings.default_model)
+
+
+async def prime_caches() -> None:
+    """Run one search per specialist so query plans and connections are hot."""
+    client = get_vector_client()
+    await asyncio.gather(
+        *(
+            client.similarity_search("building requirements", agent_type, limit=1)
+            for agent_type in SPECIALIST_AGENTS
+        )
+    )
+
+
+# Global readiness state instance
+readiness = ReadinessState()
+readiness.add_step("health_checks", health_monitor.start)
+readiness.add_step("vector_db", warm_vector_db)
+readiness.add_step("agents", warm_agents)
+readiness.add_step("jwks", warm_jwks)
+if settings.embedding_artifact_path and settings.local_vector_index_enabled:
+    readiness.add_step("local_vector_index", load_local_index)
+if settings.section_index_enabled and settings.database_url:
+    readiness.add_step("section_index", load_section_index)
+if settings.autocomplete_enabled:
+    readiness.add_step("autocomplete", build_autocomplete)
+if settings.context_assembly_enabled:
+    readiness.add_step("tokenizer", load_tokenizer)
+if settings.warmup_prime_caches:
+    readiness.add_step("caches", prime_caches)
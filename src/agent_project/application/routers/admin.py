@@ -2,15 +2,22 @@
 Admin endpoints for system management and debugging.
 """
 
+import asyncio
 from datetime import datetime, timezone
 from typing import Any, Dict, List
 
 import structlog
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import PlainTextResponse
 from pydantic import BaseModel
 
+from agent_project.core.utils import profiler
 from agent_project.infrastructure.auth.dependencies import get_admin_user
-from agent_project.infrastructure.vector_db.client import VectorDBClient
+from agent_project.infrastructure.vector_db.client import (
+    VectorDBClient,
+    get_vector_client,
+)
+from agent_project.infrastructure.vector_db.result_cache import vector_result_cache
 
 logger = structlog.get_logger()
 router = APIRouter()
@@ -97,6 +104,106 @@ async def get_database_stats(
         )
 
 
+@router.get("/vector-indexes")
+async def get_vector_indexes(
+    admin_user: Dict[str, Any] = Depends(get_admin_user)
+) -> Dict[str, Any]:
+    """
+    List the ANN indexes and check each clause type's search plan uses its
+    partial index.
+    """
+    try:
+        vector_client = get_vector_client()
+        indexes = await vector_client.get_vector_indexes()
+        clause_types = await vector_client.list_clause_types()
+        plans = await asyncio.gather(
+            *(vector_client.explain_filtered_search(ct) for ct in clause_types)
+        )
+
+        return {
+            "indexes": indexes,
+            "filtered_searches": plans,
+            "all_use_partial_indexes": all(p["uses_partial_index"] for p in plans),
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+        }
+
+    except Exception as e:
+        logger.error("Failed to inspect vector indexes", error=str(e))
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to inspect vector indexes",
+        )
+
+
+@router.post("/vector-indexes")
+async def build_vector_indexes(
+    clause_type: List[str] | None = Query(default=None),
+    admin_user: Dict[str, Any] = Depends(get_admin_user),
+) -> Dict[str, Any]:
+    """
+    Create missing per-clause-type partial HNSW indexes.
+
+    Builds run concurrently with traffic; pass clause_type to build one at a
+    time on large tables.
+    """
+    logger.info(
+        "Vector index build requested",
+        admin_id=admin_user.get("sub"),
+        clause_types=clause_type,
+    )
+
+    try:
+        outcome = await get_vector_client().ensure_clause_type_indexes(clause_type)
+    except RuntimeError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except Exception as e:
+        logger.error("Vector index build failed", error=str(e))
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Vector index build failed",
+        )
+
+    return {
+        "indexes": outcome,
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+    }
+
+
+@router.get("/vector-cache")
+async def get_vector_cache(
+    admin_user: Dict[str, Any] = Depends(get_admin_user)
+) -> Dict[str, Any]:
+    """
+    Get vector search result cache statistics.
+    """
+    return {
+        "enabled": vector_result_cache.enabled,
+        **vector_result_cache.stats(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+    }
+
+
+@router.delete("/vector-cache")
+async def clear_vector_cache(
+    admin_user: Dict[str, Any] = Depends(get_admin_user)
+) -> Dict[str, Any]:
+    """
+    Drop all cached vector search results.
+    """
+    cleared = vector_result_cache.stats()["entries"]
+    vector_result_cache.clear()
+    logger.info(
+        "Vector result cache cleared", admin_id=admin_user.get("sub"), entries=cleared
+    )
+
+    return {
+        "entries_cleared": cleared,
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+    }
+
+
 @router.delete("/sessions/cleanup")
 async def cleanup_expired_sessions(
     older_than_hours: int = Query(default=24, ge=1, le=168),  # 1 hour to 1 week
@@ -183,3 +290,83 @@ async def test_agent(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Agent test failed",
         )
+
+
+def _collapsed_response(result: profiler.SamplingProfiler) -> PlainTextResponse:
+    """Return a profile as a downloadable collapsed-stack file."""
+    filename = f"profile-{result.started_at.strftime('%Y%m%dT%H%M%SZ')}.collapsed"
+    return PlainTextResponse(
+        result.collapsed(),
+        headers={
+            "Content-Disposition": f'attachment; filename="{filename}"',
+            "X-Profile-Samples": str(result.samples),
+            "X-Profile-Duration": f"{result.duration:.3f}",
+        },
+    )
+
+
+@router.get("/profile", response_class=PlainTextResponse)
+async def profile_cpu(
+    duration: float = Query(default=10, gt=0, le=60),
+    interval_ms: float = Query(default=10, ge=1, le=1000),
+    admin_user: Dict[str, Any] = Depends(get_admin_user),
+) -> PlainTextResponse:
+    """
+    Sample all threads for a number of seconds and return collapsed stacks.
+
+    The output can be passed to flamegraph.pl or loaded into speedscope.
+    """
+    logger.info(
+        "Admin profile requested",
+        admin_id=admin_user.get("sub"),
+        duration=duration,
+        interval_ms=interval_ms,
+    )
+
+    try:
+        result = await profiler.profile(duration, interval_ms / 1000)
+    except RuntimeError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+
+    return _collapsed_response(result)
+
+
+@router.get("/profile/continuous", response_class=PlainTextResponse)
+async def get_continuous_profile(
+    admin_user: Dict[str, Any] = Depends(get_admin_user)
+) -> PlainTextResponse:
+    """
+    Get the most recent window collected by the continuous profiler.
+    """
+    latest = profiler.continuous_profiler.latest
+    if latest is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="No continuous profile available yet",
+        )
+
+    return _collapsed_response(latest)
+
+
+@router.post("/profile/continuous")
+async def set_continuous_profiling(
+    enabled: bool, admin_user: Dict[str, Any] = Depends(get_admin_user)
+) -> Dict[str, Any]:
+    """
+    Start or stop continuous low-rate profiling.
+    """
+    logger.info(
+        "Continuous profiling toggled",
+        admin_id=admin_user.get("sub"),
+        enabled=enabled,
+    )
+
+    if enabled:
+        profiler.continuous_profiler.start()
+    else:
+        profiler.continuous_profiler.stop()
+
+    return {
+        "enabled": profiler.continuous_profiler.running,
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+    }
@@ -10,7 +10,8 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
-from agent_project.core.agents.orchestrator.agent import OrchestratorAgent
+from agent_project.core.tools.autocomplete import autocomplete
+from agent_project.core.utils.timing import get_request_timings
 from agent_project.infrastructure.auth.dependencies import get_current_user
 
 logger = structlog.get_logger()
@@ -31,6 +32,7 @@ class ChatResponse(BaseModel):
     session_id: str
     sources: list[Dict[str, Any]] = []
     agent_used: str | None = None
+    timings: Dict[str, Any] | None = None
 
 
 @router.post("/chat", response_model=ChatResponse)
@@ -41,6 +43,8 @@ async def chat_endpoint(
     Main chat endpoint for processing user queries.
 
     Routes queries through the orchestrator agent to appropriate specialists.
+    Send ``X-Debug-Timing: 1`` or ``?timing=true`` to include a per-stage
+    latency breakdown in the response.
     """
     try:
         # Generate session ID if not provided
@@ -53,7 +57,10 @@ async def chat_endpoint(
             content_length=len(message.content),
         )
 
-        # Initialize orchestrator agent
+        # Initialize orchestrator agent (imported lazily: it pulls in LangGraph
+        # and the LLM SDKs, which dominate start-up time)
+        from agent_project.core.agents.orchestrator.agent import OrchestratorAgent
+
         orchestrator = OrchestratorAgent()
 
         # Process the message
@@ -63,11 +70,16 @@ async def chat_endpoint(
             user_id=current_user.get("sub"),
         )
 
+        if not result.get("error"):
+            autocomplete.record_query(message.content, current_user.get("sub"))
+        timings = get_request_timings()
+
         return ChatResponse(
             response=result["response"],
             session_id=session_id,
             sources=result.get("sources", []),
             agent_used=result.get("agent_used"),
+            timings=timings.as_dict() if timings else None,
         )
 
     except Exception as e:
@@ -94,6 +106,8 @@ async def chat_stream_endpoint(
             session_id=session_id,
         )
 
+        from agent_project.core.agents.orchestrator.agent import OrchestratorAgent
+
         orchestrator = OrchestratorAgent()
 
         async def generate_response():
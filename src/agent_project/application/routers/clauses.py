@@ -0,0 +1,63 @@
+"""
+Direct clause lookup endpoints.
+"""
+
+from typing import Any, Dict
+
+import structlog
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from pydantic import BaseModel
+
+from agent_project.infrastructure.auth.dependencies import get_current_user
+from agent_project.infrastructure.vector_db.section_index import (
+    normalize_section,
+    section_index,
+)
+
+logger = structlog.get_logger()
+router = APIRouter()
+
+
+class ClauseLookupResponse(BaseModel):
+    """Clause lookup response model."""
+
+    section: str
+    clauses: list[Dict[str, Any]]
+
+
+@router.get("/clauses/{section:path}", response_model=ClauseLookupResponse)
+async def get_clause(
+    section: str,
+    include_subsections: bool = Query(
+        True, description="Also return nested sections (B1.3 -> B1.3.1, ...)"
+    ),
+    current_user: Dict[str, Any] = Depends(get_current_user),
+) -> ClauseLookupResponse:
+    """
+    Look up a clause by its section reference, e.g. ``B1.3.2`` or ``E2/AS1``.
+
+    Served from the in-memory section index and a primary-key fetch, without
+    vector search or LLM calls.
+    """
+    if section_index.index is None:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Section index is not loaded",
+        )
+
+    try:
+        clauses = await section_index.lookup(section, include_subsections)
+    except Exception as e:
+        logger.error("Clause lookup failed", section=section, error=str(e))
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to look up clause",
+        )
+
+    if not clauses:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Clause {section} not found",
+        )
+
+    return ClauseLookupResponse(section=normalize_section(section), clauses=clauses)
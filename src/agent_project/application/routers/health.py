@@ -6,11 +6,13 @@ from datetime import datetime, timezone
 from typing import Any, Dict
 
 import structlog
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, HTTPException, Response, status
 from pydantic import BaseModel
 
+from agent_project.application.readiness import readiness
 from agent_project.config import settings
-from agent_project.infrastructure.vector_db.client import VectorDBClient
+from agent_project.core.utils.loop_monitor import event_loop_monitor
+from agent_project.infrastructure.health import health_monitor
 
 logger = structlog.get_logger()
 router = APIRouter()
@@ -29,55 +31,86 @@ class HealthResponse(BaseModel):
 async def health_check() -> HealthResponse:
     """
     Basic health check endpoint.
+
+    Served from the background health monitor's cached results.
     """
-    services = {}
+    # Without the lifespan (e.g. tests), populate the cache on first use
+    if not health_monitor.results:
+        await health_monitor.run_checks()
 
-    # Check vector database connection
-    try:
-        vector_client = VectorDBClient()
-        await vector_client.health_check()
-        services["vector_db"] = "healthy"
-    except Exception as e:
-        logger.warning("Vector DB health check failed", error=str(e))
-        services["vector_db"] = "unhealthy"
-
-    # Check LLM provider availability
-    try:
-        # TODO: Implement LLM provider health check
-        services["llm_provider"] = "healthy"
-    except Exception as e:
-        logger.warning("LLM provider health check failed", error=str(e))
-        services["llm_provider"] = "unhealthy"
-
-    # Determine overall status
-    overall_status = (
-        "healthy"
-        if all(status == "healthy" for status in services.values())
-        else "degraded"
-    )
+    services = {
+        name: result["status"] for name, result in health_monitor.results.items()
+    }
+    overall_status = health_monitor.overall_status()
 
     return HealthResponse(
-        status=overall_status,
-        timestamp=datetime.now(timezone.UTC),
+        status="healthy" if overall_status == "healthy" else "degraded",
+        timestamp=datetime.now(timezone.utc),
         version=settings.app_version,
         services=services,
     )
 
 
+@router.get("/health/live")
+async def liveness_probe() -> Dict[str, str]:
+    """
+    Liveness probe: the process is up and the event loop is responsive.
+    """
+    return {"status": "alive"}
+
+
+@router.get("/health/startup")
+async def startup_probe(response: Response) -> Dict[str, Any]:
+    """
+    Startup probe: 503 until warm-up has finished.
+    """
+    if not readiness.started:
+        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+
+    return {
+        "status": "started" if readiness.started else "starting",
+        "steps": readiness.steps,
+    }
+
+
+@router.get("/health/ready")
+async def readiness_probe(response: Response) -> Dict[str, Any]:
+    """
+    Readiness probe: 503 while warming up, draining or with a critical
+    dependency down.
+    """
+    if readiness.draining:
+        probe_status = "draining"
+    elif not readiness.started:
+        probe_status = "starting"
+    elif not readiness.ready:
+        probe_status = "unhealthy"
+    else:
+        probe_status = "ready"
+
+    if probe_status != "ready":
+        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+
+    return {"status": probe_status, "services": health_monitor.overall_status()}
+
+
 @router.get("/health/detailed")
 async def detailed_health_check() -> Dict[str, Any]:
     """
     Detailed health check with additional system information.
     """
     try:
+        snapshot = health_monitor.snapshot()
         health_data = {
-            "status": "healthy",
-            "timestamp": datetime.now(timezone.UTC).isoformat(),
+            "status": snapshot["status"],
+            "timestamp": datetime.now(timezone.utc).isoformat(),
             "version": settings.app_version,
             "environment": settings.app_env,
-            "services": {
-                "vector_db": {"status": "unknown", "details": {}},
-                "llm_provider": {"status": "unknown", "details": {}},
+            "services": snapshot["services"],
+            "pools": snapshot["pools"],
+            "event_loop": {
+                "lag_ms": round(event_loop_monitor.last_lag * 1000, 3),
+                "max_lag_ms": round(event_loop_monitor.max_lag * 1000, 3),
             },
             "configuration": {
                 "max_vector_results": settings.max_vector_results,
@@ -87,30 +120,8 @@ async def detailed_health_check() -> Dict[str, Any]:
             },
         }
 
-        # Detailed vector DB check
-        try:
-            vector_client = VectorDBClient()
-            db_info = await vector_client.get_database_info()
-            health_data["services"]["vector_db"] = {
-                "status": "healthy",
-                "details": db_info,
-            }
-        except Exception as e:
-            health_data["services"]["vector_db"] = {
-                "status": "unhealthy",
-                "details": {"error": str(e)},
-            }
-
-        # Check if any critical services are down
-        critical_services = ["vector_db"]
-        unhealthy_critical = [
-            service
-            for service in critical_services
-            if health_data["services"][service]["status"] != "healthy"
-        ]
-
-        if unhealthy_critical:
-            health_data["status"] = "unhealthy"
+        # Critical services down
+        if snapshot["status"] == "unhealthy":
             raise HTTPException(
                 status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=health_data
             )
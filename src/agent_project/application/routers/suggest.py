@@ -0,0 +1,36 @@
+"""
+Query autocomplete endpoint.
+"""
+
+from typing import Any, Dict
+
+from fastapi import APIRouter, Depends, Query
+from pydantic import BaseModel
+
+from agent_project.core.tools.autocomplete import autocomplete
+from agent_project.infrastructure.auth.dependencies import get_current_user
+
+router = APIRouter()
+
+
+class SuggestResponse(BaseModel):
+    """Autocomplete response model."""
+
+    query: str
+    suggestions: list[str]
+
+
+@router.get("/suggest", response_model=SuggestResponse)
+async def suggest(
+    q: str = Query(..., max_length=200, description="Partial query"),
+    limit: int = Query(8, ge=1, le=20),
+    current_user: Dict[str, Any] = Depends(get_current_user),
+) -> SuggestResponse:
+    """
+    Suggest completions for a partially typed query.
+
+    Completions come from clause titles and questions other users asked
+    frequently, ranked by popularity. Returns no suggestions until the
+    index has been built during warm-up.
+    """
+    return SuggestResponse(query=q, suggestions=autocomplete.suggest(q, limit))
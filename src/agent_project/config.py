@@ -23,6 +23,9 @@ class Settings(BaseSettings):
     app_version: str = "0.1.0"
     app_env: str = Field(default="development", alias="APP_ENV")
     log_level: str = Field(default="INFO", alias="LOG_LEVEL")
+    log_queue_enabled: bool = Field(default=False, alias="LOG_QUEUE_ENABLED")
+    log_queue_size: int = Field(default=10000, alias="LOG_QUEUE_SIZE")
+    log_info_sample_rate: float = Field(default=1.0, alias="LOG_INFO_SAMPLE_RATE")
     api_version: str = Field(default="v1", alias="API_VERSION")
 
     # Server
@@ -37,21 +40,106 @@ class Settings(BaseSettings):
 
     # Database
     database_url: Optional[str] = Field(default=None, alias="DATABASE_URL")
+    database_replica_url: Optional[str] = Field(
+        default=None, alias="DATABASE_REPLICA_URL"
+    )
+    database_direct_url: Optional[str] = Field(
+        default=None, alias="DATABASE_DIRECT_URL"
+    )
+    # session or transaction: pooling mode of the pooler DATABASE_URL points at
+    database_pooler_mode: str = Field(default="session", alias="DATABASE_POOLER_MODE")
+    database_replica_max_lag_seconds: float = Field(
+        default=5.0, alias="DATABASE_REPLICA_MAX_LAG_SECONDS"
+    )
     vector_similarity_threshold: float = Field(
         default=0.8, alias="VECTOR_SIMILARITY_THRESHOLD"
     )
     max_vector_results: int = Field(default=10, alias="MAX_VECTOR_RESULTS")
+    embedding_model: str = Field(
+        default="text-embedding-3-small", alias="EMBEDDING_MODEL"
+    )
+    embedding_dimensions: int = Field(default=1536, alias="EMBEDDING_DIMENSIONS")
+    embedding_artifact_path: Optional[str] = Field(
+        default=None, alias="EMBEDDING_ARTIFACT_PATH"
+    )
+    local_vector_index_enabled: bool = Field(
+        default=False, alias="LOCAL_VECTOR_INDEX_ENABLED"
+    )
+    local_vector_index_nprobe: int = Field(default=8, alias="LOCAL_VECTOR_INDEX_NPROBE")
+    local_vector_index_reload_interval_seconds: float = Field(
+        default=60.0, alias="LOCAL_VECTOR_INDEX_RELOAD_INTERVAL_SECONDS"
+    )
+    section_index_enabled: bool = Field(default=True, alias="SECTION_INDEX_ENABLED")
+    section_index_reload_interval_seconds: float = Field(
+        default=300.0, alias="SECTION_INDEX_RELOAD_INTERVAL_SECONDS"
+    )
+    autocomplete_enabled: bool = Field(default=True, alias="AUTOCOMPLETE_ENABLED")
+    autocomplete_refresh_interval_seconds: float = Field(
+        default=300.0, alias="AUTOCOMPLETE_REFRESH_INTERVAL_SECONDS"
+    )
+    autocomplete_popular_queries: int = Field(
+        default=1000, alias="AUTOCOMPLETE_POPULAR_QUERIES"
+    )
+    autocomplete_min_query_users: int = Field(
+        default=3, alias="AUTOCOMPLETE_MIN_QUERY_USERS"
+    )
+    retrieval_confidence_gate_enabled: bool = Field(
+        default=True, alias="RETRIEVAL_CONFIDENCE_GATE_ENABLED"
+    )
+    retrieval_min_confidence: float = Field(
+        default=0.0, alias="RETRIEVAL_MIN_CONFIDENCE"
+    )
+    retrieval_confidence_path: Optional[str] = Field(
+        default=None, alias="RETRIEVAL_CONFIDENCE_PATH"
+    )
+    vector_search_direct_sql: bool = Field(
+        default=False, alias="VECTOR_SEARCH_DIRECT_SQL"
+    )
+    vector_hnsw_ef_search: int = Field(default=64, alias="VECTOR_HNSW_EF_SEARCH")
+    vector_ivfflat_probes: int = Field(default=10, alias="VECTOR_IVFFLAT_PROBES")
+    # none, halfvec or binary: representation the ANN indexes search before
+    # rescoring candidates at full precision
+    vector_quantization: str = Field(default="none", alias="VECTOR_QUANTIZATION")
+    vector_rescore_factor: int = Field(default=4, alias="VECTOR_RESCORE_FACTOR")
+    vector_result_cache_ttl_seconds: float = Field(
+        default=300.0, alias="VECTOR_RESULT_CACHE_TTL_SECONDS"
+    )
+    vector_result_cache_max_entries: int = Field(
+        default=2048, alias="VECTOR_RESULT_CACHE_MAX_ENTRIES"
+    )
+    corpus_version_check_interval_seconds: float = Field(
+        default=30.0, alias="CORPUS_VERSION_CHECK_INTERVAL_SECONDS"
+    )
+    vector_search_tuning_path: Optional[str] = Field(
+        default=None, alias="VECTOR_SEARCH_TUNING_PATH"
+    )
+    vector_hnsw_m: int = Field(default=16, alias="VECTOR_HNSW_M")
+    vector_hnsw_ef_construction: int = Field(
+        default=64, alias="VECTOR_HNSW_EF_CONSTRUCTION"
+    )
+    vector_index_maintenance_work_mem: str = Field(
+        default="512MB", alias="VECTOR_INDEX_MAINTENANCE_WORK_MEM"
+    )
 
     # LLM Providers
     openai_api_key: Optional[str] = Field(default=None, alias="OPENAI_API_KEY")
     anthropic_api_key: Optional[str] = Field(default=None, alias="ANTHROPIC_API_KEY")
     default_llm_provider: str = Field(default="openai", alias="DEFAULT_LLM_PROVIDER")
     default_model: str = Field(default="gpt-4-turbo-preview", alias="DEFAULT_MODEL")
+    openai_base_url: Optional[str] = Field(default=None, alias="OPENAI_BASE_URL")
+    anthropic_base_url: Optional[str] = Field(default=None, alias="ANTHROPIC_BASE_URL")
 
     # Agent Configuration
     max_agent_iterations: int = Field(default=5, alias="MAX_AGENT_ITERATIONS")
     agent_timeout_seconds: int = Field(default=30, alias="AGENT_TIMEOUT_SECONDS")
     enable_parallel_agents: bool = Field(default=True, alias="ENABLE_PARALLEL_AGENTS")
+    context_assembly_enabled: bool = Field(
+        default=True, alias="CONTEXT_ASSEMBLY_ENABLED"
+    )
+    # 0 = budget for the model in use
+    context_token_budget: int = Field(default=0, alias="CONTEXT_TOKEN_BUDGET")
+    # Relevance vs. novelty when selecting chunks (1.0 = relevance only)
+    context_mmr_lambda: float = Field(default=0.7, alias="CONTEXT_MMR_LAMBDA")
 
     # Session Memory Configuration
     session_expiry_hours: int = Field(default=24, alias="SESSION_EXPIRY_HOURS")
@@ -72,13 +160,59 @@ class Settings(BaseSettings):
     
     # JWT Cache Configuration
     jwks_cache_ttl_seconds: int = Field(default=3600, alias="JWKS_CACHE_TTL_SECONDS")  # 1 hour
+    jwks_refresh_margin_seconds: int = Field(
+        default=300, alias="JWKS_REFRESH_MARGIN_SECONDS"
+    )
+    jwks_min_refetch_interval_seconds: int = Field(
+        default=30, alias="JWKS_MIN_REFETCH_INTERVAL_SECONDS"
+    )
     jwt_validation_timeout_seconds: int = Field(default=10, alias="JWT_VALIDATION_TIMEOUT_SECONDS")
+    jwt_verification_cache_ttl_seconds: int = Field(
+        default=300, alias="JWT_VERIFICATION_CACHE_TTL_SECONDS"
+    )
+    jwt_verification_cache_max_entries: int = Field(
+        default=10000, alias="JWT_VERIFICATION_CACHE_MAX_ENTRIES"
+    )
 
     # Observability
     enable_metrics: bool = Field(default=True, alias="ENABLE_METRICS")
     enable_tracing: bool = Field(default=False, alias="ENABLE_TRACING")
+    tracing_exporter: str = Field(default="otlp", alias="TRACING_EXPORTER")
+    otlp_endpoint: Optional[str] = Field(default=None, alias="OTLP_ENDPOINT")
+    tracing_file_path: str = Field(default="traces.jsonl", alias="TRACING_FILE_PATH")
+    tracing_sample_ratio: float = Field(default=1.0, alias="TRACING_SAMPLE_RATIO")
+    loop_monitor_enabled: bool = Field(default=True, alias="LOOP_MONITOR_ENABLED")
+    loop_monitor_interval_seconds: float = Field(
+        default=0.25, alias="LOOP_MONITOR_INTERVAL_SECONDS"
+    )
+    loop_block_debug: bool = Field(default=False, alias="LOOP_BLOCK_DEBUG")
+    loop_block_threshold_seconds: float = Field(
+        default=0.1, alias="LOOP_BLOCK_THRESHOLD_SECONDS"
+    )
+    continuous_profiling_enabled: bool = Field(
+        default=False, alias="CONTINUOUS_PROFILING_ENABLED"
+    )
+    continuous_profiling_interval_seconds: float = Field(
+        default=0.1, alias="CONTINUOUS_PROFILING_INTERVAL_SECONDS"
+    )
+    continuous_profiling_window_seconds: float = Field(
+        default=60.0, alias="CONTINUOUS_PROFILING_WINDOW_SECONDS"
+    )
     prometheus_port: int = Field(default=9090, alias="PROMETHEUS_PORT")
 
+    # Health checks
+    health_check_interval_seconds: float = Field(
+        default=15.0, alias="HEALTH_CHECK_INTERVAL_SECONDS"
+    )
+    health_check_timeout_seconds: float = Field(
+        default=5.0, alias="HEALTH_CHECK_TIMEOUT_SECONDS"
+    )
+    health_llm_check_interval_seconds: float = Field(
+        default=60.0, alias="HEALTH_LLM_CHECK_INTERVAL_SECONDS"
+    )
+    warmup_timeout_seconds: float = Field(default=30.0, alias="WARMUP_TIMEOUT_SECONDS")
+    warmup_prime_caches: bool = Field(default=False, alias="WARMUP_PRIME_CACHES")
+
     # Pydantic v2 settings are configured via model_config above
 
 
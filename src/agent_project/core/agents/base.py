@@ -3,15 +3,35 @@ Base agent class for all AI agents in the system.
 """
 
 import inspect
+import re
 from abc import ABC, abstractmethod
 from typing import Any, AsyncGenerator, Dict
 
 import structlog
 
+from agent_project.config import settings
+from agent_project.core.tools.confidence_gate import (
+    ANSWERED,
+    RetrievalFailed,
+    check_confidence,
+    top_score,
+)
+from agent_project.core.tools.context_assembler import (
+    assemble_context,
+    format_document,
+    load_token_counter,
+)
+from agent_project.core.utils.timing import timed
+from agent_project.core.utils.tracing import annotate_span, traced
 from agent_project.infrastructure.llm.client import LLMClient
 
 logger = structlog.get_logger()
 
+# Specialist system messages end with: reply “I don’t know.” Then add: <link line>
+FALLBACK_PATTERN = re.compile(
+    r"reply [“\"](?P<answer>.+?)[”\"]\s*Then add:\s*\n(?P<reference>.+)"
+)
+
 
 class BaseAgent(ABC):
     """
@@ -58,6 +78,7 @@ class BaseAgent(ABC):
         result = await self.process_query(query, session_id, user_id, **kwargs)
         yield result["response"]
 
+    @traced("agent.retrieve_context")
     async def retrieve_context(
         self,
         query: str,
@@ -75,24 +96,25 @@ class BaseAgent(ABC):
             similarity_threshold: Minimum similarity score
 
         Returns:
-            List of relevant documents with metadata
+            List of relevant documents with metadata, or an empty
+            ``RetrievalFailed`` list if the search failed
         """
         try:
             # Lazy import and initialize the vector DB client if not provided/mocked
             if self.vector_client is None:
                 try:
                     from agent_project.infrastructure.vector_db.client import (
-                        VectorDBClient,  # type: ignore
+                        get_vector_client,  # type: ignore
                     )
 
-                    self.vector_client = VectorDBClient()
+                    self.vector_client = get_vector_client()
                 except Exception as e:
                     logger.error(
                         "Failed to initialize vector client",
                         agent_type=self.agent_type,
                         error=str(e),
                     )
-                    return []
+                    return RetrievalFailed()
             # Default clause type to this agent's type if not provided
             effective_clause_type = clause_type or self.agent_type
 
@@ -113,6 +135,11 @@ class BaseAgent(ABC):
                 results_count=len(results),
                 query=query[:100],
             )
+            annotate_span(
+                agent_type=self.agent_type,
+                clause_type=effective_clause_type,
+                results_count=len(results),
+            )
 
             return results
 
@@ -120,8 +147,9 @@ class BaseAgent(ABC):
             logger.error(
                 "Context retrieval failed", agent_type=self.agent_type, error=str(e)
             )
-            return []
+            return RetrievalFailed()
 
+    @traced("agent.generate_response")
     async def generate_response(
         self,
         prompt: str,
@@ -132,6 +160,12 @@ class BaseAgent(ABC):
         """
         Generate a response using the LLM.
 
+        When retrieved context is passed but is empty or not confident enough
+        for this agent's clause type, the LLM is skipped and the agent's
+        fallback response returned instead. Otherwise the context is
+        deduplicated and trimmed to the model's token budget (see
+        ``context_assembler``).
+
         Args:
             prompt: User prompt or question
             context: Retrieved context documents
@@ -141,17 +175,27 @@ class BaseAgent(ABC):
         Returns:
             Generated response text
         """
+        if context is not None:
+            outcome = check_confidence(context, self.agent_type)
+            if outcome != ANSWERED:
+                logger.info(
+                    "Skipping generation for unconfident retrieval",
+                    agent_type=self.agent_type,
+                    outcome=outcome,
+                    top_score=top_score(context),
+                )
+                annotate_span(agent_type=self.agent_type, confidence_gate=outcome)
+                return self.get_fallback_response()
+
         try:
             # Build context string if provided
             context_str = ""
+            if context and settings.context_assembly_enabled:
+                model = llm_kwargs.get("model") or self.llm_client.default_model
+                await load_token_counter(model)
+                context = assemble_context(context, model)
             if context:
-                context_str = "\n\n".join(
-                    [
-                        f"Source: {doc.get('metadata', {}).get('source', 'Unknown')}\n"
-                        f"Content: {doc.get('content', '')}"
-                        for doc in context
-                    ]
-                )
+                context_str = "\n\n".join(format_document(doc) for doc in context)
 
             # Create full prompt with context
             full_prompt = prompt
@@ -160,15 +204,21 @@ class BaseAgent(ABC):
                     f"Context:\n{context_str}\n\nQuestion: {prompt}\n\nAnswer:"
                 )
 
-            response = await self.llm_client.generate(
-                prompt=full_prompt, system_message=system_message, **llm_kwargs
-            )
+            with timed("generation"):
+                response = await self.llm_client.generate(
+                    prompt=full_prompt, system_message=system_message, **llm_kwargs
+                )
 
             logger.debug(
                 "Generated response",
                 agent_type=self.agent_type,
                 response_length=len(response),
             )
+            annotate_span(
+                agent_type=self.agent_type,
+                context_documents=len(context or []),
+                prompt_length=len(full_prompt),
+            )
 
             return response
 
@@ -178,6 +228,18 @@ class BaseAgent(ABC):
             )
             return "I encountered an error generating a response. Please try again."
 
+    def get_fallback_response(self) -> str:
+        """
+        Answer used when retrieval finds nothing relevant.
+
+        Taken from the "I don't know" instruction in the system message, so
+        it matches what the LLM would have replied.
+        """
+        match = FALLBACK_PATTERN.search(self.get_system_message())
+        if match is None:
+            return "I don’t know."
+        return f"{match.group('answer')}\n\n{match.group('reference').strip()}"
+
     def get_system_message(self) -> str:
         """
         Get the system message for this agent type.
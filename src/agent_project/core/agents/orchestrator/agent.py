@@ -10,6 +10,11 @@ from pydantic import BaseModel
 
 from agent_project.core.agents.base import BaseAgent
 from agent_project.core.tools.intent_classifier import IntentClassifier
+from agent_project.core.utils.tracing import annotate_span, traced
+from agent_project.infrastructure.vector_db.section_index import (
+    match_clause_reference,
+    section_index,
+)
 
 logger = structlog.get_logger()
 
@@ -44,13 +49,23 @@ class OrchestratorAgent(BaseAgent):
         """Build the LangGraph state graph for orchestration."""
         graph = StateGraph(OrchestratorState)
 
-        # Add nodes
-        graph.add_node("classify_intent", self._classify_intent)
-        graph.add_node("route_to_specialist", self._route_to_specialist)
-        graph.add_node("handle_general_query", self._handle_general_query)
+        # Add nodes, each traced as its own span
+        nodes = {
+            "lookup_clause": self._lookup_clause,
+            "classify_intent": self._classify_intent,
+            "route_to_specialist": self._route_to_specialist,
+            "handle_general_query": self._handle_general_query,
+        }
+        for name, node in nodes.items():
+            graph.add_node(name, traced(f"orchestrator.{name}")(node))
 
         # Add edges
-        graph.set_entry_point("classify_intent")
+        graph.set_entry_point("lookup_clause")
+        graph.add_conditional_edges(
+            "lookup_clause",
+            lambda state: "found" if state.response else "search",
+            {"found": END, "search": "classify_intent"},
+        )
         graph.add_conditional_edges(
             "classify_intent",
             self._should_route_to_specialist,
@@ -61,6 +76,44 @@ class OrchestratorAgent(BaseAgent):
 
         return graph.compile()
 
+    async def _lookup_clause(self, state: OrchestratorState) -> Dict[str, Any]:
+        """Answer "show me B1.3.2"-style queries straight from the section index."""
+        reference = match_clause_reference(state.query)
+        if reference is None or section_index.index is None:
+            return {}
+
+        try:
+            clauses = await section_index.lookup(reference)
+        except Exception as e:
+            logger.warning("Clause lookup failed", section=reference, error=str(e))
+            return {}
+
+        if not clauses:
+            return {}
+
+        logger.info("Answered from section index", section=reference)
+        annotate_span(clause_lookup=reference)
+
+        return {
+            "response": self._format_clauses(reference, clauses),
+            "sources": clauses,
+            "specialist_agent": "clause_lookup",
+        }
+
+    @staticmethod
+    def _format_clauses(reference: str, clauses: list) -> str:
+        """Render looked-up clauses with their section and page."""
+        parts = []
+        for clause in clauses:
+            location = clause.get("source") or clause.get("document_id") or ""
+            if clause.get("page_number"):
+                location = f"{location}, page {clause['page_number']}".lstrip(", ")
+            heading = f"**{clause.get('section') or reference}**"
+            if location:
+                heading = f"{heading} ({location})"
+            parts.append(f"{heading}\n\n{clause.get('content', '')}")
+        return "\n\n".join(parts)
+
     async def _classify_intent(self, state: OrchestratorState) -> Dict[str, Any]:
         """Classify the intent of the user query."""
         try:
@@ -74,6 +127,7 @@ class OrchestratorAgent(BaseAgent):
             )
 
             logger.info("Intent classified", intent=intent)
+            annotate_span(intent=intent)
 
             return {"intent": intent}
 
@@ -123,6 +177,7 @@ class OrchestratorAgent(BaseAgent):
             logger.info(
                 "Routing to specialist", specialist=specialist, intent=state.intent
             )
+            annotate_span(specialist=specialist)
 
             # Import and instantiate the specialist agent
             specialist_agent = await self._get_specialist_agent(specialist)
@@ -151,9 +206,11 @@ class OrchestratorAgent(BaseAgent):
             vector_client = getattr(self, "vector_client", None)
             if vector_client is None:
                 # Lazy import to avoid optional dependency during initial import
-                from agent_project.infrastructure.vector_db.client import VectorDBClient
+                from agent_project.infrastructure.vector_db.client import (
+                    get_vector_client,
+                )
 
-                vector_client = VectorDBClient()
+                vector_client = get_vector_client()
 
             call_result = vector_client.similarity_search(
                 query=state.query, limit=5, similarity_threshold=0.7
@@ -230,6 +287,7 @@ class OrchestratorAgent(BaseAgent):
 
         return f"Based on the available information, here's what I found regarding your query about building codes: {context[0].get('content', '')[:200]}..."
 
+    @traced("orchestrator.process_query")
     async def process_query(
         self, query: str, session_id: str, user_id: str
     ) -> Dict[str, Any]:
@@ -0,0 +1,254 @@
+"""
+Query autocomplete over clause titles and popular past queries.
+
+Suggestions live in a sorted array of normalised keys, one per word start of
+each suggestion, so "handr" completes both "Handrail height for stairs" and
+"D1.3.3 Handrails". A lookup is a binary search plus a scan of the matching
+range; prefixes whose ranges are long have their top suggestions
+precomputed when the index is built.
+"""
+
+import asyncio
+import heapq
+import re
+from bisect import bisect_left
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+import structlog
+
+from agent_project.config import settings
+
+logger = structlog.get_logger()
+
+# Prefixes matching more keys than this get their top suggestions
+# precomputed; lookups of any other prefix scan at most this many keys
+HEAVY_PREFIX_KEYS = 256
+
+# Precomputed suggestions kept per heavy prefix (the endpoint's maximum limit)
+PRECOMPUTED_LIMIT = 20
+
+# Suggestions matching from their first word rank above mid-text matches
+LEADING_MATCH_BONUS = 2.0
+
+# Clause titles rank like a query asked by this many users
+TITLE_WEIGHT = 2.0
+
+MAX_QUERY_LENGTH = 200
+
+
+def normalize_query(text: str) -> str:
+    """Lowercase and collapse whitespace and punctuation between words."""
+    return " ".join(re.findall(r"[a-z0-9./]+", text.lower()))
+
+
+class SuggestIndex:
+    """Immutable prefix index of weighted suggestions."""
+
+    def __init__(self, suggestions: Dict[str, float]):
+        # (key, suggestion id, key score) sorted by key; ids index _texts
+        entries: List[Tuple[str, int, float]] = []
+        self._texts: List[str] = []
+
+        for text, score in suggestions.items():
+            words = normalize_query(text).split(" ")
+            if not words[0]:
+                continue
+            suggestion_id = len(self._texts)
+            self._texts.append(text)
+
+            entries.append(
+                (" ".join(words), suggestion_id, score * LEADING_MATCH_BONUS)
+            )
+            for i in range(1, len(words)):
+                entries.append((" ".join(words[i:]), suggestion_id, score))
+
+        entries.sort()
+        self._keys = [key for key, _, _ in entries]
+        self._ids = [suggestion_id for _, suggestion_id, _ in entries]
+        self._key_scores = [score for _, _, score in entries]
+
+        self._precomputed: Dict[str, List[Tuple[float, int]]] = {}
+        self._precompute(0, len(self._keys), 0)
+
+    def __len__(self) -> int:
+        return len(self._texts)
+
+    def _top(
+        self, candidates: Iterable[Tuple[float, int]], limit: int
+    ) -> List[Tuple[float, int]]:
+        """Best (score, id) pairs, one per suggestion, shortest text on ties."""
+        best: Dict[int, float] = {}
+        for score, sid in candidates:
+            if score > best.get(sid, 0.0):
+                best[sid] = score
+        return heapq.nsmallest(
+            limit,
+            ((score, sid) for sid, score in best.items()),
+            key=lambda item: (-item[0], len(self._texts[item[1]])),
+        )
+
+    def _scan(self, lo: int, hi: int, limit: int) -> List[Tuple[float, int]]:
+        return self._top(
+            ((self._key_scores[i], self._ids[i]) for i in range(lo, hi)), limit
+        )
+
+    def _precompute(self, lo: int, hi: int, depth: int) -> List[Tuple[float, int]]:
+        """
+        Top suggestions of ``keys[lo:hi]``, which share their first ``depth``
+        characters, storing those of every heavy prefix on the way.
+
+        Heavy ranges are split by their next character and merged from the
+        children's results, so each key is scanned only once.
+        """
+        if hi - lo <= HEAVY_PREFIX_KEYS:
+            return self._scan(lo, hi, PRECOMPUTED_LIMIT)
+
+        # Keys equal to the prefix sort first
+        i = lo
+        while i < hi and len(self._keys[i]) == depth:
+            i += 1
+        candidates = self._scan(lo, i, PRECOMPUTED_LIMIT)
+
+        while i < hi:
+            prefix = self._keys[i][: depth + 1]
+            following = prefix[:-1] + chr(ord(prefix[-1]) + 1)
+            j = bisect_left(self._keys, following, i, hi)
+            candidates.extend(self._precompute(i, j, depth + 1))
+            i = j
+
+        top = self._top(candidates, PRECOMPUTED_LIMIT)
+        if depth:
+            self._precomputed[self._keys[lo][:depth]] = top
+        return top
+
+    def suggest(self, prefix: str, limit: int = 8) -> List[str]:
+        """
+        Ranked completions for a partial query.
+
+        Args:
+            prefix: What the user has typed so far
+            limit: Maximum number of suggestions
+
+        Returns:
+            Suggestions, most popular first
+        """
+        normalized = normalize_query(prefix)
+        if not normalized:
+            return []
+
+        top = self._precomputed.get(normalized)
+        if top is None or limit > PRECOMPUTED_LIMIT:
+            lo = bisect_left(self._keys, normalized)
+            hi = lo
+            while hi < len(self._keys) and self._keys[hi].startswith(normalized):
+                hi += 1
+            top = self._scan(lo, hi, limit)
+        return [self._texts[sid] for _, sid in top[:limit]]
+
+
+class AutocompleteManager:
+    """
+    Owns the current suggest index, rebuilt periodically from clause titles,
+    popular past queries and queries asked since the last rebuild.
+    """
+
+    def __init__(self):
+        self.index: Optional[SuggestIndex] = None
+        # Normalised query -> (first wording seen, users who asked it)
+        self._recent: Dict[str, Tuple[str, Set[str]]] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    def record_query(self, query: str, user_id: str) -> None:
+        """Count a query asked on this instance towards its popularity."""
+        normalized = normalize_query(query)
+        if not normalized or len(query) > MAX_QUERY_LENGTH:
+            return
+        if normalized not in self._recent:
+            if len(self._recent) >= settings.autocomplete_popular_queries:
+                return
+            self._recent[normalized] = (query.strip(), set())
+
+        users = self._recent[normalized][1]
+        # Users beyond the threshold add nothing
+        if len(users) < settings.autocomplete_min_query_users:
+            users.add(user_id)
+
+    async def _popular_queries(self) -> Iterable[Tuple[str, int]]:
+        if not settings.database_url:
+            return []
+
+        from agent_project.infrastructure.vector_db.session_memory import (
+            SessionMemoryClient,
+        )
+
+        client = SessionMemoryClient()
+        try:
+            return await client.get_popular_queries(
+                settings.autocomplete_popular_queries,
+                settings.autocomplete_min_query_users,
+                MAX_QUERY_LENGTH,
+            )
+        finally:
+            await client.close()
+
+    async def rebuild(self) -> None:
+        """Build a new index from current titles and query counts."""
+        from agent_project.infrastructure.vector_db.section_index import section_index
+
+        suggestions: Dict[str, float] = {}
+        if section_index.index is not None:
+            for title in section_index.index.titles().values():
+                suggestions[title] = TITLE_WEIGHT
+
+        counts: Dict[str, Tuple[str, float]] = {}
+        for query, users in await self._popular_queries():
+            counts[normalize_query(query)] = (query, float(users))
+        for normalized, (query, users) in self._recent.items():
+            if len(users) >= settings.autocomplete_min_query_users:
+                stored = counts.get(normalized, (query, 0.0))[1]
+                counts[normalized] = (query, max(stored, float(len(users))))
+        for query, score in counts.values():
+            suggestions[query] = max(suggestions.get(query, 0.0), score)
+
+        if len(self._recent) >= settings.autocomplete_popular_queries:
+            # Make room for new queries by forgetting ones that stayed rare
+            self._recent = {
+                normalized: entry
+                for normalized, entry in self._recent.items()
+                if len(entry[1]) >= settings.autocomplete_min_query_users
+            }
+
+        self.index = await asyncio.to_thread(SuggestIndex, suggestions)
+        logger.info("Autocomplete index built", suggestions=len(self.index))
+
+    async def start(self) -> None:
+        """Build the index, then rebuild it periodically."""
+        # Schedule rebuilds first so a failed initial build is retried
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._refresh())
+        await self.rebuild()
+
+    async def _refresh(self) -> None:
+        while True:
+            await asyncio.sleep(settings.autocomplete_refresh_interval_seconds)
+            try:
+                await self.rebuild()
+            except Exception as e:
+                logger.error("Autocomplete index rebuild failed", error=str(e))
+
+    def suggest(self, prefix: str, limit: int = 8) -> List[str]:
+        """Ranked completions, empty until the index is built."""
+        if self.index is None:
+            return []
+        return self.index.suggest(prefix, limit)
+
+    async def stop(self) -> None:
+        """Stop periodic rebuilds."""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+
+# Global autocomplete manager instance
+autocomplete = AutocompleteManager()
@@ -0,0 +1,125 @@
+"""
+Retrieval confidence gating.
+
+Specialists are instructed to answer "I don't know" when the vectorstore has
+nothing relevant. When retrieval returns no context, or only chunks scoring
+below the clause type's calibrated threshold, that answer is known before
+the LLM is called, so the call is skipped. A failed search is returned as
+an empty ``RetrievalFailed`` list so outages are counted as
+``retrieval_error`` rather than ``no_context``.
+
+tools/calibrate_confidence.py measures top retrieval scores of answerable
+and out-of-scope questions and saves a threshold per clause type to
+``RETRIEVAL_CONFIDENCE_PATH``. Clause types without a calibrated entry use
+``RETRIEVAL_MIN_CONFIDENCE``.
+
+File format::
+
+    {
+        "target_recall": 0.98,
+        "calibrated_at": "...",
+        "clause_types": {
+            "code_b": {"min_score": 0.83, "answerable_kept": 0.98, "gated": 0.71}
+        }
+    }
+"""
+
+import json
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import structlog
+
+from agent_project.config import settings
+from agent_project.core.utils.metrics import RETRIEVAL_CONFIDENCE_GATE
+
+logger = structlog.get_logger()
+
+ANSWERED = "answered"
+NO_CONTEXT = "no_context"
+LOW_CONFIDENCE = "low_confidence"
+RETRIEVAL_ERROR = "retrieval_error"
+
+_thresholds: Optional[Dict[str, Any]] = None
+_thresholds_path: Optional[str] = None
+
+
+class RetrievalFailed(list):
+    """Empty context returned when the vector search itself failed."""
+
+
+def load_confidence_thresholds(path: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Load calibrated thresholds, replacing any previously loaded ones.
+
+    Args:
+        path: Calibration file (defaults to ``RETRIEVAL_CONFIDENCE_PATH``)
+
+    Returns:
+        The calibration document, empty if no file is configured or readable
+    """
+    global _thresholds, _thresholds_path
+
+    path = path or settings.retrieval_confidence_path
+    thresholds: Dict[str, Any] = {}
+    if path:
+        try:
+            thresholds = json.loads(Path(path).read_text())
+            logger.info(
+                "Loaded retrieval confidence thresholds",
+                path=path,
+                clause_types=len(thresholds.get("clause_types", {})),
+            )
+        except (OSError, ValueError) as e:
+            logger.warning(
+                "Could not load retrieval confidence thresholds",
+                path=path,
+                error=str(e),
+            )
+
+    _thresholds, _thresholds_path = thresholds, path
+    return thresholds
+
+
+def get_confidence_threshold(clause_type: Optional[str]) -> float:
+    """Minimum top similarity score for a clause type's context."""
+    if _thresholds is None or _thresholds_path != settings.retrieval_confidence_path:
+        load_confidence_thresholds()
+
+    calibrated = _thresholds.get("clause_types", {}).get(clause_type or "", {})
+    return float(calibrated.get("min_score", settings.retrieval_min_confidence))
+
+
+def top_score(context: List[Dict[str, Any]]) -> float:
+    """Highest similarity score among retrieved documents."""
+    return max(
+        (doc.get("similarity_score", doc.get("similarity")) or 0.0 for doc in context),
+        default=0.0,
+    )
+
+
+def check_confidence(context: List[Dict[str, Any]], clause_type: str) -> str:
+    """
+    Decide whether retrieved context is good enough to answer from.
+
+    Args:
+        context: Retrieved documents
+        clause_type: Clause type the context was retrieved for
+
+    Returns:
+        ANSWERED, RETRIEVAL_ERROR, NO_CONTEXT or LOW_CONFIDENCE; also
+        counted in ``retrieval_confidence_gate_total``
+    """
+    if not settings.retrieval_confidence_gate_enabled:
+        outcome = ANSWERED
+    elif isinstance(context, RetrievalFailed):
+        outcome = RETRIEVAL_ERROR
+    elif not context:
+        outcome = NO_CONTEXT
+    elif top_score(context) < get_confidence_threshold(clause_type):
+        outcome = LOW_CONFIDENCE
+    else:
+        outcome = ANSWERED
+
+    RETRIEVAL_CONFIDENCE_GATE.labels(clause_type, outcome).inc()
+    return outcome
@@ -0,0 +1,245 @@
+"""
+Token-budgeted context assembly for specialist prompts.
+
+Retrieved chunks often overlap (neighbouring chunks of the same section,
+the same clause indexed from two sources), and every token of context adds
+LLM latency and cost. Before prompting, retrieved documents are:
+
+1. deduplicated, keeping the best-scoring chunk per document section and
+   dropping chunks whose text is already present;
+2. selected by maximal marginal relevance (MMR), trading similarity score
+   against word overlap with chunks already chosen, until the model's
+   context token budget is used;
+3. ordered with the strongest chunks at the start and end of the context,
+   where models attend to them best.
+
+Tokens are counted with tiktoken when it is installed, falling back to an
+estimate of four characters per token otherwise. Loading an encoding can
+download its BPE file, so counters are built off the event loop
+(``load_token_counter``), and the default model's during warm-up.
+"""
+
+import asyncio
+import re
+from typing import Any, Dict, FrozenSet, List, Optional
+
+import structlog
+
+from agent_project.config import settings
+
+logger = structlog.get_logger()
+
+# Context budgets by model name prefix, checked longest prefix first
+CONTEXT_TOKEN_BUDGETS = {
+    "gpt-3.5": 2000,
+    "gpt-4": 2500,
+    "gpt-4-turbo": 4000,
+    "gpt-4o": 4000,
+    "claude": 4000,
+}
+DEFAULT_CONTEXT_TOKEN_BUDGET = 3000
+
+# Fallback estimate when tiktoken is unavailable
+CHARS_PER_TOKEN = 4
+
+# Don't keep a truncated chunk shorter than this
+MIN_CHUNK_TOKENS = 50
+
+WORD = re.compile(r"\w+")
+
+# Token counters by model, and loads in progress
+_counters: Dict[str, "TokenCounter"] = {}
+_loading: Dict[str, "asyncio.Future[TokenCounter]"] = {}
+
+# Set once tiktoken fails to load so other models don't retry the download
+_tiktoken_unavailable = False
+
+
+class TokenCounter:
+    """Token counting and truncation for one model."""
+
+    def __init__(self, model: str):
+        global _tiktoken_unavailable
+
+        self.encoding = None
+        if _tiktoken_unavailable:
+            return
+        try:
+            import tiktoken
+
+            try:
+                self.encoding = tiktoken.encoding_for_model(model)
+            except KeyError:
+                self.encoding = tiktoken.get_encoding("cl100k_base")
+        except Exception as e:
+            _tiktoken_unavailable = True
+            logger.warning(
+                "Tokenizer unavailable, estimating token counts",
+                model=model,
+                error=str(e),
+            )
+
+    def count(self, text: str) -> int:
+        if self.encoding is None:
+            return -(-len(text) // CHARS_PER_TOKEN)
+        return len(self.encoding.encode(text, disallowed_special=()))
+
+    def truncate(self, text: str, max_tokens: int) -> str:
+        if self.encoding is None:
+            return text[: max_tokens * CHARS_PER_TOKEN]
+        tokens = self.encoding.encode(text, disallowed_special=())
+        return self.encoding.decode(tokens[:max_tokens])
+
+
+def get_token_counter(model: str) -> TokenCounter:
+    """Shared token counter for a model, built in this thread if needed."""
+    if model not in _counters:
+        _counters[model] = TokenCounter(model)
+    return _counters[model]
+
+
+async def load_token_counter(model: str) -> TokenCounter:
+    """Shared token counter for a model, built in a worker thread if needed."""
+    if model not in _counters:
+        if model not in _loading:
+            _loading[model] = asyncio.ensure_future(
+                asyncio.to_thread(TokenCounter, model)
+            )
+        # Shielded: a cancelled request doesn't abandon a shared load
+        _counters[model] = await asyncio.shield(_loading[model])
+        _loading.pop(model, None)
+    return _counters[model]
+
+
+def get_context_budget(model: str) -> int:
+    """Context token budget for a model (``CONTEXT_TOKEN_BUDGET`` overrides)."""
+    if settings.context_token_budget:
+        return settings.context_token_budget
+    for prefix in sorted(CONTEXT_TOKEN_BUDGETS, key=len, reverse=True):
+        if model.startswith(prefix):
+            return CONTEXT_TOKEN_BUDGETS[prefix]
+    return DEFAULT_CONTEXT_TOKEN_BUDGET
+
+
+def format_document(doc: Dict[str, Any]) -> str:
+    """Prompt block for one retrieved document."""
+    return (
+        f"Source: {doc.get('metadata', {}).get('source', 'Unknown')}\n"
+        f"Content: {doc.get('content', '')}"
+    )
+
+
+def _score(doc: Dict[str, Any]) -> float:
+    return doc.get("similarity_score", doc.get("similarity")) or 0.0
+
+
+def _words(text: str) -> FrozenSet[str]:
+    return frozenset(WORD.findall(text.lower()))
+
+
+def _overlap(a: FrozenSet[str], b: FrozenSet[str]) -> float:
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+def dedupe(context: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Drop duplicate chunks, best score first.
+
+    Chunks of the same document section are duplicates, as are chunks whose
+    normalized text is contained in an already kept chunk.
+    """
+    kept: List[Dict[str, Any]] = []
+    seen_sections = set()
+    kept_texts: List[str] = []
+
+    for doc in sorted(context, key=_score, reverse=True):
+        metadata = doc.get("metadata", {})
+        if metadata.get("document_id") and metadata.get("section"):
+            key = (metadata["document_id"], metadata["section"])
+            if key in seen_sections:
+                continue
+            seen_sections.add(key)
+
+        text = " ".join(WORD.findall(doc.get("content", "").lower()))
+        if not text or any(text in other for other in kept_texts):
+            continue
+        kept_texts.append(text)
+        kept.append(doc)
+
+    return kept
+
+
+def assemble_context(
+    context: List[Dict[str, Any]],
+    model: str,
+    budget: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Choose and order the retrieved documents to put in the prompt.
+
+    Args:
+        context: Retrieved documents with ``similarity_score``
+        model: Model the prompt is for, which sets tokenizer and budget
+        budget: Context token budget (defaults to the model's)
+
+    Returns:
+        Documents to format into the prompt; the last one chosen may have
+        truncated content
+    """
+    counter = get_token_counter(model)
+    budget = budget or get_context_budget(model)
+    separator = counter.count("\n\n")
+
+    candidates = [
+        (doc, _words(doc.get("content", "")), counter.count(format_document(doc)))
+        for doc in dedupe(context)
+    ]
+    selected: List[Dict[str, Any]] = []
+    selected_words: List[FrozenSet[str]] = []
+    remaining = budget
+    weight = settings.context_mmr_lambda
+
+    while candidates and remaining > 0:
+        best_index = max(
+            range(len(candidates)),
+            key=lambda i: weight * _score(candidates[i][0])
+            - (1 - weight)
+            * max(
+                (_overlap(candidates[i][1], words) for words in selected_words),
+                default=0.0,
+            ),
+        )
+        doc, words, tokens = candidates.pop(best_index)
+        cost = tokens + (separator if selected else 0)
+
+        if cost > remaining:
+            # Fit what we can of the best chunk, then only smaller ones
+            available = remaining - (cost - tokens)
+            overhead = tokens - counter.count(doc.get("content", ""))
+            content_tokens = available - overhead
+            if content_tokens < MIN_CHUNK_TOKENS:
+                continue
+            doc = {
+                **doc,
+                "content": counter.truncate(doc.get("content", ""), content_tokens),
+            }
+            cost = remaining
+
+        selected.append(doc)
+        selected_words.append(words)
+        remaining -= cost
+
+    logger.debug(
+        "Assembled context",
+        model=model,
+        retrieved=len(context),
+        selected=len(selected),
+        tokens=budget - remaining,
+        budget=budget,
+    )
+
+    # Strongest chunks first and last, weakest in the middle
+    ranked = sorted(selected, key=_score, reverse=True)
+    return ranked[::2] + ranked[1::2][::-1]
@@ -3,10 +3,16 @@ Intent classification tool for routing queries to appropriate agents.
 """
 
 import re
+import time
 from typing import Dict, List
 
 import structlog
 
+from agent_project.core.utils.metrics import (
+    INTENT_CLASSIFICATION_DURATION,
+    INTENT_CLASSIFICATIONS,
+)
+from agent_project.core.utils.timing import record_timing
 from agent_project.infrastructure.llm.client import LLMClient
 
 logger = structlog.get_logger()
@@ -154,18 +160,29 @@ class IntentClassifier:
             logger.debug("Classifying query intent", query=query[:100])
 
             # First try keyword-based classification
+            start = time.perf_counter()
             keyword_intent = self._classify_by_keywords(query)
+            elapsed = time.perf_counter() - start
+            INTENT_CLASSIFICATION_DURATION.labels("keyword").observe(elapsed)
+            record_timing("classification", elapsed, "keyword")
             if keyword_intent:
                 logger.debug("Intent classified by keywords", intent=keyword_intent)
+                INTENT_CLASSIFICATIONS.labels("keyword", keyword_intent).inc()
                 return keyword_intent
 
             # Fall back to LLM-based classification
+            start = time.perf_counter()
             llm_intent = await self._classify_by_llm(query)
+            elapsed = time.perf_counter() - start
+            INTENT_CLASSIFICATION_DURATION.labels("llm").observe(elapsed)
+            record_timing("classification", elapsed, "llm")
             logger.debug("Intent classified by LLM", intent=llm_intent)
+            INTENT_CLASSIFICATIONS.labels("llm", llm_intent).inc()
             return llm_intent
 
         except Exception as e:
             logger.error("Intent classification failed", error=str(e))
+            INTENT_CLASSIFICATIONS.labels("error", "general_building").inc()
             return "general_building"  # Default fallback
 
     def _classify_by_keywords(self, query: str) -> str | None:
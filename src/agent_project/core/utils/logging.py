@@ -2,51 +2,191 @@
 Structured logging configuration using structlog.
 """
 
+import atexit
+import json
 import logging
+import queue
+import random
 import sys
-from typing import Any
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Optional
 
 import structlog
-from structlog.stdlib import LoggerFactory
+from structlog.stdlib import LoggerFactory, ProcessorFormatter
 
 from agent_project.config import settings
+from agent_project.core.utils.metrics import LOG_RECORDS_DROPPED, LOG_RECORDS_SAMPLED
+from agent_project.core.utils.tracing import add_trace_context
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson ships with the langchain stack
+    orjson = None
+
+# Background listener for the queue-based logging mode
+_queue_listener: Optional[QueueListener] = None
+
+
+def _json_dumps(obj: Any, **kwargs: Any) -> str:
+    """Serialize log events with orjson when available."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                obj, default=str, option=orjson.OPT_NON_STR_KEYS
+            ).decode()
+        except TypeError:
+            # e.g. integers beyond 64 bits; logging must never raise
+            pass
+    return json.dumps(obj, default=str, **kwargs)
+
+
+class InfoSampler:
+    """
+    Structlog processor that keeps only a fraction of INFO and DEBUG events.
+
+    Warnings and errors are never sampled.
+    """
+
+    SAMPLED_LEVELS = {"debug", "info"}
+
+    def __init__(self, rate: float):
+        self.rate = rate
+
+    def __call__(self, logger: Any, method_name: str, event_dict: dict) -> dict:
+        if method_name in self.SAMPLED_LEVELS and random.random() >= self.rate:
+            LOG_RECORDS_SAMPLED.inc()
+            raise structlog.DropEvent
+        return event_dict
+
+
+class DroppingQueueHandler(QueueHandler):
+    """
+    Queue handler that never blocks the caller.
+
+    Records are enqueued unformatted so rendering happens on the listener
+    thread, and records are dropped (and counted) when the queue is full.
+    """
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+            LOG_RECORDS_DROPPED.inc()
+
+
+class DrainingQueueListener(QueueListener):
+    """Queue listener whose stop waits for queue space instead of failing."""
+
+    def enqueue_sentinel(self) -> None:
+        self.queue.put(self._sentinel)
 
 
 def setup_logging(level: str = "INFO") -> None:
     """
     Configure structured logging for the application.
 
+    With ``LOG_QUEUE_ENABLED`` set, events are filtered and enriched on the
+    calling thread but rendered and written by a background thread.
+
     Args:
         level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
     """
-    # Configure stdlib logging
-    logging.basicConfig(
-        format="%(message)s", stream=sys.stdout, level=getattr(logging, level.upper())
+    log_level = getattr(logging, level.upper())
+
+    processors = [
+        # Add logger name and level
+        structlog.stdlib.filter_by_level,
+        structlog.stdlib.add_logger_name,
+        structlog.stdlib.add_log_level,
+    ]
+
+    # Sample high-volume events before doing any further work on them
+    if settings.log_info_sample_rate < 1.0:
+        processors.append(InfoSampler(settings.log_info_sample_rate))
+
+    processors += [
+        # Correlate log lines with OpenTelemetry spans
+        add_trace_context,
+        # Add timestamp
+        structlog.processors.TimeStamper(fmt="ISO"),
+        # Add stack info for exceptions
+        structlog.processors.StackInfoRenderer(),
+        structlog.dev.set_exc_info,
+    ]
+
+    # JSON formatting for production, console for development
+    renderer = (
+        structlog.processors.JSONRenderer(serializer=_json_dumps)
+        if settings.app_env == "production"
+        else structlog.dev.ConsoleRenderer(colors=True)
     )
 
+    if settings.log_queue_enabled:
+        _setup_queue_logging(log_level, renderer)
+        processors.append(ProcessorFormatter.wrap_for_formatter)
+    else:
+        # Configure stdlib logging
+        logging.basicConfig(format="%(message)s", stream=sys.stdout, level=log_level)
+        processors.append(renderer)
+
     # Configure structlog
     structlog.configure(
-        processors=[
-            # Add logger name and level
-            structlog.stdlib.filter_by_level,
-            structlog.stdlib.add_logger_name,
-            structlog.stdlib.add_log_level,
-            # Add timestamp
-            structlog.processors.TimeStamper(fmt="ISO"),
-            # Add stack info for exceptions
-            structlog.processors.StackInfoRenderer(),
-            structlog.dev.set_exc_info,
-            # JSON formatting for production, console for development
-            structlog.processors.JSONRenderer()
-            if settings.app_env == "production"
-            else structlog.dev.ConsoleRenderer(colors=True),
-        ],
+        processors=processors,
         context_class=dict,
         logger_factory=LoggerFactory(),
         cache_logger_on_first_use=True,
     )
 
 
+def _setup_queue_logging(log_level: int, renderer: Any) -> None:
+    """Route stdlib logging through a bounded queue to a writer thread."""
+    global _queue_listener
+
+    shutdown_logging()
+
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(
+        ProcessorFormatter(
+            processors=[ProcessorFormatter.remove_processors_meta, renderer],
+            # Records from stdlib loggers (uvicorn, httpx, ...)
+            foreign_pre_chain=[
+                structlog.stdlib.add_log_level,
+                structlog.processors.TimeStamper(fmt="ISO"),
+            ],
+        )
+    )
+
+    log_queue: queue.Queue = queue.Queue(maxsize=settings.log_queue_size)
+    root_logger = logging.getLogger()
+    for handler in list(root_logger.handlers):
+        root_logger.removeHandler(handler)
+    root_logger.addHandler(DroppingQueueHandler(log_queue))
+    root_logger.setLevel(log_level)
+
+    _queue_listener = DrainingQueueListener(log_queue, stream_handler)
+    _queue_listener.start()
+
+
+def shutdown_logging() -> None:
+    """Flush and stop the background log writer, if running."""
+    global _queue_listener
+
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+
+
+atexit.register(shutdown_logging)
+
+
 def get_logger(name: str = __name__) -> structlog.stdlib.BoundLogger:
     """
     Get a structured logger instance.
@@ -0,0 +1,129 @@
+"""
+Event-loop lag monitoring and blocking-call detection.
+"""
+
+import asyncio
+import sys
+import threading
+import time
+import traceback
+from typing import Optional
+
+import structlog
+
+from agent_project.config import settings
+from agent_project.core.utils.metrics import (
+    EVENT_LOOP_BLOCKED,
+    EVENT_LOOP_LAG,
+    EVENT_LOOP_LAG_LAST,
+)
+
+logger = structlog.get_logger()
+
+
+class EventLoopMonitor:
+    """
+    Continuously measures event-loop lag and optionally reports blocking calls.
+
+    A monitor task sleeps for a fixed interval and records how late it wakes
+    up. In blocking-call debug mode, a watchdog thread also watches the
+    task's heartbeat; when the loop has not ticked for longer than the
+    threshold, it logs the stack of the loop thread, i.e. the code currently
+    blocking the loop (for example a synchronous HTTP call inside a
+    coroutine).
+    """
+
+    def __init__(self):
+        self.interval = settings.loop_monitor_interval_seconds
+        self.block_threshold = settings.loop_block_threshold_seconds
+        self.last_lag = 0.0
+        self.max_lag = 0.0
+        self._task: Optional[asyncio.Task] = None
+        self._watchdog: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._heartbeat = time.monotonic()
+        self._loop_thread_id: Optional[int] = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        """Start monitoring the running event loop."""
+        if self.running:
+            return
+
+        self.interval = settings.loop_monitor_interval_seconds
+        self.block_threshold = settings.loop_block_threshold_seconds
+        self._loop_thread_id = threading.get_ident()
+        self._heartbeat = time.monotonic()
+        self._stop.clear()
+        self._task = asyncio.get_running_loop().create_task(self._sample())
+
+        if settings.loop_block_debug:
+            self._watchdog = threading.Thread(
+                target=self._watch, name="event-loop-watchdog", daemon=True
+            )
+            self._watchdog.start()
+
+        logger.info(
+            "Event loop monitor started",
+            interval=self.interval,
+            block_debug=settings.loop_block_debug,
+        )
+
+    async def stop(self) -> None:
+        """Stop the monitor task and watchdog thread."""
+        self._stop.set()
+
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+        if self._watchdog is not None:
+            self._watchdog.join(timeout=1)
+            self._watchdog = None
+
+    async def _sample(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            start = loop.time()
+            await asyncio.sleep(self.interval)
+            lag = max(0.0, loop.time() - start - self.interval)
+
+            self._heartbeat = time.monotonic()
+            self.last_lag = lag
+            self.max_lag = max(self.max_lag, lag)
+            EVENT_LOOP_LAG.observe(lag)
+            EVENT_LOOP_LAG_LAST.set(lag)
+
+    def _watch(self) -> None:
+        reported_heartbeat = None
+
+        while not self._stop.wait(self.block_threshold / 2):
+            heartbeat = self._heartbeat
+            blocked_for = time.monotonic() - heartbeat - self.interval
+            if blocked_for < self.block_threshold or heartbeat == reported_heartbeat:
+                continue
+
+            # Only report each stall once
+            reported_heartbeat = heartbeat
+            frame = sys._current_frames().get(self._loop_thread_id)
+            if frame is None:
+                continue
+
+            EVENT_LOOP_BLOCKED.inc()
+            logger.warning(
+                "Event loop blocked",
+                blocked_for_ms=round(blocked_for * 1000, 1),
+                threshold_ms=round(self.block_threshold * 1000, 1),
+                stack="".join(traceback.format_stack(frame)),
+            )
+
+
+# Global event loop monitor instance
+event_loop_monitor = EventLoopMonitor()
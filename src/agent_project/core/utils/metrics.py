@@ -0,0 +1,221 @@
+"""
+Prometheus metrics for the request pipeline.
+
+Metrics are registered on the default prometheus_client registry, which is
+what the ``/metrics`` ASGI app mounted in ``main.py`` exposes.
+"""
+
+import time
+import weakref
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator
+
+from prometheus_client import REGISTRY, Counter, Gauge, Histogram
+from prometheus_client.core import GaugeMetricFamily
+
+from agent_project.core.utils.timing import record_timing
+
+# Buckets tuned for in-process work (auth, classification, DB) in seconds
+FAST_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0)
+
+# Buckets for whole requests and LLM calls in seconds
+SLOW_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 20.0, 30.0, 60.0)
+
+# HTTP
+HTTP_REQUESTS = Counter(
+    "http_requests_total",
+    "HTTP requests by route and status code",
+    ["method", "route", "status"],
+)
+HTTP_REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "HTTP request duration by route",
+    ["method", "route"],
+    buckets=SLOW_BUCKETS,
+)
+HTTP_REQUESTS_IN_FLIGHT = Gauge(
+    "http_requests_in_flight", "HTTP requests currently being processed"
+)
+
+# Intent classification
+INTENT_CLASSIFICATIONS = Counter(
+    "intent_classifications_total",
+    "Intent classifications by tier and resulting intent",
+    ["tier", "intent"],
+)
+INTENT_CLASSIFICATION_DURATION = Histogram(
+    "intent_classification_duration_seconds",
+    "Intent classification duration by tier",
+    ["tier"],
+    buckets=FAST_BUCKETS + SLOW_BUCKETS[4:],
+)
+
+# Vector search
+VECTOR_SEARCH_DURATION = Histogram(
+    "vector_search_duration_seconds",
+    "Vector similarity search duration",
+    ["clause_type"],
+    buckets=FAST_BUCKETS + SLOW_BUCKETS[4:],
+)
+VECTOR_SEARCH_RESULTS = Histogram(
+    "vector_search_results",
+    "Number of results returned by vector similarity search",
+    ["clause_type"],
+    buckets=(0, 1, 2, 3, 5, 10, 20, 50),
+)
+VECTOR_SEARCH_ERRORS = Counter(
+    "vector_search_errors_total", "Failed vector similarity searches", ["clause_type"]
+)
+VECTOR_CACHE_REQUESTS = Counter(
+    "vector_result_cache_requests_total",
+    "Vector search result cache lookups by result (hit, miss)",
+    ["result"],
+)
+VECTOR_SEARCH_BACKEND = Counter(
+    "vector_search_backend_total",
+    "Vector searches by serving tier (local, local_fallback, rpc)",
+    ["backend"],
+)
+
+RETRIEVAL_CONFIDENCE_GATE = Counter(
+    "retrieval_confidence_gate_total",
+    "Specialist answers by retrieval confidence outcome "
+    "(answered, no_context, low_confidence, retrieval_error); "
+    "gated outcomes skip the LLM",
+    ["clause_type", "outcome"],
+)
+
+# LLM
+LLM_REQUEST_DURATION = Histogram(
+    "llm_request_duration_seconds",
+    "LLM request duration by provider and model",
+    ["provider", "model", "mode"],
+    buckets=SLOW_BUCKETS,
+)
+LLM_TOKENS = Counter(
+    "llm_tokens_total",
+    "LLM tokens reported by the provider",
+    ["provider", "model", "type"],
+)
+LLM_ERRORS = Counter(
+    "llm_errors_total", "Failed LLM requests", ["provider", "model", "mode"]
+)
+
+# Session memory
+SESSION_MEMORY_OPERATIONS = Counter(
+    "session_memory_operations_total",
+    "Session memory operations by outcome",
+    ["operation", "status"],
+)
+SESSION_MEMORY_DURATION = Histogram(
+    "session_memory_operation_duration_seconds",
+    "Session memory operation duration",
+    ["operation"],
+    buckets=FAST_BUCKETS,
+)
+
+# Auth
+AUTH_VERIFICATIONS = Counter(
+    "auth_verifications_total",
+    "JWT verifications by result (cache_hit, verified, failed)",
+    ["result"],
+)
+AUTH_VERIFICATION_DURATION = Histogram(
+    "auth_verification_duration_seconds",
+    "JWT verification duration, including cache lookups",
+    ["result"],
+    buckets=FAST_BUCKETS,
+)
+
+# Event loop
+EVENT_LOOP_LAG = Histogram(
+    "event_loop_lag_seconds",
+    "Delay between a scheduled event-loop wake-up and when it ran",
+    buckets=FAST_BUCKETS + SLOW_BUCKETS[4:],
+)
+EVENT_LOOP_LAG_LAST = Gauge(
+    "event_loop_lag_last_seconds", "Most recently measured event-loop lag"
+)
+EVENT_LOOP_BLOCKED = Counter(
+    "event_loop_blocked_total",
+    "Times the event loop was blocked for longer than the debug threshold",
+)
+
+# Logging
+LOG_RECORDS_DROPPED = Counter(
+    "log_records_dropped_total", "Log records dropped because the log queue was full"
+)
+LOG_RECORDS_SAMPLED = Counter(
+    "log_records_sampled_out_total", "INFO/DEBUG log events dropped by sampling"
+)
+
+
+@contextmanager
+def track_session_operation(operation: str) -> Iterator[None]:
+    """Record duration and outcome of a session memory operation."""
+    start = time.perf_counter()
+    status = "error"
+    try:
+        yield
+        status = "ok"
+    finally:
+        elapsed = time.perf_counter() - start
+        SESSION_MEMORY_DURATION.labels(operation).observe(elapsed)
+        SESSION_MEMORY_OPERATIONS.labels(operation, status).inc()
+        record_timing("memory", elapsed, operation)
+
+
+class PoolCollector:
+    """
+    Reports utilization of registered asyncpg pools at scrape time.
+
+    Pools are held by weak reference so short-lived clients do not leak.
+    """
+
+    def __init__(self):
+        self._pools: "weakref.WeakValueDictionary[str, Any]" = (
+            weakref.WeakValueDictionary()
+        )
+
+    def register(self, name: str, pool: Any) -> None:
+        self._pools[name] = pool
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """Current size, idle and max connections for each registered pool."""
+        stats = {}
+        for name, pool in list(self._pools.items()):
+            try:
+                stats[name] = {
+                    "size": pool.get_size(),
+                    "idle": pool.get_idle_size(),
+                    "max": pool.get_max_size(),
+                }
+            except Exception:
+                continue
+        return stats
+
+    def collect(self):
+        size = GaugeMetricFamily(
+            "db_pool_connections", "Open connections per DB pool", labels=["pool"]
+        )
+        idle = GaugeMetricFamily(
+            "db_pool_idle_connections", "Idle connections per DB pool", labels=["pool"]
+        )
+        max_size = GaugeMetricFamily(
+            "db_pool_max_connections",
+            "Maximum connections per DB pool",
+            labels=["pool"],
+        )
+
+        for name, pool_stats in self.stats().items():
+            size.add_metric([name], pool_stats["size"])
+            idle.add_metric([name], pool_stats["idle"])
+            max_size.add_metric([name], pool_stats["max"])
+
+        yield size
+        yield idle
+        yield max_size
+
+
+pool_collector = PoolCollector()
+REGISTRY.register(pool_collector)
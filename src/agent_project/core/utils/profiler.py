@@ -0,0 +1,167 @@
+"""
+Low-overhead sampling profiler producing flamegraph collapsed stacks.
+
+Sampling runs on its own thread and only reads ``sys._current_frames()``,
+so profiled code is never instrumented or paused beyond the GIL hand-off.
+Output uses the collapsed format understood by ``flamegraph.pl``,
+speedscope and inferno: one ``frame;frame;frame count`` line per stack.
+"""
+
+import asyncio
+import sys
+import threading
+import time
+from collections import Counter
+from datetime import datetime, timezone
+from types import CodeType, FrameType
+from typing import Dict, Optional
+
+import structlog
+
+from agent_project.config import settings
+
+logger = structlog.get_logger()
+
+
+class SamplingProfiler:
+    """Samples the stacks of all other threads at a fixed interval."""
+
+    def __init__(self, interval: float, stop_event: Optional[threading.Event] = None):
+        self.interval = interval
+        self.counts: Counter = Counter()
+        self.samples = 0
+        self.started_at: Optional[datetime] = None
+        self.duration = 0.0
+        self._stop = stop_event or threading.Event()
+        self._labels: Dict[CodeType, str] = {}
+
+    def run(self, duration: float) -> "SamplingProfiler":
+        """
+        Sample on the calling thread for ``duration`` seconds.
+
+        Args:
+            duration: Seconds to sample for
+
+        Returns:
+            This profiler, for chaining
+        """
+        own_ident = threading.get_ident()
+        self.started_at = datetime.now(timezone.utc)
+        start = time.monotonic()
+        deadline = start + duration
+
+        while not self._stop.wait(self.interval):
+            self._sample(own_ident)
+            if time.monotonic() >= deadline:
+                break
+
+        self.duration = time.monotonic() - start
+        return self
+
+    def _sample(self, own_ident: int) -> None:
+        names = {thread.ident: thread.name for thread in threading.enumerate()}
+        for ident, frame in sys._current_frames().items():
+            if ident == own_ident:
+                continue
+            thread_name = names.get(ident, str(ident)).replace(";", ":")
+            self.counts[f"{thread_name};{self._collapse(frame)}"] += 1
+        self.samples += 1
+
+    def _collapse(self, frame: Optional[FrameType]) -> str:
+        frames = []
+        while frame is not None:
+            code = frame.f_code
+            label = self._labels.get(code)
+            if label is None:
+                label = f"{code.co_name} ({code.co_filename}:{code.co_firstlineno})"
+                label = self._labels[code] = label.replace(";", ":")
+            frames.append(label)
+            frame = frame.f_back
+        return ";".join(reversed(frames))
+
+    def collapsed(self) -> str:
+        """Render samples in flamegraph collapsed-stack format."""
+        return "\n".join(
+            f"{stack} {count}" for stack, count in self.counts.most_common()
+        )
+
+
+_profile_lock = asyncio.Lock()
+
+
+async def profile(duration: float, interval: float) -> SamplingProfiler:
+    """
+    Profile the process for ``duration`` seconds without blocking the loop.
+
+    Only one on-demand profile runs at a time.
+
+    Args:
+        duration: Seconds to sample for
+        interval: Seconds between samples
+
+    Returns:
+        The finished profiler
+
+    Raises:
+        RuntimeError: If another profile is already running
+    """
+    if _profile_lock.locked():
+        raise RuntimeError("A profile is already running")
+
+    async with _profile_lock:
+        profiler = SamplingProfiler(interval)
+        return await asyncio.to_thread(profiler.run, duration)
+
+
+class ContinuousProfiler:
+    """
+    Low-rate profiler that keeps the most recent window in memory.
+
+    Samples are collected for ``window`` seconds at a time; when a window
+    completes it replaces the previously kept one.
+    """
+
+    def __init__(self):
+        self.latest: Optional[SamplingProfiler] = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """Start continuous profiling on a daemon thread."""
+        if self.running:
+            return
+
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="continuous-profiler", daemon=True
+        )
+        self._thread.start()
+        logger.info(
+            "Continuous profiling started",
+            interval=settings.continuous_profiling_interval_seconds,
+            window=settings.continuous_profiling_window_seconds,
+        )
+
+    def stop(self) -> None:
+        """Stop continuous profiling."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=1)
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            profiler = SamplingProfiler(
+                settings.continuous_profiling_interval_seconds, self._stop
+            )
+            profiler.run(settings.continuous_profiling_window_seconds)
+            if profiler.samples:
+                self.latest = profiler
+
+
+# Global continuous profiler instance
+continuous_profiler = ContinuousProfiler()
@@ -0,0 +1,97 @@
+"""
+Per-request latency breakdown collected across pipeline stages.
+
+Stages record into the ``RequestTimings`` bound to the current context,
+which is only set for requests that opt in (see ``TimingMiddleware``), so
+recording is a single ContextVar lookup otherwise.
+"""
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, Optional
+
+_current_timings: ContextVar[Optional["RequestTimings"]] = ContextVar(
+    "request_timings", default=None
+)
+
+
+class RequestTimings:
+    """Accumulated milliseconds per stage for a single request."""
+
+    __slots__ = ("started", "_stages", "_details")
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self._stages: Dict[str, float] = {}
+        self._details: Dict[str, str] = {}
+
+    def add(self, stage: str, seconds: float, detail: Optional[str] = None) -> None:
+        """Add time spent in a stage; repeated stages are summed."""
+        self._stages[stage] = self._stages.get(stage, 0.0) + seconds * 1000
+        if detail:
+            self._details[stage] = detail
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Breakdown suitable for inclusion in a JSON response."""
+        stages: Dict[str, Any] = {}
+        for stage, ms in self._stages.items():
+            stages[stage] = {"ms": round(ms, 3)}
+            if stage in self._details:
+                stages[stage]["detail"] = self._details[stage]
+
+        return {
+            "total_ms": round((time.perf_counter() - self.started) * 1000, 3),
+            "stages": stages,
+        }
+
+    def server_timing_header(self) -> str:
+        """Render the breakdown as a ``Server-Timing`` header value."""
+        entries = []
+        for stage, ms in self._stages.items():
+            entry = f"{stage};dur={ms:.3f}"
+            if stage in self._details:
+                entry += f';desc="{self._details[stage]}"'
+            entries.append(entry)
+
+        total_ms = (time.perf_counter() - self.started) * 1000
+        entries.append(f"total;dur={total_ms:.3f}")
+        return ", ".join(entries)
+
+
+def start_request_timings() -> RequestTimings:
+    """Bind a new timing collector to the current context."""
+    timings = RequestTimings()
+    _current_timings.set(timings)
+    return timings
+
+
+def clear_request_timings() -> None:
+    """Unbind the timing collector from the current context."""
+    _current_timings.set(None)
+
+
+def get_request_timings() -> Optional[RequestTimings]:
+    """Get the collector for the current request, if timing was requested."""
+    return _current_timings.get()
+
+
+def record_timing(stage: str, seconds: float, detail: Optional[str] = None) -> None:
+    """Record time spent in a stage for the current request, if collecting."""
+    timings = _current_timings.get()
+    if timings is not None:
+        timings.add(stage, seconds, detail)
+
+
+@contextmanager
+def timed(stage: str, detail: Optional[str] = None) -> Iterator[None]:
+    """Time a block and record it as a stage of the current request."""
+    if _current_timings.get() is None:
+        yield
+        return
+
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        record_timing(stage, time.perf_counter() - start, detail)
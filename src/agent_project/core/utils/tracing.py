@@ -0,0 +1,217 @@
+"""
+OpenTelemetry tracing setup and helpers.
+
+OpenTelemetry is an optional dependency. When ``opentelemetry-api`` is not
+installed every helper in this module degrades to a no-op, so call sites can
+be instrumented unconditionally. Exporting spans additionally requires
+``opentelemetry-sdk`` (and ``opentelemetry-exporter-otlp-proto-http`` for the
+OTLP exporter); asyncpg query spans require
+``opentelemetry-instrumentation-asyncpg``. All four are installed by the
+``tracing`` extra (``poetry install --extras tracing``).
+"""
+
+import functools
+import sys
+from contextlib import contextmanager
+from typing import IO, Any, Callable, Dict, Iterator, Mapping, Optional
+
+import structlog
+
+from agent_project.config import settings
+
+try:
+    from opentelemetry import trace
+    from opentelemetry.propagate import extract
+except ImportError:  # pragma: no cover - optional dependency
+    trace = None
+    extract = None
+
+logger = structlog.get_logger()
+
+_tracing_configured = False
+_tracer_provider: Optional[Any] = None
+_trace_file: Optional[IO[str]] = None
+
+
+def setup_tracing() -> bool:
+    """
+    Configure the global tracer provider and exporter from settings.
+
+    Returns:
+        True if spans will be exported, False otherwise
+    """
+    global _tracing_configured, _tracer_provider
+
+    if not settings.enable_tracing or _tracing_configured:
+        return _tracing_configured
+
+    if trace is None:
+        logger.warning(
+            "Tracing enabled but opentelemetry-api is not installed "
+            "(install the tracing extra); spans are disabled"
+        )
+        return False
+
+    try:
+        from opentelemetry.sdk.resources import Resource
+        from opentelemetry.sdk.trace import TracerProvider
+        from opentelemetry.sdk.trace.export import BatchSpanProcessor
+        from opentelemetry.sdk.trace.sampling import ParentBasedTraceIdRatio
+    except ImportError:
+        logger.warning(
+            "Tracing enabled but opentelemetry-sdk is not installed "
+            "(install the tracing extra); spans are disabled"
+        )
+        return False
+
+    provider = TracerProvider(
+        resource=Resource.create(
+            {
+                "service.name": settings.app_name,
+                "service.version": settings.app_version,
+                "deployment.environment": settings.app_env,
+            }
+        ),
+        sampler=ParentBasedTraceIdRatio(settings.tracing_sample_ratio),
+    )
+
+    exporter = _build_exporter()
+    if exporter is None:
+        return False
+
+    provider.add_span_processor(BatchSpanProcessor(exporter))
+    trace.set_tracer_provider(provider)
+    _tracer_provider = provider
+
+    try:
+        from opentelemetry.instrumentation.asyncpg import AsyncPGInstrumentor
+
+        AsyncPGInstrumentor().instrument()
+    except ImportError:
+        logger.warning(
+            "opentelemetry-instrumentation-asyncpg not installed "
+            "(install the tracing extra); asyncpg queries will not be traced"
+        )
+
+    _tracing_configured = True
+    logger.info("Tracing configured", exporter=settings.tracing_exporter)
+    return True
+
+
+def _build_exporter() -> Optional[Any]:
+    """Create the span exporter selected by ``settings.tracing_exporter``."""
+    global _trace_file
+
+    exporter_name = settings.tracing_exporter.lower()
+
+    if exporter_name == "otlp":
+        try:
+            from opentelemetry.exporter.otlp.proto.http.trace_exporter import (
+                OTLPSpanExporter,
+            )
+        except ImportError:
+            logger.warning(
+                "OTLP exporter requested but opentelemetry-exporter-otlp-proto-http "
+                "is not installed (install the tracing extra); spans are disabled"
+            )
+            return None
+        return OTLPSpanExporter(endpoint=settings.otlp_endpoint)
+
+    from opentelemetry.sdk.trace.export import ConsoleSpanExporter
+
+    if exporter_name == "console":
+        return ConsoleSpanExporter(out=sys.stdout)
+
+    if exporter_name == "file":
+        _trace_file = open(settings.tracing_file_path, "a", encoding="utf-8")
+        return ConsoleSpanExporter(
+            out=_trace_file,
+            formatter=lambda span: span.to_json(indent=None) + "\n",
+        )
+
+    logger.warning("Unknown tracing exporter", exporter=exporter_name)
+    return None
+
+
+def shutdown_tracing() -> None:
+    """Flush pending spans and close the trace file, if any."""
+    global _tracing_configured, _tracer_provider, _trace_file
+
+    if _tracer_provider is not None:
+        _tracer_provider.shutdown()
+        _tracer_provider = None
+    if _trace_file is not None:
+        _trace_file.close()
+        _trace_file = None
+    _tracing_configured = False
+
+
+def get_tracer() -> Any:
+    """Get the application tracer (a proxy until tracing is configured)."""
+    return trace.get_tracer("agent_project") if trace is not None else None
+
+
+@contextmanager
+def span(name: str, **attributes: Any) -> Iterator[Any]:
+    """Start a span as the current span, or do nothing without OpenTelemetry."""
+    if trace is None:
+        yield None
+        return
+
+    with get_tracer().start_as_current_span(
+        name, attributes=_clean_attributes(attributes)
+    ) as current:
+        yield current
+
+
+@contextmanager
+def server_span(name: str, headers: Mapping[str, str]) -> Iterator[Any]:
+    """Start a server span continuing any W3C trace context in the headers."""
+    if trace is None:
+        yield None
+        return
+
+    with get_tracer().start_as_current_span(
+        name, context=extract(headers), kind=trace.SpanKind.SERVER
+    ) as current:
+        yield current
+
+
+def traced(name: str) -> Callable:
+    """Decorator that runs an async function inside a span."""
+
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            with span(name):
+                return await func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def annotate_span(**attributes: Any) -> None:
+    """Add attributes to the current span, if one is recording."""
+    if trace is None:
+        return
+
+    current = trace.get_current_span()
+    if current.is_recording():
+        current.set_attributes(_clean_attributes(attributes))
+
+
+def _clean_attributes(attributes: Dict[str, Any]) -> Dict[str, Any]:
+    return {key: value for key, value in attributes.items() if value is not None}
+
+
+def add_trace_context(logger: Any, method_name: str, event_dict: dict) -> dict:
+    """Structlog processor that adds the current trace and span IDs."""
+    if trace is None:
+        return event_dict
+
+    span_context = trace.get_current_span().get_span_context()
+    if span_context.is_valid:
+        event_dict["trace_id"] = format(span_context.trace_id, "032x")
+        event_dict["span_id"] = format(span_context.span_id, "016x")
+    return event_dict
@@ -2,68 +2,62 @@
 FastAPI dependencies for authentication and authorization.
 """
 
-import json
+import hashlib
 import time
-from functools import lru_cache
-from typing import Any, Dict, Optional
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
 
-import httpx
 import structlog
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from jose import JWTError, jwt
+from jose.backends.base import Key
+from jose.jwk import construct as construct_key
 
 from agent_project.config import settings
+from agent_project.core.utils.metrics import (
+    AUTH_VERIFICATION_DURATION,
+    AUTH_VERIFICATIONS,
+)
+from agent_project.core.utils.timing import record_timing, timed
+from agent_project.infrastructure.auth.jwks import jwks_manager
 
 logger = structlog.get_logger()
 security = HTTPBearer()
 
-# Cache for Supabase public keys
-_supabase_jwks_cache = {}
-_jwks_cache_expiry = 0
+# Verified token hash -> (cache expiry, decoded claims), least recently used first
+_verified_token_cache: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
 
-
-@lru_cache(maxsize=1)
-def get_supabase_jwks_url() -> str:
-    """Get Supabase JWKS URL."""
-    return f"{settings.supabase_url}/auth/v1/.well-known/jwks.json"
+# Signing key objects built from the current JWKS, indexed by kid
+_signing_keys: Dict[str, Tuple[Key, str]] = {}
+_signing_keys_source: Optional[Dict[str, Any]] = None
 
 
 async def get_supabase_public_keys() -> Dict[str, Any]:
     """
-    Fetch and cache Supabase public keys for JWT validation.
+    Get cached Supabase public keys for JWT validation.
     Handles both ECC (P-256) and RSA keys.
     """
-    global _supabase_jwks_cache, _jwks_cache_expiry
+    try:
+        return await jwks_manager.get_keys()
+
+    except Exception as e:
+        logger.error("Failed to fetch Supabase JWKS", error=str(e))
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Unable to validate tokens at this time",
+        )
 
-    # Check cache (refresh every hour)
-    current_time = time.time()
-    if _supabase_jwks_cache and current_time < _jwks_cache_expiry:
-        return _supabase_jwks_cache
 
+async def refresh_supabase_public_keys(kid: str) -> Dict[str, Any]:
+    """
+    Refetch Supabase public keys after seeing an unknown key ID.
+    """
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(get_supabase_jwks_url(), timeout=10.0)
-            response.raise_for_status()
-            jwks_data = response.json()
-
-            # Cache for 1 hour
-            _supabase_jwks_cache = jwks_data
-            _jwks_cache_expiry = current_time + 3600
-
-            logger.debug(
-                "Fetched Supabase JWKS",
-                keys_count=len(jwks_data.get("keys", [])),
-                key_types=[key.get("kty") for key in jwks_data.get("keys", [])],
-            )
-            return jwks_data
+        return await jwks_manager.refresh_for_unknown_kid(kid)
 
     except Exception as e:
-        logger.error("Failed to fetch Supabase JWKS", error=str(e))
-        # Return cached data if available, otherwise raise
-        if _supabase_jwks_cache:
-            logger.warning("Using cached JWKS due to fetch error")
-            return _supabase_jwks_cache
+        logger.error("Failed to refetch Supabase JWKS", kid=kid, error=str(e))
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail="Unable to validate tokens at this time",
@@ -103,12 +97,107 @@ def build_rsa_key(jwk: Dict[str, Any]) -> Dict[str, Any]:
     }
 
 
+def get_signing_keys(jwks: Dict[str, Any]) -> Dict[str, Tuple[Key, str]]:
+    """
+    Get verification key objects indexed by kid.
+
+    Keys are constructed once per JWKS document and reused until the
+    JWKS cache returns a different document.
+    """
+    global _signing_keys, _signing_keys_source
+
+    if jwks is _signing_keys_source:
+        return _signing_keys
+
+    signing_keys: Dict[str, Tuple[Key, str]] = {}
+    for key in jwks.get("keys", []):
+        kid = key.get("kid")
+        key_type = key.get("kty")
+
+        try:
+            if key_type == "EC":
+                # New ECC P-256 keys
+                key_algorithm = "ES256"
+                key_data = build_ec_key(key)
+            elif key_type == "RSA":
+                # Legacy RSA keys
+                key_algorithm = "RS256"
+                key_data = build_rsa_key(key)
+            else:
+                logger.warning("Unsupported key type", key_type=key_type, kid=kid)
+                continue
+
+            signing_keys[kid] = (construct_key(key_data, key_algorithm), key_algorithm)
+
+        except Exception as e:
+            logger.warning("Failed to build signing key", kid=kid, error=str(e))
+
+    _signing_keys = signing_keys
+    _signing_keys_source = jwks
+
+    logger.debug("Built signing keys", kids=list(signing_keys))
+    return signing_keys
+
+
+def _token_cache_key(token: str) -> str:
+    """Hash a token so raw credentials are never held as cache keys."""
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+def get_cached_claims(token_hash: str) -> Optional[Dict[str, Any]]:
+    """Return cached claims for a previously verified token, if still valid."""
+    entry = _verified_token_cache.get(token_hash)
+    if entry is None:
+        return None
+
+    expires_at, claims = entry
+    if time.time() >= expires_at:
+        _verified_token_cache.pop(token_hash, None)
+        return None
+
+    _verified_token_cache.move_to_end(token_hash)
+    return claims
+
+
+def cache_verified_claims(token_hash: str, claims: Dict[str, Any]) -> None:
+    """
+    Cache claims of a verified token until min(exp, cache TTL).
+    """
+    ttl = settings.jwt_verification_cache_ttl_seconds
+    max_entries = settings.jwt_verification_cache_max_entries
+    if ttl <= 0 or max_entries <= 0:
+        return
+
+    expires_at = min(float(claims["exp"]), time.time() + ttl)
+    _verified_token_cache[token_hash] = (expires_at, claims)
+    _verified_token_cache.move_to_end(token_hash)
+
+    while len(_verified_token_cache) > max_entries:
+        _verified_token_cache.popitem(last=False)
+
+
+def clear_token_cache() -> None:
+    """Drop all cached token verification results."""
+    _verified_token_cache.clear()
+
+
 async def validate_supabase_jwt(token: str) -> Dict[str, Any]:
     """
     Validate Supabase JWT token using Supabase public keys.
     Supports both new ECC (P-256) and legacy RSA keys.
+
+    Successful verifications are cached by token hash until the earlier of
+    the token's expiry and the verification cache TTL.
     """
+    start = time.perf_counter()
     try:
+        token_hash = _token_cache_key(token)
+        with timed("cache", "jwt"):
+            cached_claims = get_cached_claims(token_hash)
+        if cached_claims is not None:
+            _record_verification("cache_hit", start)
+            return cached_claims
+
         # Get the token header to find the correct key
         unverified_header = jwt.get_unverified_header(token)
         kid = unverified_header.get("kid")
@@ -123,36 +212,19 @@ async def validate_supabase_jwt(token: str) -> Dict[str, Any]:
         jwks = await get_supabase_public_keys()
 
         # Find the correct key
-        signing_key = None
-        key_algorithm = None
-
-        for key in jwks.get("keys", []):
-            if key.get("kid") == kid:
-                key_type = key.get("kty")
-
-                if key_type == "EC":
-                    # New ECC P-256 keys
-                    signing_key = build_ec_key(key)
-                    key_algorithm = "ES256"
-                elif key_type == "RSA":
-                    # Legacy RSA keys
-                    signing_key = build_rsa_key(key)
-                    key_algorithm = "RS256"
-                else:
-                    logger.warning("Unsupported key type", key_type=key_type, kid=kid)
-                    continue
-
-                break
-
-        if not signing_key:
+        signing_key_entry = get_signing_keys(jwks).get(kid)
+
+        if not signing_key_entry:
+            # Keys may have been rotated since the last fetch
+            jwks = await refresh_supabase_public_keys(kid)
+            signing_key_entry = get_signing_keys(jwks).get(kid)
+
+        if not signing_key_entry:
             raise JWTError(f"Unable to find appropriate key for kid: {kid}")
 
-        if not key_algorithm:
-            raise JWTError("Unable to determine key algorithm")
+        signing_key, key_algorithm = signing_key_entry
 
-        logger.debug(
-            "Using key", key_type=signing_key.get("kty"), algorithm=key_algorithm
-        )
+        logger.debug("Using key", kid=kid, algorithm=key_algorithm)
 
         # Validate the token
         payload = jwt.decode(
@@ -174,17 +246,29 @@ async def validate_supabase_jwt(token: str) -> Dict[str, Any]:
         if payload.get("exp", 0) < current_time:
             raise JWTError("Token has expired")
 
+        cache_verified_claims(token_hash, payload)
+        _record_verification("verified", start)
+
         logger.debug("Supabase JWT validated successfully", user_id=payload.get("sub"))
         return payload
 
     except JWTError as e:
         logger.warning("Supabase JWT validation failed", error=str(e))
+        _record_verification("failed", start)
         raise
     except Exception as e:
         logger.error("JWT validation error", error=str(e))
+        _record_verification("failed", start)
         raise JWTError(f"Token validation failed: {str(e)}")
 
 
+def _record_verification(result: str, start: float) -> None:
+    elapsed = time.perf_counter() - start
+    AUTH_VERIFICATIONS.labels(result).inc()
+    AUTH_VERIFICATION_DURATION.labels(result).observe(elapsed)
+    record_timing("auth", elapsed, result)
+
+
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
 ) -> Dict[str, Any]:
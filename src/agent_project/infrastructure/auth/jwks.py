@@ -0,0 +1,157 @@
+"""
+Supabase JWKS fetching with single-flight and background refresh.
+"""
+
+import asyncio
+import time
+from typing import Any, Dict, Optional
+
+import httpx
+import structlog
+
+from agent_project.config import settings
+
+logger = structlog.get_logger()
+
+
+class JWKSManager:
+    """
+    Fetches and caches the Supabase JSON Web Key Set.
+
+    Concurrent callers that find the cache empty or expired share a single
+    in-flight fetch. Reads that land within the refresh margin before expiry
+    return the cached keys immediately and trigger a background refresh, so
+    requests do not block on JWKS once the cache is warm. Unknown ``kid``
+    values force an immediate, rate-limited refetch to pick up rotated keys.
+    """
+
+    def __init__(self, jwks_url: Optional[str] = None):
+        self._jwks_url = jwks_url
+        self._jwks: Optional[Dict[str, Any]] = None
+        self._expires_at = 0.0
+        self._last_forced_refresh = 0.0
+        self._inflight: Optional[asyncio.Task] = None
+        self._client: Optional[httpx.AsyncClient] = None
+
+    @property
+    def jwks_url(self) -> str:
+        """JWKS endpoint for the configured Supabase project."""
+        return (
+            self._jwks_url or f"{settings.supabase_url}/auth/v1/.well-known/jwks.json"
+        )
+
+    @property
+    def cached_keys(self) -> Optional[Dict[str, Any]]:
+        """The last successfully fetched JWKS document, if any."""
+        return self._jwks
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get or create the shared pooled HTTP client."""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                timeout=settings.jwt_validation_timeout_seconds,
+                limits=httpx.Limits(max_connections=4, max_keepalive_connections=2),
+            )
+        return self._client
+
+    async def get_keys(self) -> Dict[str, Any]:
+        """
+        Return the current JWKS, fetching it if the cache is empty or expired.
+
+        Falls back to stale keys if a refresh fails.
+        """
+        now = time.time()
+
+        if self._jwks is not None and now < self._expires_at:
+            if now >= self._expires_at - settings.jwks_refresh_margin_seconds:
+                self.schedule_refresh()
+            return self._jwks
+
+        try:
+            return await self._refresh()
+        except Exception as e:
+            if self._jwks is not None:
+                logger.warning("Using cached JWKS due to fetch error", error=str(e))
+                return self._jwks
+            raise
+
+    async def refresh_for_unknown_kid(self, kid: str) -> Dict[str, Any]:
+        """
+        Refetch the JWKS after encountering an unknown key ID.
+
+        Refetches are rate limited so tokens with bogus ``kid`` values cannot
+        be used to hammer the Supabase auth endpoint.
+        """
+        now = time.time()
+        if (
+            self._jwks is not None
+            and now - self._last_forced_refresh
+            < settings.jwks_min_refetch_interval_seconds
+        ):
+            return self._jwks
+
+        self._last_forced_refresh = now
+        logger.info("Refetching JWKS for unknown key ID", kid=kid)
+
+        try:
+            return await self._refresh()
+        except Exception as e:
+            if self._jwks is not None:
+                logger.warning("JWKS refetch failed", kid=kid, error=str(e))
+                return self._jwks
+            raise
+
+    def schedule_refresh(self) -> None:
+        """Start a background refresh unless one is already running."""
+        if self._inflight is not None and not self._inflight.done():
+            return
+
+        self._inflight = asyncio.create_task(self._fetch())
+        self._inflight.add_done_callback(self._log_background_failure)
+
+    async def _refresh(self) -> Dict[str, Any]:
+        """Join the in-flight fetch, starting one if needed."""
+        if self._inflight is None or self._inflight.done():
+            self._inflight = asyncio.create_task(self._fetch())
+
+        # Shield so a cancelled caller does not cancel the shared fetch
+        return await asyncio.shield(self._inflight)
+
+    async def _fetch(self) -> Dict[str, Any]:
+        """Fetch the JWKS document from Supabase and update the cache."""
+        client = self._get_client()
+        response = await client.get(self.jwks_url)
+        response.raise_for_status()
+        jwks_data = response.json()
+
+        self._jwks = jwks_data
+        self._expires_at = time.time() + settings.jwks_cache_ttl_seconds
+
+        logger.debug(
+            "Fetched Supabase JWKS",
+            keys_count=len(jwks_data.get("keys", [])),
+            key_types=[key.get("kty") for key in jwks_data.get("keys", [])],
+        )
+        return jwks_data
+
+    @staticmethod
+    def _log_background_failure(task: asyncio.Task) -> None:
+        if task.cancelled():
+            return
+        error = task.exception()
+        if error is not None:
+            logger.warning("Background JWKS refresh failed", error=str(error))
+
+    async def close(self) -> None:
+        """Cancel any in-flight fetch and close the HTTP client."""
+        if self._inflight is not None and not self._inflight.done():
+            self._inflight.cancel()
+        self._inflight = None
+
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+
+# Global JWKS manager instance
+jwks_manager = JWKSManager()
@@ -0,0 +1,172 @@
+"""
+Background dependency health checks served from cached results.
+
+Checks run concurrently on their own intervals with a per-check timeout,
+so health probes never touch the database or LLM providers themselves.
+"""
+
+import asyncio
+import time
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+import structlog
+
+from agent_project.config import settings
+from agent_project.core.utils.metrics import pool_collector
+
+logger = structlog.get_logger()
+
+# A check returns (healthy, details)
+HealthCheck = Callable[[], Awaitable[tuple[bool, Dict[str, Any]]]]
+
+
+class HealthMonitor:
+    """
+    Runs registered dependency checks in the background and caches results.
+
+    Critical checks make the service ``unhealthy`` when they fail; other
+    checks only mark it ``degraded``.
+    """
+
+    def __init__(self):
+        self._checks: Dict[str, Dict[str, Any]] = {}
+        self._tasks: Dict[str, asyncio.Task] = {}
+        self.results: Dict[str, Dict[str, Any]] = {}
+
+    def register(
+        self,
+        name: str,
+        check: HealthCheck,
+        critical: bool = True,
+        interval: Optional[float] = None,
+    ) -> None:
+        """
+        Register a dependency check.
+
+        Args:
+            name: Service name reported in health responses
+            check: Coroutine function returning (healthy, details)
+            critical: Whether a failure makes the service unhealthy
+            interval: Seconds between runs (defaults to the global interval)
+        """
+        self._checks[name] = {
+            "check": check,
+            "critical": critical,
+            "interval": interval or settings.health_check_interval_seconds,
+        }
+
+    @property
+    def running(self) -> bool:
+        return any(not task.done() for task in self._tasks.values())
+
+    async def run_checks(self) -> None:
+        """Run every registered check once, concurrently."""
+        await asyncio.gather(*(self._run_check(name) for name in self._checks))
+
+    async def _run_check(self, name: str) -> None:
+        entry = self._checks[name]
+        start = time.perf_counter()
+        try:
+            healthy, details = await asyncio.wait_for(
+                entry["check"](), timeout=settings.health_check_timeout_seconds
+            )
+            error = None
+        except asyncio.TimeoutError:
+            healthy, details, error = False, {}, "timeout"
+        except Exception as e:
+            healthy, details, error = False, {}, str(e)
+
+        if not healthy:
+            logger.warning("Health check failed", service=name, error=error)
+
+        self.results[name] = {
+            "status": "healthy" if healthy else "unhealthy",
+            "critical": entry["critical"],
+            "latency_ms": round((time.perf_counter() - start) * 1000, 3),
+            "checked_at": datetime.now(timezone.utc).isoformat(),
+            "details": details,
+        }
+        if error:
+            self.results[name]["error"] = error
+
+    async def _run_periodically(self, name: str) -> None:
+        interval = self._checks[name]["interval"]
+        while True:
+            await asyncio.sleep(interval)
+            await self._run_check(name)
+
+    async def start(self) -> None:
+        """Run all checks once, then keep refreshing them in the background."""
+        if self.running:
+            return
+
+        await self.run_checks()
+        loop = asyncio.get_running_loop()
+        for name in self._checks:
+            self._tasks[name] = loop.create_task(self._run_periodically(name))
+
+    async def stop(self) -> None:
+        """Cancel background checks."""
+        for task in self._tasks.values():
+            task.cancel()
+        await asyncio.gather(*self._tasks.values(), return_exceptions=True)
+        self._tasks.clear()
+
+    def overall_status(self) -> str:
+        """Aggregate status: healthy, degraded, unhealthy or unknown."""
+        if not self.results:
+            return "unknown"
+
+        unhealthy = [r for r in self.results.values() if r["status"] != "healthy"]
+        if any(result["critical"] for result in unhealthy):
+            return "unhealthy"
+        return "degraded" if unhealthy else "healthy"
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Cached results plus current connection pool utilization."""
+        return {
+            "status": self.overall_status(),
+            "services": dict(self.results),
+            "pools": pool_collector.stats(),
+        }
+
+
+_llm_client = None
+
+
+async def check_vector_db() -> tuple[bool, Dict[str, Any]]:
+    """Check that the clause embeddings table can be queried."""
+    from agent_project.infrastructure.vector_db.client import get_vector_client
+
+    # The first call imports and builds the Supabase client; keep it off the loop
+    client = await asyncio.to_thread(get_vector_client)
+    return await client.health_check(), {}
+
+
+async def check_llm_providers() -> tuple[bool, Dict[str, Any]]:
+    """Check that the default LLM provider accepts our credentials."""
+    global _llm_client
+
+    if _llm_client is None:
+        from agent_project.infrastructure.llm.client import LLMClient
+
+        # Building the client imports the provider SDKs; keep it off the loop
+        _llm_client = await asyncio.to_thread(LLMClient)
+
+    providers = await _llm_client.health_check()
+    return providers.get(settings.default_llm_provider, False), {
+        "default_provider": settings.default_llm_provider,
+        "providers": providers,
+    }
+
+
+# Global health monitor instance
+health_monitor = HealthMonitor()
+health_monitor.register("vector_db", check_vector_db)
+health_monitor.register(
+    "llm_provider",
+    check_llm_providers,
+    critical=False,
+    interval=settings.health_llm_check_interval_seconds,
+)
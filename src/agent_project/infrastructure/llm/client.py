@@ -2,13 +2,19 @@
 LLM client for interfacing with various language model providers.
 """
 
-from typing import AsyncGenerator, Dict, Optional
+import asyncio
+import time
+from typing import AsyncGenerator, Dict, List, Optional
 
 import structlog
-from anthropic import AsyncAnthropic
-from openai import AsyncOpenAI
 
 from agent_project.config import settings
+from agent_project.core.utils.metrics import (
+    LLM_ERRORS,
+    LLM_REQUEST_DURATION,
+    LLM_TOKENS,
+)
+from agent_project.core.utils.tracing import annotate_span, traced
 
 logger = structlog.get_logger()
 
@@ -29,11 +35,21 @@ class LLMClient:
         self.openai_client = None
         self.anthropic_client = None
 
+        # Provider SDKs are large; only import the ones that are configured
         if settings.openai_api_key:
-            self.openai_client = AsyncOpenAI(api_key=settings.openai_api_key)
+            from openai import AsyncOpenAI
+
+            self.openai_client = AsyncOpenAI(
+                api_key=settings.openai_api_key, base_url=settings.openai_base_url
+            )
 
         if settings.anthropic_api_key:
-            self.anthropic_client = AsyncAnthropic(api_key=settings.anthropic_api_key)
+            from anthropic import AsyncAnthropic
+
+            self.anthropic_client = AsyncAnthropic(
+                api_key=settings.anthropic_api_key,
+                base_url=settings.anthropic_base_url,
+            )
 
         logger.info(
             "Initialized LLM client",
@@ -43,6 +59,7 @@ class LLMClient:
             anthropic_available=bool(self.anthropic_client),
         )
 
+    @traced("llm.generate")
     async def generate(
         self,
         prompt: str,
@@ -70,6 +87,8 @@ class LLMClient:
         """
         provider = provider or self.default_provider
         model = model or self.default_model
+        start = time.perf_counter()
+        annotate_span(provider=provider, model=model)
 
         try:
             logger.debug(
@@ -81,7 +100,7 @@ class LLMClient:
             )
 
             if provider == "openai" and self.openai_client:
-                return await self._generate_openai(
+                response = await self._generate_openai(
                     prompt=prompt,
                     system_message=system_message,
                     model=model,
@@ -91,7 +110,7 @@ class LLMClient:
                 )
 
             elif provider == "anthropic" and self.anthropic_client:
-                return await self._generate_anthropic(
+                response = await self._generate_anthropic(
                     prompt=prompt,
                     system_message=system_message,
                     model=model,
@@ -105,8 +124,14 @@ class LLMClient:
                     f"Provider '{provider}' not available or not configured"
                 )
 
+            LLM_REQUEST_DURATION.labels(provider, model, "generate").observe(
+                time.perf_counter() - start
+            )
+            return response
+
         except Exception as e:
             logger.error("LLM generation failed", provider=provider, error=str(e))
+            LLM_ERRORS.labels(provider, model, "generate").inc()
             raise
 
     async def _generate_openai(
@@ -134,6 +159,17 @@ class LLMClient:
             **kwargs,
         )
 
+        usage = getattr(response, "usage", None)
+        if usage is not None:
+            annotate_span(
+                prompt_tokens=usage.prompt_tokens,
+                completion_tokens=usage.completion_tokens,
+            )
+            LLM_TOKENS.labels("openai", model, "prompt").inc(usage.prompt_tokens or 0)
+            LLM_TOKENS.labels("openai", model, "completion").inc(
+                usage.completion_tokens or 0
+            )
+
         return response.choices[0].message.content
 
     async def _generate_anthropic(
@@ -145,21 +181,30 @@ class LLMClient:
         max_tokens: int = 1000,
         **kwargs,
     ) -> str:
-        """Generate response using Anthropic API."""
-        # Anthropic handles system messages differently
-        full_prompt = prompt
+        """Generate response using the Anthropic Messages API."""
         if system_message:
-            full_prompt = f"{system_message}\n\nUser: {prompt}\n\nAssistant:"
+            kwargs["system"] = system_message
 
-        response = await self.anthropic_client.completions.create(
+        response = await self.anthropic_client.messages.create(
             model=model,
-            prompt=full_prompt,
+            messages=[{"role": "user", "content": prompt}],
             temperature=temperature,
-            max_tokens_to_sample=max_tokens,
+            max_tokens=max_tokens,
             **kwargs,
         )
 
-        return response.completion
+        usage = getattr(response, "usage", None)
+        if usage is not None:
+            annotate_span(
+                prompt_tokens=usage.input_tokens,
+                completion_tokens=usage.output_tokens,
+            )
+            LLM_TOKENS.labels("anthropic", model, "prompt").inc(usage.input_tokens or 0)
+            LLM_TOKENS.labels("anthropic", model, "completion").inc(
+                usage.output_tokens or 0
+            )
+
+        return "".join(block.text for block in response.content if block.type == "text")
 
     async def stream_generate(
         self,
@@ -184,6 +229,7 @@ class LLMClient:
         """
         provider = provider or self.default_provider
         model = model or self.default_model
+        start = time.perf_counter()
 
         try:
             if provider == "openai" and self.openai_client:
@@ -206,8 +252,13 @@ class LLMClient:
             else:
                 raise ValueError(f"Provider '{provider}' not available")
 
+            LLM_REQUEST_DURATION.labels(provider, model, "stream").observe(
+                time.perf_counter() - start
+            )
+
         except Exception as e:
             logger.error("LLM streaming failed", provider=provider, error=str(e))
+            LLM_ERRORS.labels(provider, model, "stream").inc()
             yield f"Error: {str(e)}"
 
     async def _stream_openai(
@@ -233,6 +284,86 @@ class LLMClient:
             if chunk.choices[0].delta.content:
                 yield chunk.choices[0].delta.content
 
+    async def embed(self, text: str, model: Optional[str] = None) -> List[float]:
+        """
+        Embed text with the OpenAI embeddings API.
+
+        Args:
+            text: Text to embed
+            model: Embedding model (defaults to ``settings.embedding_model``)
+
+        Returns:
+            Embedding vector
+        """
+        return (await self.embed_many([text], model))[0]
+
+    @traced("llm.embed")
+    async def embed_many(
+        self, texts: List[str], model: Optional[str] = None
+    ) -> List[List[float]]:
+        """
+        Embed a batch of texts in one request.
+
+        Args:
+            texts: Texts to embed
+            model: Embedding model (defaults to ``settings.embedding_model``)
+
+        Returns:
+            One embedding vector per text, in input order
+        """
+        model = model or settings.embedding_model
+        if not self.openai_client:
+            raise ValueError("Embeddings require an OpenAI API key")
+
+        start = time.perf_counter()
+        try:
+            response = await self.openai_client.embeddings.create(
+                model=model, input=texts
+            )
+        except Exception as e:
+            logger.error("Embedding request failed", model=model, error=str(e))
+            LLM_ERRORS.labels("openai", model, "embed").inc()
+            raise
+
+        LLM_REQUEST_DURATION.labels("openai", model, "embed").observe(
+            time.perf_counter() - start
+        )
+        if response.usage:
+            LLM_TOKENS.labels("openai", model, "prompt").inc(
+                response.usage.prompt_tokens or 0
+            )
+        return [item.embedding for item in sorted(response.data, key=lambda d: d.index)]
+
+    async def health_check(self) -> Dict[str, bool]:
+        """
+        Check that each configured provider accepts our credentials.
+
+        Uses the model listing endpoints, which are free and do not
+        consume tokens.
+
+        Returns:
+            Mapping of configured provider name to health
+        """
+        checks = {}
+        if self.openai_client:
+            checks["openai"] = self.openai_client.models.list()
+        if self.anthropic_client:
+            checks["anthropic"] = self.anthropic_client.models.list(limit=1)
+
+        results = await asyncio.gather(*checks.values(), return_exceptions=True)
+
+        health = {}
+        for provider, result in zip(checks, results):
+            health[provider] = not isinstance(result, Exception)
+            if not health[provider]:
+                logger.warning(
+                    "LLM provider health check failed",
+                    provider=provider,
+                    error=str(result),
+                )
+
+        return health
+
     def get_available_providers(self) -> Dict[str, bool]:
         """Get list of available LLM providers."""
         return {
@@ -2,7 +2,7 @@
 Vector database and session memory infrastructure.
 """
 
-from .client import VectorDBClient
+from .client import VectorDBClient, get_vector_client
 from .session_memory import ChatMessage, SessionMemoryClient
 
-__all__ = ["VectorDBClient", "SessionMemoryClient", "ChatMessage"]
+__all__ = ["VectorDBClient", "get_vector_client", "SessionMemoryClient", "ChatMessage"]
@@ -0,0 +1,286 @@
+"""
+Versioned on-disk snapshot of clause embeddings, loaded via mmap.
+
+Layout of an artifact root::
+
+    CURRENT                     name of the active version
+    <version>/manifest.json     counts, dimensions, model, clause_type ranges
+    <version>/embeddings.npy    float32 (count, dim), L2-normalised rows
+    <version>/records.jsonl     one JSON object of content + metadata per row
+    <version>/offsets.npy       uint64 (count + 1,) byte offsets into records
+
+Rows are sorted by ``clause_type`` so each clause type is a contiguous slice
+of the matrix, which makes filtered access a zero-copy view. The version is a
+digest of the exported rows, so re-exporting an unchanged table is a no-op.
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import shutil
+import uuid
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
+
+import structlog
+
+from agent_project.config import settings
+
+if TYPE_CHECKING:
+    import numpy as np
+
+logger = structlog.get_logger()
+
+ARTIFACT_FORMAT = 1
+CURRENT_FILE = "CURRENT"
+
+# Metadata columns exported alongside each embedding
+RECORD_FIELDS = (
+    "id",
+    "content",
+    "clause_type",
+    "source",
+    "section",
+    "page_number",
+    "document_id",
+)
+
+
+def read_current_version(root: Path) -> Optional[str]:
+    """Return the active version name under an artifact root, if any."""
+    try:
+        return (Path(root) / CURRENT_FILE).read_text().strip() or None
+    except FileNotFoundError:
+        return None
+
+
+class ArtifactWriter:
+    """
+    Streams rows into a new artifact version.
+
+    Rows must be added in ``clause_type`` order. Call ``finish`` to publish
+    the version, or ``abort`` to discard it.
+    """
+
+    def __init__(self, root: Path, count: int, dim: int, embedding_model: str):
+        import numpy as np
+
+        self.root = Path(root)
+        self.count = count
+        self.dim = dim
+        self.embedding_model = embedding_model
+
+        self.root.mkdir(parents=True, exist_ok=True)
+        self._tmp_dir = self.root / f".tmp-{uuid.uuid4().hex}"
+        self._tmp_dir.mkdir()
+
+        self._embeddings = np.lib.format.open_memmap(
+            self._tmp_dir / "embeddings.npy",
+            mode="w+",
+            dtype=np.float32,
+            shape=(count, dim),
+        )
+        self._offsets = np.zeros(count + 1, dtype=np.uint64)
+        self._records = open(self._tmp_dir / "records.jsonl", "wb")
+        self._ranges: Dict[str, list] = {}
+        self._digest = hashlib.sha256()
+        self._row = 0
+
+    def add(self, record: Dict[str, Any], embedding: "np.ndarray") -> None:
+        """
+        Append one row.
+
+        Args:
+            record: Row metadata with the keys in ``RECORD_FIELDS``
+            embedding: Embedding vector of length ``dim``
+
+        Raises:
+            ValueError: On dimension mismatch, too many rows or out-of-order
+                clause types
+        """
+        import numpy as np
+
+        if self._row >= self.count:
+            raise ValueError(f"More rows than the declared count of {self.count}")
+
+        vector = np.asarray(embedding, dtype=np.float32)
+        if vector.shape != (self.dim,):
+            raise ValueError(f"Expected {self.dim} dimensions, got {vector.shape}")
+
+        norm = np.linalg.norm(vector)
+        self._embeddings[self._row] = vector / norm if norm else vector
+
+        clause_type = record.get("clause_type") or ""
+        if clause_type in self._ranges:
+            if self._ranges[clause_type][1] != self._row:
+                raise ValueError("Rows must be sorted by clause_type")
+            self._ranges[clause_type][1] += 1
+        else:
+            self._ranges[clause_type] = [self._row, self._row + 1]
+
+        line = json.dumps(
+            {field: record.get(field) for field in RECORD_FIELDS}, default=str
+        ).encode()
+        self._records.write(line + b"\n")
+        self._offsets[self._row + 1] = self._offsets[self._row] + len(line) + 1
+
+        self._digest.update(line)
+        self._digest.update(vector.tobytes())
+        self._row += 1
+
+    def finish(self) -> str:
+        """
+        Publish the artifact and make it the current version.
+
+        Returns:
+            The version name
+        """
+        import numpy as np
+
+        if self._row != self.count:
+            self.abort()
+            raise ValueError(f"Expected {self.count} rows, got {self._row}")
+
+        self._records.close()
+        self._embeddings.flush()
+        del self._embeddings
+        np.save(self._tmp_dir / "offsets.npy", self._offsets)
+
+        version = self._digest.hexdigest()[:16]
+        manifest = {
+            "format": ARTIFACT_FORMAT,
+            "version": version,
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "count": self.count,
+            "dim": self.dim,
+            "embedding_model": self.embedding_model,
+            "clause_types": {
+                clause_type: bounds for clause_type, bounds in self._ranges.items()
+            },
+        }
+        (self._tmp_dir / "manifest.json").write_text(json.dumps(manifest, indent=2))
+
+        version_dir = self.root / version
+        if version_dir.exists():
+            # Unchanged corpus: keep the existing copy
+            shutil.rmtree(self._tmp_dir)
+        else:
+            self._tmp_dir.rename(version_dir)
+
+        current_tmp = self.root / f"{CURRENT_FILE}.tmp"
+        current_tmp.write_text(version)
+        os.replace(current_tmp, self.root / CURRENT_FILE)
+        return version
+
+    def abort(self) -> None:
+        """Discard the partially written artifact."""
+        if not self._records.closed:
+            self._records.close()
+        shutil.rmtree(self._tmp_dir, ignore_errors=True)
+
+
+class EmbeddingArtifact:
+    """
+    Read-only view of one artifact version.
+
+    The embedding matrix, offsets and records are memory-mapped, so opening
+    is near-instant regardless of size and pages are shared between worker
+    processes through the OS page cache.
+    """
+
+    def __init__(self, path: Path):
+        import numpy as np
+
+        self.path = Path(path)
+        self.manifest = json.loads((self.path / "manifest.json").read_text())
+        if self.manifest.get("format") != ARTIFACT_FORMAT:
+            raise ValueError(
+                f"Unsupported artifact format {self.manifest.get('format')}"
+            )
+
+        self.version: str = self.manifest["version"]
+        self.embeddings = np.load(self.path / "embeddings.npy", mmap_mode="r")
+        self._offsets = np.load(self.path / "offsets.npy", mmap_mode="r")
+        self._records_file = open(self.path / "records.jsonl", "rb")
+        self._records = (
+            mmap.mmap(self._records_file.fileno(), 0, access=mmap.ACCESS_READ)
+            if self.manifest["count"]
+            else b""
+        )
+
+    @classmethod
+    def open(cls, root: Path) -> "EmbeddingArtifact":
+        """
+        Open the current version under an artifact root.
+
+        Raises:
+            FileNotFoundError: If no version has been published
+        """
+        version = read_current_version(root)
+        if version is None:
+            raise FileNotFoundError(f"No embedding artifact published in {root}")
+        return cls(Path(root) / version)
+
+    def __len__(self) -> int:
+        return self.manifest["count"]
+
+    @property
+    def dim(self) -> int:
+        return self.manifest["dim"]
+
+    @property
+    def clause_types(self) -> Dict[str, Tuple[int, int]]:
+        return {
+            ct: tuple(bounds) for ct, bounds in self.manifest["clause_types"].items()
+        }
+
+    def row_range(self, clause_type: Optional[str] = None) -> Tuple[int, int]:
+        """Rows ``[start, end)`` holding a clause type (all rows for None)."""
+        if clause_type is None:
+            return 0, len(self)
+        return tuple(self.manifest["clause_types"].get(clause_type, (0, 0)))
+
+    def vectors(self, clause_type: Optional[str] = None) -> "np.ndarray":
+        """Zero-copy view of the normalised embeddings for a clause type."""
+        start, end = self.row_range(clause_type)
+        return self.embeddings[start:end]
+
+    def record(self, row: int) -> Dict[str, Any]:
+        """Decode the metadata record for a row."""
+        start, end = int(self._offsets[row]), int(self._offsets[row + 1])
+        return json.loads(self._records[start:end])
+
+    def close(self) -> None:
+        """Release the memory maps."""
+        if isinstance(self._records, mmap.mmap):
+            self._records.close()
+        self._records_file.close()
+
+
+def load_embedding_artifact() -> Optional[EmbeddingArtifact]:
+    """
+    Open the current artifact under ``EMBEDDING_ARTIFACT_PATH``.
+
+    Returns:
+        The loaded artifact, or None if no path is configured
+    """
+    if not settings.embedding_artifact_path:
+        return None
+
+    artifact = EmbeddingArtifact.open(Path(settings.embedding_artifact_path))
+    if artifact.manifest.get("embedding_model") != settings.embedding_model:
+        logger.warning(
+            "Embedding artifact was built with a different model",
+            artifact_model=artifact.manifest.get("embedding_model"),
+            configured_model=settings.embedding_model,
+        )
+
+    logger.info(
+        "Loaded embedding artifact",
+        version=artifact.version,
+        count=len(artifact),
+        dim=artifact.dim,
+    )
+    return artifact
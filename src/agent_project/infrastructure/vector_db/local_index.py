@@ -0,0 +1,235 @@
+"""
+In-process approximate nearest-neighbour search over the embedding artifact.
+
+Each clause type gets its own IVF index (spherical k-means centroids with
+inverted lists of rows), so filtered searches only ever look at rows of the
+requested clause type and never lose recall to post-filtering. Small clause
+types are searched exactly. Vectors are read straight from the artifact's
+memory map; the index itself only holds centroids and row orderings.
+"""
+
+import asyncio
+import math
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+import structlog
+
+from agent_project.config import settings
+from agent_project.infrastructure.vector_db.artifact import (
+    EmbeddingArtifact,
+    load_embedding_artifact,
+    read_current_version,
+)
+
+if TYPE_CHECKING:
+    import numpy as np
+
+logger = structlog.get_logger()
+
+# Clause types with at most this many rows are searched exactly
+EXACT_SEARCH_MAX_ROWS = 2048
+
+# Rows sampled per centroid when training k-means
+TRAINING_ROWS_PER_LIST = 64
+
+
+def _spherical_kmeans(
+    vectors: "np.ndarray", k: int, iterations: int = 10, seed: int = 0
+) -> "np.ndarray":
+    """Train k unit-norm centroids on (a sample of) unit-norm vectors."""
+    import numpy as np
+
+    rng = np.random.default_rng(seed)
+    sample_size = min(len(vectors), k * TRAINING_ROWS_PER_LIST)
+    sample = np.asarray(
+        vectors[np.sort(rng.choice(len(vectors), sample_size, replace=False))]
+    )
+    centroids = sample[rng.choice(sample_size, k, replace=False)].copy()
+
+    for _ in range(iterations):
+        assignment = np.argmax(sample @ centroids.T, axis=1)
+        sums = np.zeros_like(centroids)
+        np.add.at(sums, assignment, sample)
+        norms = np.linalg.norm(sums, axis=1, keepdims=True)
+        # Keep the previous centroid for lists that lost all their members
+        centroids = np.where(norms > 0, sums / np.maximum(norms, 1e-12), centroids)
+
+    return centroids.astype(np.float32)
+
+
+class _Segment:
+    """IVF index over the contiguous rows of one clause type."""
+
+    def __init__(self, vectors: "np.ndarray", offset: int, nlist: Optional[int]):
+        import numpy as np
+
+        self.vectors = vectors
+        self.offset = offset
+        self.centroids = None
+
+        if len(vectors) <= EXACT_SEARCH_MAX_ROWS:
+            return
+
+        nlist = nlist or max(1, int(math.sqrt(len(vectors))))
+        self.centroids = _spherical_kmeans(vectors, nlist)
+
+        assignment = np.empty(len(vectors), dtype=np.int32)
+        for start in range(0, len(vectors), 8192):
+            end = start + 8192
+            chunk = np.asarray(vectors[start:end])
+            assignment[start:end] = np.argmax(chunk @ self.centroids.T, axis=1)
+        self.order = np.argsort(assignment, kind="stable").astype(np.int32)
+        self.bounds = np.searchsorted(assignment[self.order], np.arange(nlist + 1))
+
+    def search(
+        self, query: "np.ndarray", limit: int, nprobe: int
+    ) -> Tuple["np.ndarray", "np.ndarray"]:
+        """Top ``limit`` (scores, artifact rows) for a unit-norm query."""
+        import numpy as np
+
+        if self.centroids is None:
+            candidates = None
+            scores = self.vectors @ query
+        else:
+            probes = np.argsort(self.centroids @ query)[::-1][:nprobe]
+            lists = [slice(self.bounds[p], self.bounds[p + 1]) for p in probes]
+            candidates = np.concatenate([self.order[span] for span in lists])
+            candidates.sort()
+            scores = self.vectors[candidates] @ query
+
+        if len(scores) > limit:
+            top = np.argpartition(scores, -limit)[-limit:]
+        else:
+            top = np.arange(len(scores))
+
+        rows = top if candidates is None else candidates[top]
+        return scores[top], rows + self.offset
+
+
+class LocalVectorIndex:
+    """Per-clause-type IVF indexes over one artifact version."""
+
+    def __init__(self, artifact: EmbeddingArtifact, nlist: Optional[int] = None):
+        self.artifact = artifact
+        self.version = artifact.version
+        self._segments: Dict[str, _Segment] = {
+            clause_type: _Segment(artifact.vectors(clause_type), start, nlist)
+            for clause_type, (start, _) in artifact.clause_types.items()
+        }
+
+    def search(
+        self,
+        query_vector: List[float],
+        clause_type: Optional[str] = None,
+        limit: int = 10,
+        similarity_threshold: float = 0.0,
+        nprobe: Optional[int] = None,
+    ) -> List[Tuple[int, float]]:
+        """
+        Find the rows most similar to a query embedding.
+
+        Args:
+            query_vector: Query embedding (need not be normalised)
+            clause_type: Optional clause type filter
+            limit: Maximum number of results
+            similarity_threshold: Minimum cosine similarity
+            nprobe: Inverted lists to scan per clause type
+
+        Returns:
+            (artifact row, cosine similarity) pairs, most similar first
+        """
+        import numpy as np
+
+        query = np.asarray(query_vector, dtype=np.float32)
+        norm = np.linalg.norm(query)
+        if norm:
+            query = query / norm
+
+        if clause_type is not None:
+            segment = self._segments.get(clause_type)
+            segments = [segment] if segment is not None else []
+        else:
+            segments = list(self._segments.values())
+
+        nprobe = nprobe or settings.local_vector_index_nprobe
+        found = [segment.search(query, limit, nprobe) for segment in segments]
+        if not found:
+            return []
+
+        scores = np.concatenate([scores for scores, _ in found])
+        rows = np.concatenate([rows for _, rows in found])
+        keep = scores >= similarity_threshold
+        scores, rows = scores[keep], rows[keep]
+
+        best = np.argsort(scores)[::-1][:limit]
+        return [(int(rows[i]), float(scores[i])) for i in best]
+
+    def results(
+        self, matches: List[Tuple[int, float]]
+    ) -> List[Tuple[Dict[str, Any], float]]:
+        """Attach artifact records to search matches."""
+        return [(self.artifact.record(row), score) for row, score in matches]
+
+
+class LocalIndexManager:
+    """
+    Owns the current local index and swaps in a new one when the artifact
+    root publishes a new version.
+    """
+
+    def __init__(self):
+        self.index: Optional[LocalVectorIndex] = None
+        self._task: Optional[asyncio.Task] = None
+
+    async def start(self) -> None:
+        """Build the index, then watch the artifact root for new versions."""
+        # Watch first so a failed initial load is retried
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._watch())
+        await self.reload()
+
+    async def reload(self) -> bool:
+        """
+        Rebuild the index if the published version changed.
+
+        Returns:
+            True if a new index was swapped in
+        """
+        root = Path(settings.embedding_artifact_path)
+        version = read_current_version(root)
+        if version is None or (self.index and self.index.version == version):
+            return False
+
+        artifact = await asyncio.to_thread(load_embedding_artifact)
+        index = await asyncio.to_thread(LocalVectorIndex, artifact)
+        # The previous version is not closed: in-flight searches may still hold
+        # it, and its maps are released once the last reference goes away
+        self.index = index
+
+        logger.info(
+            "Local vector index loaded",
+            version=index.version,
+            rows=len(artifact),
+            clause_types=len(artifact.clause_types),
+        )
+        return True
+
+    async def _watch(self) -> None:
+        while True:
+            await asyncio.sleep(settings.local_vector_index_reload_interval_seconds)
+            try:
+                await self.reload()
+            except Exception as e:
+                logger.error("Local vector index reload failed", error=str(e))
+
+    async def stop(self) -> None:
+        """Stop watching for new versions."""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+
+# Global local index manager instance
+local_index = LocalIndexManager()
@@ -0,0 +1,138 @@
+"""
+Cache of vector search results.
+
+Keys hash the query embedding, quantized to int8 so that embeddings differing
+only in float noise share an entry, together with every parameter that
+changes the result set: clause type, limit, similarity threshold and storage
+mode. When no embedding is available (RPC-only deployments), the normalised
+query text stands in for it.
+
+Entries expire after a TTL, the least recently used are evicted beyond the
+size bound, and everything is dropped when the corpus version changes.
+"""
+
+import hashlib
+import struct
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+import structlog
+
+from agent_project.config import settings
+from agent_project.core.utils.metrics import VECTOR_CACHE_REQUESTS
+
+logger = structlog.get_logger()
+
+
+def _quantize(embedding: Sequence[float]) -> bytes:
+    """Scale an embedding to unit length and round it to int8."""
+    norm = sum(x * x for x in embedding) ** 0.5 or 1.0
+    return struct.pack(
+        f"{len(embedding)}b",
+        *(max(-127, min(127, round(x / norm * 127))) for x in embedding),
+    )
+
+
+class VectorResultCache:
+    """Size-bounded, TTL-based cache of raw search rows."""
+
+    def __init__(self):
+        # Key -> (expiry, rows), least recently used first
+        self._entries: "OrderedDict[str, Tuple[float, List[Dict[str, Any]]]]" = (
+            OrderedDict()
+        )
+        self.corpus_version: Optional[str] = None
+
+    @property
+    def enabled(self) -> bool:
+        return (
+            settings.vector_result_cache_ttl_seconds > 0
+            and settings.vector_result_cache_max_entries > 0
+        )
+
+    @staticmethod
+    def key(
+        query: Union[str, Sequence[float]],
+        clause_type: Optional[str],
+        limit: int,
+        similarity_threshold: float,
+    ) -> str:
+        """
+        Build the cache key for a search.
+
+        Args:
+            query: Query embedding, or the query text if none is available
+            clause_type: Clause type filter
+            limit: Maximum number of results
+            similarity_threshold: Minimum similarity score
+
+        Returns:
+            Hex digest identifying the search
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        if isinstance(query, str):
+            digest.update(b"text:" + " ".join(query.lower().split()).encode())
+        else:
+            digest.update(b"embedding:" + _quantize(query))
+        digest.update(
+            f"|{clause_type}|{limit}|{similarity_threshold:.4f}|"
+            f"{settings.vector_quantization}".encode()
+        )
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[List[Dict[str, Any]]]:
+        """Return cached rows for a key, if present and not expired."""
+        entry = self._entries.get(key)
+        if entry is None or time.monotonic() >= entry[0]:
+            if entry is not None:
+                del self._entries[key]
+            VECTOR_CACHE_REQUESTS.labels("miss").inc()
+            return None
+
+        self._entries.move_to_end(key)
+        VECTOR_CACHE_REQUESTS.labels("hit").inc()
+        return entry[1]
+
+    def put(self, key: str, rows: List[Dict[str, Any]]) -> None:
+        """Cache the rows of a search."""
+        if not self.enabled:
+            return
+
+        expires_at = time.monotonic() + settings.vector_result_cache_ttl_seconds
+        self._entries[key] = (expires_at, rows)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > settings.vector_result_cache_max_entries:
+            self._entries.popitem(last=False)
+
+    def set_corpus_version(self, version: Optional[str]) -> None:
+        """Record the corpus version, dropping all entries if it changed."""
+        if version == self.corpus_version:
+            return
+
+        if self._entries:
+            logger.info(
+                "Corpus changed, clearing vector result cache",
+                previous=self.corpus_version,
+                current=version,
+                entries=len(self._entries),
+            )
+            self._entries.clear()
+        self.corpus_version = version
+
+    def clear(self) -> None:
+        """Drop all cached results."""
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "entries": len(self._entries),
+            "max_entries": settings.vector_result_cache_max_entries,
+            "ttl_seconds": settings.vector_result_cache_ttl_seconds,
+            "corpus_version": self.corpus_version,
+        }
+
+
+# Global vector result cache instance
+vector_result_cache = VectorResultCache()
@@ -0,0 +1,246 @@
+"""
+In-memory index of clause sections for direct lookups.
+
+Maps normalised section references ("B1.3.2", "E2/AS1") to the rows of
+``clause_embeddings`` that carry them. Only metadata is held in memory;
+content is fetched by primary key when a lookup matches, so a request such
+as "show me B1.3.2" is answered without embedding, ANN search or an LLM
+call.
+"""
+
+import asyncio
+import re
+from bisect import bisect_left
+from typing import Any, Dict, List, Optional, Tuple
+
+import structlog
+
+from agent_project.config import settings
+
+logger = structlog.get_logger()
+
+# Building code references: clause (B1, B1.3.2) with an optional Acceptable
+# Solution or Verification Method suffix (E2/AS1)
+SECTION_REFERENCE = re.compile(
+    r"\b([A-H]\d{1,2}(?:\.\d{1,3})*(?:/(?:AS|VM)\d{1,2})?)\b", re.IGNORECASE
+)
+
+# Words that may surround a reference in a pure lookup request
+LOOKUP_WORDS = {
+    "a",
+    "acceptable",
+    "building",
+    "clause",
+    "code",
+    "display",
+    "does",
+    "find",
+    "for",
+    "full",
+    "get",
+    "give",
+    "is",
+    "look",
+    "lookup",
+    "me",
+    "method",
+    "nzbc",
+    "of",
+    "open",
+    "please",
+    "read",
+    "say",
+    "says",
+    "section",
+    "show",
+    "solution",
+    "text",
+    "the",
+    "up",
+    "verification",
+    "what",
+}
+
+MAX_LOOKUP_ROWS = 200
+
+
+def normalize_section(section: str) -> str:
+    """Canonical form of a section reference ("clause b1.3.2 Loads" -> "B1.3.2")."""
+    match = SECTION_REFERENCE.search(section)
+    if match is not None:
+        return match.group(1).upper()
+    return " ".join(section.upper().split())
+
+
+def match_clause_reference(query: str) -> Optional[str]:
+    """
+    Detect a query that only asks for a specific clause.
+
+    Args:
+        query: User query
+
+    Returns:
+        The normalised reference for queries like "show me B1.3.2" or
+        "E2/AS1", None for anything else (including questions that merely
+        mention a clause)
+    """
+    references = SECTION_REFERENCE.findall(query)
+    if len(references) != 1:
+        return None
+
+    remainder = re.findall(r"[a-z]+", SECTION_REFERENCE.sub(" ", query).lower())
+    if any(word not in LOOKUP_WORDS for word in remainder):
+        return None
+    return references[0].upper()
+
+
+def _sort_key(section: str) -> Tuple[Tuple[int, Any], ...]:
+    """Natural order, so B1.3.10 follows B1.3.2."""
+    return tuple(
+        (0, int(part)) if part.isdigit() else (1, part)
+        for part in re.findall(r"\d+|[A-Z]+", section)
+    )
+
+
+class SectionIndex:
+    """Section reference -> row metadata, with prefix lookups."""
+
+    def __init__(self, rows: List[Dict[str, Any]], version: Optional[str] = None):
+        self.version = version
+        self._entries: Dict[str, List[Dict[str, Any]]] = {}
+        for row in rows:
+            self._entries.setdefault(normalize_section(row["section"]), []).append(row)
+        for entries in self._entries.values():
+            entries.sort(key=lambda row: (row.get("page_number") or 0, row["id"]))
+        self._keys = sorted(self._entries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def titles(self) -> Dict[str, str]:
+        """Heading of each section: its first row's section label or first line."""
+        titles = {}
+        for key, rows in self._entries.items():
+            label = " ".join(rows[0]["section"].split())
+            line = " ".join((rows[0].get("title") or "").split())
+            if normalize_section(label) == label.upper() and line:
+                # Bare reference: take the heading from the content
+                if not line.upper().startswith(key):
+                    line = f"{key} {line}"
+                label = line
+            titles[key] = label
+        return titles
+
+    def subsections(self, section: str) -> List[str]:
+        """Indexed sections below a reference (B1.3 -> B1.3.1, B1.3.2, ...)."""
+        children = []
+        for prefix in (f"{section}.", f"{section}/"):
+            i = bisect_left(self._keys, prefix)
+            while i < len(self._keys) and self._keys[i].startswith(prefix):
+                children.append(self._keys[i])
+                i += 1
+        return sorted(children, key=_sort_key)
+
+    def lookup(
+        self, section: str, include_subsections: bool = True
+    ) -> List[Dict[str, Any]]:
+        """
+        Rows for a section reference.
+
+        Args:
+            section: Section reference in any casing or spacing
+            include_subsections: Also return rows of nested sections
+
+        Returns:
+            Row metadata, the section itself first and nested sections in
+            natural order
+        """
+        key = normalize_section(section)
+        rows = list(self._entries.get(key, []))
+        if include_subsections:
+            for child in self.subsections(key):
+                rows.extend(self._entries[child])
+        return rows
+
+
+class SectionIndexManager:
+    """
+    Owns the current section index and reloads it when the corpus changes.
+    """
+
+    def __init__(self):
+        self.index: Optional[SectionIndex] = None
+        self._task: Optional[asyncio.Task] = None
+
+    async def start(self) -> None:
+        """Load the index, then watch for corpus changes."""
+        # Watch first so a failed initial load is retried
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._watch())
+        await self.reload()
+
+    async def reload(self) -> bool:
+        """
+        Rebuild the index if the corpus version changed.
+
+        Returns:
+            True if a new index was swapped in
+        """
+        from agent_project.infrastructure.vector_db.client import get_vector_client
+
+        client = get_vector_client()
+        version = await client.get_corpus_version()
+        if self.index is not None and version and self.index.version == version:
+            return False
+
+        index = SectionIndex(await client.list_sections(), version)
+        self.index = index
+
+        logger.info("Section index loaded", version=version, sections=len(index))
+        return True
+
+    async def _watch(self) -> None:
+        while True:
+            await asyncio.sleep(settings.section_index_reload_interval_seconds)
+            try:
+                await self.reload()
+            except Exception as e:
+                logger.error("Section index reload failed", error=str(e))
+
+    async def lookup(
+        self, section: str, include_subsections: bool = True
+    ) -> List[Dict[str, Any]]:
+        """
+        Clauses for a section reference, with content.
+
+        Args:
+            section: Section reference
+            include_subsections: Also return nested sections
+
+        Returns:
+            Matching rows (at most ``MAX_LOOKUP_ROWS``); empty if the index
+            is not loaded or nothing matches
+        """
+        if self.index is None:
+            return []
+
+        entries = self.index.lookup(section, include_subsections)
+        if not entries:
+            return []
+
+        from agent_project.infrastructure.vector_db.client import get_vector_client
+
+        return await get_vector_client().get_clauses(
+            [entry["id"] for entry in entries[:MAX_LOOKUP_ROWS]]
+        )
+
+    async def stop(self) -> None:
+        """Stop watching for corpus changes."""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+
+# Global section index manager instance
+section_index = SectionIndexManager()
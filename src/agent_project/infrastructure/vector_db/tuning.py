@@ -0,0 +1,84 @@
+"""
+Tuned ANN search parameters per clause type.
+
+tools/tune_vector_search.py measures recall against an exact scan and saves
+the cheapest ``ef_search``/``probes`` meeting a target recall for each clause
+type to ``VECTOR_SEARCH_TUNING_PATH``. Clause types without a tuned entry
+fall back to ``VECTOR_HNSW_EF_SEARCH`` and ``VECTOR_IVFFLAT_PROBES``.
+
+File format::
+
+    {
+        "target_recall": 0.95,
+        "k": 10,
+        "tuned_at": "...",
+        "clause_types": {
+            "code_b": {"ef_search": 40, "probes": 5, "recall": 0.97, "p50_ms": 1.8}
+        }
+    }
+"""
+
+import json
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import structlog
+
+from agent_project.config import settings
+
+logger = structlog.get_logger()
+
+_tuning: Optional[Dict[str, Any]] = None
+_tuning_path: Optional[str] = None
+
+
+def load_search_tuning(path: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Load tuned search parameters, replacing any previously loaded ones.
+
+    Args:
+        path: Tuning file (defaults to ``VECTOR_SEARCH_TUNING_PATH``)
+
+    Returns:
+        The tuning document, empty if no file is configured or readable
+    """
+    global _tuning, _tuning_path
+
+    path = path or settings.vector_search_tuning_path
+    tuning: Dict[str, Any] = {}
+    if path:
+        try:
+            tuning = json.loads(Path(path).read_text())
+            logger.info(
+                "Loaded vector search tuning",
+                path=path,
+                clause_types=len(tuning.get("clause_types", {})),
+                target_recall=tuning.get("target_recall"),
+            )
+        except (OSError, ValueError) as e:
+            logger.warning(
+                "Could not load vector search tuning", path=path, error=str(e)
+            )
+
+    _tuning, _tuning_path = tuning, path
+    return tuning
+
+
+def get_search_params(clause_type: Optional[str]) -> Dict[str, int]:
+    """
+    ANN parameters to use for a search.
+
+    Args:
+        clause_type: Clause type filter of the search, if any
+
+    Returns:
+        ``ef_search`` and ``probes`` for the clause type
+    """
+    if _tuning is None or _tuning_path != settings.vector_search_tuning_path:
+        load_search_tuning()
+
+    tuned = _tuning.get("clause_types", {}).get(clause_type or "", {})
+    return {
+        "ef_search": int(tuned.get("ef_search", settings.vector_hnsw_ef_search)),
+        "probes": int(tuned.get("probes", settings.vector_ivfflat_probes)),
+    }
@@ -157,3 +157,5 @@ def override_settings():
     settings.jwt_secret_key = "test-secret-key"
     settings.enable_metrics = False
     settings.log_level = "WARNING"  # Reduce log noise during testing
+    # Searches must not be answered from results cached by another test
+    settings.vector_result_cache_ttl_seconds = 0
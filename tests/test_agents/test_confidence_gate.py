@@ -0,0 +1,113 @@
+"""
+Tests for retrieval confidence gating in specialist agents.
+"""
+
+import json
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from agent_project.core.agents.code_b.agent import CodeBAgent
+from agent_project.core.agents.code_h.agent import CodeHAgent
+from agent_project.core.tools import confidence_gate, context_assembler
+from agent_project.core.utils.metrics import RETRIEVAL_CONFIDENCE_GATE
+
+MODEL = "gpt-4-turbo-preview"
+
+
+def gate_count(clause_type: str, outcome: str) -> float:
+    return RETRIEVAL_CONFIDENCE_GATE.labels(clause_type, outcome)._value.get()
+
+
+@pytest.fixture
+def agent():
+    """Code B agent with a mocked LLM client and estimated token counts."""
+    with patch.object(context_assembler, "_tiktoken_unavailable", True):
+        counter = context_assembler.TokenCounter(MODEL)
+    agent = CodeBAgent()
+    agent.llm_client = AsyncMock(default_model=MODEL)
+    agent.llm_client.generate.return_value = "Answer from the LLM"
+    with patch.dict(context_assembler._counters, {MODEL: counter}):
+        yield agent
+
+
+@pytest.fixture
+def thresholds(tmp_path):
+    """Calibrated threshold of 0.85 for code_b."""
+    path = tmp_path / "confidence.json"
+    path.write_text(json.dumps({"clause_types": {"code_b": {"min_score": 0.85}}}))
+    with patch.object(confidence_gate.settings, "retrieval_confidence_path", str(path)):
+        yield path
+
+
+class TestConfidenceGate:
+    """Test suite for skipping generation on unconfident retrieval."""
+
+    @pytest.mark.asyncio
+    async def test_empty_context_skips_llm(self, agent):
+        """Test no context returns the canned answer and counts the outcome."""
+        before = gate_count("code_b", "no_context")
+
+        response = await agent.generate_response("Best paint colour?", context=[])
+
+        agent.llm_client.generate.assert_not_called()
+        assert response == (
+            "I don’t know.\n\nFor more detail, see "
+            "https://www.building.govt.nz/building-code-compliance/b-stability"
+        )
+        assert gate_count("code_b", "no_context") == before + 1
+
+    @pytest.mark.asyncio
+    async def test_retrieval_error_is_counted_separately(self, agent):
+        """Test a failed search is gated but not counted as no context."""
+        agent.vector_client = AsyncMock()
+        agent.vector_client.similarity_search.side_effect = ConnectionError("down")
+        no_context = gate_count("code_b", "no_context")
+        errors = gate_count("code_b", "retrieval_error")
+
+        context = await agent.retrieve_context("Bracing?")
+        response = await agent.generate_response("Bracing?", context=context)
+
+        agent.llm_client.generate.assert_not_called()
+        assert response.startswith("I don’t know.")
+        assert gate_count("code_b", "retrieval_error") == errors + 1
+        assert gate_count("code_b", "no_context") == no_context
+
+    @pytest.mark.asyncio
+    async def test_calibrated_threshold(self, agent, thresholds):
+        """Test context below the clause type's threshold is gated."""
+        low = [{"content": "Paint", "similarity_score": 0.82}]
+        high = [{"content": "Loads", "similarity_score": 0.9}, *low]
+
+        assert (await agent.generate_response("q", context=low)).startswith(
+            "I don’t know."
+        )
+        assert await agent.generate_response("q", context=high) == (
+            "Answer from the LLM"
+        )
+        agent.llm_client.generate.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_no_context_argument_is_not_gated(self, agent):
+        """Test prompts generated without retrieval still reach the LLM."""
+        assert await agent.generate_response("Hello") == "Answer from the LLM"
+
+    @pytest.mark.asyncio
+    async def test_gate_can_be_disabled(self, agent):
+        """Test the LLM is called for empty context when gating is off."""
+        with patch.object(
+            confidence_gate.settings, "retrieval_confidence_gate_enabled", False
+        ):
+            assert await agent.generate_response("q", context=[]) == (
+                "Answer from the LLM"
+            )
+
+    def test_threshold_fallback(self, thresholds):
+        """Test uncalibrated clause types use the configured default."""
+        assert confidence_gate.get_confidence_threshold("code_b") == 0.85
+        with patch.object(confidence_gate.settings, "retrieval_min_confidence", 0.7):
+            assert confidence_gate.get_confidence_threshold("code_c") == 0.7
+
+    def test_fallback_response_per_specialist(self):
+        """Test each specialist's reference link comes from its system message."""
+        assert CodeHAgent().get_fallback_response().endswith("h-energy-efficiency")
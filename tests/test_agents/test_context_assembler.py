@@ -0,0 +1,127 @@
+"""
+Tests for token-budgeted context assembly.
+"""
+
+import asyncio
+import threading
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from agent_project.core.agents.code_b.agent import CodeBAgent
+from agent_project.core.tools import context_assembler
+from agent_project.core.tools.context_assembler import (
+    TokenCounter,
+    assemble_context,
+    dedupe,
+    format_document,
+    get_context_budget,
+)
+
+MODEL = "gpt-4-turbo-preview"
+
+
+def doc(content: str, score: float, section: str = "", document_id: str = "nzbc"):
+    """Retrieved document as returned by similarity search."""
+    return {
+        "content": content,
+        "similarity_score": score,
+        "metadata": {"source": "B1", "section": section, "document_id": document_id},
+    }
+
+
+@pytest.fixture
+def counter():
+    """Character-estimate token counter, independent of tiktoken downloads."""
+    with patch.object(context_assembler, "_tiktoken_unavailable", True):
+        counter = TokenCounter(MODEL)
+    with patch.dict(context_assembler._counters, {MODEL: counter}):
+        yield counter
+
+
+class TestContextAssembler:
+    """Test suite for deduplication, MMR selection and budgeting."""
+
+    def test_dedupe(self):
+        """Test one chunk per section and contained text are kept once."""
+        context = [
+            doc("Bracing must resist wind loads.", 0.82, section="B1.3.1"),
+            doc("Bracing must resist wind loads and quakes.", 0.9, "B1.3.1"),
+            doc("resist WIND loads", 0.85, section="B1.3.2"),
+            doc("Timber must last 50 years.", 0.84, section="B2.3.1"),
+        ]
+
+        assert [d["similarity_score"] for d in dedupe(context)] == [0.9, 0.84]
+
+    def test_mmr_prefers_novel_chunks(self, counter):
+        """Test a near-duplicate loses to a less similar but novel chunk."""
+        wind = "Buildings must resist wind loads during construction and service."
+        context = [
+            doc(wind, 0.95, section="B1.3.1"),
+            doc(wind.replace("Buildings", "Structures"), 0.94, section="B1.3.3"),
+            doc("Materials must remain durable for 50 years.", 0.85, "B2.3.1"),
+        ]
+        budget = sum(counter.count(format_document(d)) for d in context[1:]) + 5
+
+        selected = assemble_context(context, MODEL, budget=budget)
+
+        assert [d["metadata"]["section"] for d in selected] == ["B1.3.1", "B2.3.1"]
+
+    def test_budget_truncates_and_orders(self, counter):
+        """Test the budget is respected and the best chunks sit at the ends."""
+        context = [
+            doc(f"Clause {n} " + "requirement text " * 40, score, section=str(n))
+            for n, score in enumerate([0.95, 0.9, 0.85, 0.8])
+        ]
+        budget = 3 * counter.count(format_document(context[0])) + 100
+
+        selected = assemble_context(context, MODEL, budget=budget)
+        used = counter.count("\n\n".join(format_document(d) for d in selected))
+
+        assert used <= budget
+        assert [d["metadata"]["section"] for d in selected] == ["0", "2", "3", "1"]
+        assert len(selected[2]["content"]) < len(context[3]["content"])
+
+    def test_context_budget(self):
+        """Test budgets match the longest model prefix unless overridden."""
+        assert get_context_budget("gpt-4-turbo-preview") == 4000
+        assert get_context_budget("gpt-4-0613") == 2500
+        assert get_context_budget("mistral") == 3000
+        with patch.object(context_assembler.settings, "context_token_budget", 800):
+            assert get_context_budget("gpt-4o") == 800
+
+    @pytest.mark.asyncio
+    async def test_counter_loaded_once_off_loop(self):
+        """Test concurrent first uses share one counter built in a thread."""
+        threads = []
+
+        def build(model):
+            threads.append(threading.current_thread())
+            return object()
+
+        with patch.object(context_assembler, "TokenCounter", build), patch.dict(
+            context_assembler._counters, clear=True
+        ):
+            first, second = await asyncio.gather(
+                context_assembler.load_token_counter("gpt-4o"),
+                context_assembler.load_token_counter("gpt-4o"),
+            )
+
+        assert first is second
+        assert len(threads) == 1 and threads[0] is not threading.main_thread()
+
+    @pytest.mark.asyncio
+    async def test_prompt_uses_assembled_context(self, counter):
+        """Test duplicate chunks reach the LLM prompt only once."""
+        agent = CodeBAgent()
+        agent.llm_client = AsyncMock(default_model=MODEL)
+        agent.llm_client.generate.return_value = "Answer"
+        context = [
+            doc("Bracing must resist wind loads.", 0.9, section="B1.3.1"),
+            doc("Bracing must resist wind loads.", 0.88, section="B1.3.2"),
+        ]
+
+        await agent.generate_response("Bracing?", context=context)
+
+        prompt = agent.llm_client.generate.call_args.kwargs["prompt"]
+        assert prompt.count("Bracing must resist wind loads.") == 1
@@ -85,6 +85,33 @@ class TestOrchestratorAgent:
             assert "error" in result["response"].lower()
             assert result["agent_used"] == "orchestrator"
 
+    @pytest.mark.asyncio
+    async def test_clause_reference_skips_intent_and_search(self, orchestrator):
+        """Test exact clause requests are answered from the section index."""
+        clause = {
+            "id": 1,
+            "section": "B1.3.2",
+            "source": "NZBC",
+            "page_number": 5,
+            "content": "Buildings shall have a low probability of collapse.",
+        }
+        with patch(
+            "agent_project.core.agents.orchestrator.agent.section_index"
+        ) as mock_index, patch.object(
+            orchestrator, "intent_classifier"
+        ) as mock_classifier:
+            mock_index.lookup = AsyncMock(return_value=[clause])
+
+            result = await orchestrator.process_query(
+                query="show me B1.3.2", session_id="test-session", user_id="test-user"
+            )
+
+            mock_index.lookup.assert_awaited_once_with("B1.3.2")
+            mock_classifier.classify.assert_not_called()
+            assert result["agent_used"] == "clause_lookup"
+            assert result["sources"] == [clause]
+            assert "**B1.3.2** (NZBC, page 5)" in result["response"]
+
     def test_should_route_to_specialist(self, orchestrator):
         """Test specialist routing logic."""
         # Test routing to specialist
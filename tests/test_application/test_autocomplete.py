@@ -0,0 +1,155 @@
+"""
+Tests for query autocomplete.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from agent_project.core.tools import autocomplete as autocomplete_module
+from agent_project.core.tools.autocomplete import AutocompleteManager, SuggestIndex
+from agent_project.infrastructure.auth.dependencies import get_current_user
+
+SUGGESTIONS = {
+    "D1.3.3 Handrails": 2.0,
+    "What is the handrail height for stairs?": 5.0,
+    "Handrail requirements for ramps": 3.0,
+    "How deep must foundations be?": 4.0,
+}
+
+
+class TestSuggestIndex:
+    """Test suite for prefix matching and ranking."""
+
+    def test_prefix_matches_any_word_and_ranks_by_score(self):
+        """Test mid-text matches are found and leading matches rank higher."""
+        index = SuggestIndex(SUGGESTIONS)
+
+        assert index.suggest("handr") == [
+            "Handrail requirements for ramps",
+            "What is the handrail height for stairs?",
+            "D1.3.3 Handrails",
+        ]
+        assert index.suggest("d1.3") == ["D1.3.3 Handrails"]
+        assert index.suggest("HOW  deep") == ["How deep must foundations be?"]
+        assert index.suggest("zzz") == []
+        assert index.suggest("  ") == []
+
+    def test_precomputed_prefixes_match_full_scan(self):
+        """Test precomputed heavy prefixes rank exactly like a scan."""
+        scanned = SuggestIndex(SUGGESTIONS)
+        with patch.object(autocomplete_module, "HEAVY_PREFIX_KEYS", 1):
+            precomputed = SuggestIndex(SUGGESTIONS)
+
+        assert "handr" in precomputed._precomputed
+        for prefix in ("h", "ha", "handrail", "w", "d1.", "for s"):
+            assert precomputed.suggest(prefix, 3) == scanned.suggest(prefix, 3)
+
+
+class TestAutocompleteManager:
+    """Test suite for index building from titles and query counts."""
+
+    @pytest.mark.asyncio
+    async def test_rare_queries_are_not_suggested(self):
+        """Test a query needs enough distinct users to be suggested."""
+        manager = AutocompleteManager()
+        section_index = MagicMock()
+        section_index.index.titles.return_value = {"D1": "D1 Access routes"}
+
+        with patch.object(
+            autocomplete_module.settings, "autocomplete_min_query_users", 2
+        ), patch.object(autocomplete_module.settings, "database_url", None), patch(
+            "agent_project.infrastructure.vector_db.section_index.section_index",
+            section_index,
+        ):
+            manager.record_query("What is my address 12 Smith St?", "user-1")
+            manager.record_query("What is my address 12 Smith St?", "user-1")
+            manager.record_query("Stair riser height", "user-1")
+            manager.record_query("stair  riser height", "user-2")
+            await manager.rebuild()
+
+        assert manager.suggest("what") == []
+        assert manager.suggest("stair") == ["Stair riser height"]
+        assert manager.suggest("access") == ["D1 Access routes"]
+
+    @pytest.mark.asyncio
+    async def test_popular_queries_loaded_from_sessions(self):
+        """Test past queries from session memory are merged in."""
+        manager = AutocompleteManager()
+        client = MagicMock(
+            get_popular_queries=AsyncMock(return_value=[("Fire exits", 9)]),
+            close=AsyncMock(),
+        )
+
+        with patch.object(
+            autocomplete_module.settings, "database_url", "postgresql://db"
+        ), patch(
+            "agent_project.infrastructure.vector_db.session_memory.SessionMemoryClient",
+            return_value=client,
+        ):
+            await manager.rebuild()
+
+        assert manager.suggest("fire") == ["Fire exits"]
+        client.close.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_failed_first_build_is_retried(self):
+        """Test a failed build at start-up still schedules rebuilds."""
+        manager = AutocompleteManager()
+
+        with patch.object(
+            manager,
+            "_popular_queries",
+            AsyncMock(
+                side_effect=[ConnectionError("db unavailable"), [("Fire exits", 9)]]
+            ),
+        ), patch.object(
+            autocomplete_module.settings, "autocomplete_refresh_interval_seconds", 0
+        ):
+            with pytest.raises(ConnectionError):
+                await manager.start()
+            # The rebuild runs in a worker thread, so give it real time
+            for _ in range(500):
+                if manager.index is not None:
+                    break
+                await asyncio.sleep(0.01)
+            await manager.stop()
+
+        assert manager.suggest("fire") == ["Fire exits"]
+
+
+def test_suggest_endpoint(app, client, mock_user):
+    """Test the endpoint returns suggestions from the global index."""
+    app.dependency_overrides[get_current_user] = lambda: mock_user
+    with patch.object(
+        autocomplete_module.autocomplete, "index", SuggestIndex(SUGGESTIONS)
+    ):
+        response = client.get("/api/v1/suggest", params={"q": "how", "limit": 2})
+    app.dependency_overrides.clear()
+
+    assert response.status_code == 200
+    assert response.json() == {
+        "query": "how",
+        "suggestions": ["How deep must foundations be?"],
+    }
+
+
+def test_chat_records_query_per_user(app, client, mock_user, sample_chat_message):
+    """Test chat counts a query for the user, not the client-chosen session."""
+    app.dependency_overrides[get_current_user] = lambda: mock_user
+    orchestrator = MagicMock()
+    orchestrator.return_value.process_query = AsyncMock(
+        return_value={"response": "ok", "sources": [], "agent_used": "code_b"}
+    )
+    with patch(
+        "agent_project.core.agents.orchestrator.agent.OrchestratorAgent",
+        orchestrator,
+    ), patch.object(autocomplete_module.autocomplete, "record_query") as record:
+        for session_id in ("a", "b", "c"):
+            client.post(
+                "/api/v1/chat", json={**sample_chat_message, "session_id": session_id}
+            )
+    app.dependency_overrides.clear()
+
+    assert {call.args[1] for call in record.call_args_list} == {"test-user-id"}
@@ -0,0 +1,65 @@
+"""
+Tests for the opt-in chat latency breakdown.
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from agent_project.core.utils.timing import record_timing
+from agent_project.infrastructure.auth.dependencies import get_current_user
+
+
+class FakeOrchestrator:
+    """Orchestrator stand-in that records a retrieval stage."""
+
+    async def process_query(self, query, session_id, user_id):
+        record_timing("retrieval", 0.012)
+        record_timing("classification", 0.001, "keyword")
+        return {"response": "ok", "sources": [], "agent_used": "code_b"}
+
+
+@pytest.fixture
+def chat_client(app, client, mock_user):
+    """Test client with auth and orchestrator replaced."""
+    app.dependency_overrides[get_current_user] = lambda: mock_user
+    with patch(
+        "agent_project.core.agents.orchestrator.agent.OrchestratorAgent",
+        FakeOrchestrator,
+    ):
+        yield client
+    app.dependency_overrides.clear()
+
+
+class TestChatTiming:
+    """Test suite for per-request timing output."""
+
+    def test_timing_omitted_by_default(self, chat_client, sample_chat_message):
+        """Test no breakdown or header is returned without opting in."""
+        response = chat_client.post("/api/v1/chat", json=sample_chat_message)
+
+        assert response.status_code == 200
+        assert response.json()["timings"] is None
+        assert "server-timing" not in response.headers
+
+    def test_timing_header_opt_in(self, chat_client, sample_chat_message):
+        """Test the header opt-in returns stages in body and Server-Timing."""
+        response = chat_client.post(
+            "/api/v1/chat",
+            json=sample_chat_message,
+            headers={"X-Debug-Timing": "1"},
+        )
+
+        stages = response.json()["timings"]["stages"]
+        assert stages["retrieval"]["ms"] == pytest.approx(12.0)
+        assert stages["classification"]["detail"] == "keyword"
+        assert "retrieval;dur=12.000" in response.headers["server-timing"]
+        assert "total;dur=" in response.headers["server-timing"]
+
+    def test_timing_query_opt_in(self, chat_client, sample_chat_message):
+        """Test the query parameter opt-in."""
+        response = chat_client.post(
+            "/api/v1/chat?timing=true", json=sample_chat_message
+        )
+
+        assert "retrieval" in response.json()["timings"]["stages"]
@@ -0,0 +1,66 @@
+"""
+Import-time budget for the application entry point.
+
+Cold starts on Cloud Run pay for every module imported before the server
+listens, so heavy dependencies must stay lazy.
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+# Cumulative seconds allowed for importing agent_project.application.main
+IMPORT_BUDGET_SECONDS = 2.0
+
+# Dependencies that must only be imported when first used
+LAZY_MODULES = {
+    "langgraph",
+    "langchain_core",
+    "openai",
+    "anthropic",
+    "supabase",
+    "asyncpg",
+}
+
+SRC_DIR = Path(__file__).parent.parent.parent / "src"
+
+
+def import_times(module: str) -> dict:
+    """Import a module in a fresh interpreter and parse ``-X importtime``."""
+    env = {
+        **os.environ,
+        "PYTHONPATH": str(SRC_DIR),
+        "SUPABASE_URL": os.environ.get("SUPABASE_URL", "https://test.supabase.co"),
+        "SUPABASE_ANON_KEY": os.environ.get("SUPABASE_ANON_KEY", "test"),
+        "SUPABASE_SERVICE_ROLE_KEY": os.environ.get(
+            "SUPABASE_SERVICE_ROLE_KEY", "test"
+        ),
+    }
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if cumulative.strip().isdigit():
+            times[name.strip()] = int(cumulative) / 1_000_000
+    return times
+
+
+class TestImportTime:
+    """Test suite for application start-up cost."""
+
+    def test_main_import_is_lazy_and_within_budget(self):
+        """Test heavy dependencies stay out of the entry point import."""
+        times = import_times("agent_project.application.main")
+
+        assert not LAZY_MODULES & set(times)
+        assert times["agent_project.application.main"] < IMPORT_BUDGET_SECONDS
@@ -0,0 +1,15 @@
+"""
+Tests for log event serialization.
+"""
+
+import json
+
+from agent_project.core.utils.logging import _json_dumps
+
+
+def test_non_string_keys_and_big_integers():
+    """Test events orjson rejects by default still serialize."""
+    assert json.loads(_json_dumps({"counts": {200: 3, None: 1}})) == {
+        "counts": {"200": 3, "null": 1}
+    }
+    assert json.loads(_json_dumps({"id": 2**70})) == {"id": 2**70}
@@ -0,0 +1,56 @@
+"""
+Tests for the event-loop lag monitor.
+"""
+
+import asyncio
+import time
+from unittest.mock import patch
+
+import pytest
+
+from agent_project.config import settings
+from agent_project.core.utils import loop_monitor
+from agent_project.core.utils.loop_monitor import EventLoopMonitor
+
+
+def blocking_call():
+    """Stand-in for a synchronous call made from a coroutine."""
+    time.sleep(0.2)
+
+
+class TestEventLoopMonitor:
+    """Test suite for lag measurement and blocking-call detection."""
+
+    @pytest.mark.asyncio
+    async def test_measures_lag(self):
+        """A blocked loop shows up as lag on the next sample."""
+        with patch.object(settings, "loop_monitor_interval_seconds", 0.01):
+            monitor = EventLoopMonitor()
+            monitor.start()
+            await asyncio.sleep(0.03)
+            blocking_call()
+            await asyncio.sleep(0.03)
+            await monitor.stop()
+
+        assert monitor.max_lag >= 0.15
+        assert not monitor.running
+
+    @pytest.mark.asyncio
+    async def test_debug_mode_logs_blocking_stack(self):
+        """Debug mode logs the stack of the code blocking the loop."""
+        with patch.object(
+            settings, "loop_monitor_interval_seconds", 0.01
+        ), patch.object(settings, "loop_block_debug", True), patch.object(
+            settings, "loop_block_threshold_seconds", 0.05
+        ), patch.object(
+            loop_monitor, "logger"
+        ) as mock_logger:
+            monitor = EventLoopMonitor()
+            monitor.start()
+            await asyncio.sleep(0.03)
+            blocking_call()
+            await asyncio.sleep(0.03)
+            await monitor.stop()
+
+        mock_logger.warning.assert_called_once()
+        assert "blocking_call" in mock_logger.warning.call_args.kwargs["stack"]
@@ -0,0 +1,84 @@
+"""
+Tests for request metrics instrumentation.
+"""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from prometheus_client import REGISTRY
+
+from agent_project.application.middleware import MetricsMiddleware
+from agent_project.infrastructure.llm.client import LLMClient
+
+
+def _sample(name: str, labels: dict) -> float:
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+class TestMetricsMiddleware:
+    """Test suite for the metrics middleware."""
+
+    def test_requests_labelled_by_route_template(self):
+        """Test path parameters are collapsed into the route template."""
+        app = FastAPI()
+        app.add_middleware(MetricsMiddleware)
+
+        @app.get("/items/{item_id}")
+        async def get_item(item_id: str):
+            return {"item_id": item_id}
+
+        labels = {"method": "GET", "route": "/items/{item_id}", "status": "200"}
+        before = _sample("http_requests_total", labels)
+
+        client = TestClient(app)
+        client.get("/items/a")
+        client.get("/items/b")
+
+        assert _sample("http_requests_total", labels) == before + 2
+        assert _sample("http_requests_in_flight", {}) == 0
+
+    def test_unmatched_routes_share_label(self):
+        """Test unknown paths do not create per-path label values."""
+        app = FastAPI()
+        app.add_middleware(MetricsMiddleware)
+
+        labels = {"method": "GET", "route": "unmatched", "status": "404"}
+        before = _sample("http_requests_total", labels)
+
+        TestClient(app).get("/does-not-exist")
+
+        assert _sample("http_requests_total", labels) == before + 1
+
+
+@pytest.mark.asyncio
+async def test_anthropic_token_usage_recorded():
+    """Test Anthropic calls count prompt and completion tokens."""
+    client = LLMClient()
+    client.anthropic_client = MagicMock()
+    client.anthropic_client.messages.create = AsyncMock(
+        return_value=SimpleNamespace(
+            content=[SimpleNamespace(type="text", text="Answer")],
+            usage=SimpleNamespace(input_tokens=120, output_tokens=30),
+        )
+    )
+    labels = {"provider": "anthropic", "model": "claude-3-haiku-20240307"}
+    prompt = {**labels, "type": "prompt"}
+    completion = {**labels, "type": "completion"}
+    before = (
+        _sample("llm_tokens_total", prompt),
+        _sample("llm_tokens_total", completion),
+    )
+
+    response = await client.generate(
+        "Question", system_message="System", provider="anthropic", model=labels["model"]
+    )
+
+    assert response == "Answer"
+    assert (
+        client.anthropic_client.messages.create.call_args.kwargs["system"] == "System"
+    )
+    assert _sample("llm_tokens_total", prompt) == before[0] + 120
+    assert _sample("llm_tokens_total", completion) == before[1] + 30
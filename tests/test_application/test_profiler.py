@@ -0,0 +1,85 @@
+"""
+Tests for the sampling profiler and admin profiling endpoints.
+"""
+
+import threading
+import time
+
+import pytest
+
+from agent_project.config import settings
+from agent_project.core.utils.profiler import SamplingProfiler, continuous_profiler
+from agent_project.infrastructure.auth.dependencies import get_admin_user
+
+
+def busy_worker(stop: threading.Event):
+    """Spin until stopped so the profiler has a hot frame to find."""
+    while not stop.is_set():
+        sum(range(1000))
+
+
+@pytest.fixture
+def admin_client(app, client, mock_admin_user):
+    """Test client authenticated as an admin."""
+    app.dependency_overrides[get_admin_user] = lambda: mock_admin_user
+    yield client
+    app.dependency_overrides.clear()
+    continuous_profiler.stop()
+    continuous_profiler.latest = None
+
+
+class TestSamplingProfiler:
+    """Test suite for stack sampling."""
+
+    def test_collapsed_stacks_include_hot_function(self):
+        """Test samples are rendered as root-first collapsed stacks."""
+        stop = threading.Event()
+        worker = threading.Thread(target=busy_worker, args=(stop,), name="worker")
+        worker.start()
+        try:
+            result = SamplingProfiler(interval=0.001).run(0.1)
+        finally:
+            stop.set()
+            worker.join()
+
+        assert result.samples > 0
+        lines = result.collapsed().splitlines()
+        worker_lines = [line for line in lines if line.startswith("worker;")]
+        assert worker_lines
+        stack, count = worker_lines[0].rsplit(" ", 1)
+        assert "busy_worker (" in stack
+        assert int(count) > 0
+
+
+class TestProfileEndpoints:
+    """Test suite for the admin profiling endpoints."""
+
+    def test_profile_returns_collapsed_file(self, admin_client):
+        """Test an on-demand profile is returned as a collapsed-stack file."""
+        response = admin_client.get(
+            "/api/v1/admin/profile", params={"duration": 0.1, "interval_ms": 5}
+        )
+
+        assert response.status_code == 200
+        assert ".collapsed" in response.headers["content-disposition"]
+        assert int(response.headers["x-profile-samples"]) > 0
+        assert response.text.splitlines()[0].rsplit(" ", 1)[1].isdigit()
+
+    def test_continuous_profile(self, admin_client, monkeypatch):
+        """Test continuous mode keeps the latest window available."""
+        assert admin_client.get("/api/v1/admin/profile/continuous").status_code == 404
+
+        monkeypatch.setattr(settings, "continuous_profiling_interval_seconds", 0.001)
+        monkeypatch.setattr(settings, "continuous_profiling_window_seconds", 0.05)
+        response = admin_client.post(
+            "/api/v1/admin/profile/continuous", params={"enabled": True}
+        )
+        assert response.json()["enabled"] is True
+
+        deadline = time.monotonic() + 2
+        while continuous_profiler.latest is None and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        response = admin_client.get("/api/v1/admin/profile/continuous")
+        assert response.status_code == 200
+        assert response.text
@@ -0,0 +1,63 @@
+"""
+Tests for warm-up gating and the liveness, startup and readiness probes.
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from agent_project.application.readiness import ReadinessState
+
+
+async def ok_step():
+    """Warm-up step that succeeds."""
+
+
+async def failing_step():
+    """Warm-up step that fails."""
+    raise RuntimeError("JWKS unavailable")
+
+
+@pytest.fixture
+def state():
+    """Readiness state with one passing and one failing step."""
+    readiness = ReadinessState()
+    readiness.add_step("agents", ok_step)
+    readiness.add_step("jwks", failing_step)
+    with patch("agent_project.application.routers.health.readiness", readiness):
+        yield readiness
+
+
+class TestReadinessProbes:
+    """Test suite for the probe endpoints."""
+
+    def test_not_ready_until_warm(self, client, state):
+        """Test startup and readiness fail before warm-up while liveness passes."""
+        assert client.get("/api/health/live").status_code == 200
+        assert client.get("/api/health/startup").status_code == 503
+
+        response = client.get("/api/health/ready")
+        assert response.status_code == 503
+        assert response.json()["status"] == "starting"
+
+    @pytest.mark.asyncio
+    async def test_ready_after_warm_up(self, client, state):
+        """Test failed steps are reported without blocking readiness."""
+        await state.warm_up()
+
+        response = client.get("/api/health/startup")
+        assert response.status_code == 200
+        assert response.json()["steps"]["agents"]["status"] == "ok"
+        assert response.json()["steps"]["jwks"]["error"] == "JWKS unavailable"
+        assert client.get("/api/health/ready").status_code == 200
+
+    @pytest.mark.asyncio
+    async def test_not_ready_while_draining(self, client, state):
+        """Test readiness flips to not-ready on drain."""
+        await state.warm_up()
+        await state.drain()
+
+        response = client.get("/api/health/ready")
+        assert response.status_code == 503
+        assert response.json()["status"] == "draining"
+        assert client.get("/api/health/live").status_code == 200
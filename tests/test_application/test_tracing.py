@@ -0,0 +1,38 @@
+"""
+Tests for tracing setup and shutdown.
+"""
+
+from unittest.mock import patch
+
+from agent_project.core.utils import tracing
+
+
+def test_file_exporter_closed_on_shutdown(tmp_path):
+    """Test the trace file is written and closed when tracing shuts down."""
+    path = tmp_path / "traces.jsonl"
+    with patch.object(tracing.settings, "enable_tracing", True), patch.object(
+        tracing.settings, "tracing_exporter", "file"
+    ), patch.object(tracing.settings, "tracing_file_path", str(path)), patch.object(
+        tracing.trace, "set_tracer_provider"
+    ) as set_provider:
+        assert tracing.setup_tracing()
+        trace_file = tracing._trace_file
+
+        provider = set_provider.call_args.args[0]
+        with provider.get_tracer("test").start_as_current_span("request"):
+            pass
+        tracing.shutdown_tracing()
+
+    assert trace_file.closed
+    assert '"name": "request"' in path.read_text()
+    assert tracing._tracer_provider is None and not tracing._tracing_configured
+
+
+def test_missing_api_warns():
+    """Test enabling tracing without OpenTelemetry installed logs a warning."""
+    with patch.object(tracing.settings, "enable_tracing", True), patch.object(
+        tracing, "trace", None
+    ), patch.object(tracing, "logger") as logger:
+        assert not tracing.setup_tracing()
+
+    assert "tracing extra" in logger.warning.call_args.args[0]
@@ -0,0 +1,109 @@
+"""
+Tests for Supabase JWT validation and verification caching.
+"""
+
+import time
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec
+from jose import jwk, jwt
+
+from agent_project.config import settings
+from agent_project.infrastructure.auth import dependencies
+
+
+@pytest.fixture
+def ec_private_key():
+    """Generate a P-256 signing key."""
+    return ec.generate_private_key(ec.SECP256R1())
+
+
+@pytest.fixture
+def jwks(ec_private_key):
+    """Build a JWKS document for the signing key."""
+    public_pem = ec_private_key.public_key().public_bytes(
+        serialization.Encoding.PEM, serialization.PublicFormat.SubjectPublicKeyInfo
+    )
+    public_jwk = jwk.construct(public_pem, "ES256").to_dict()
+    public_jwk.update({"kid": "test-kid", "use": "sig"})
+    return {"keys": [public_jwk]}
+
+
+@pytest.fixture
+def make_token(ec_private_key):
+    """Factory for signed Supabase-style tokens."""
+    private_pem = ec_private_key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    )
+
+    def _make_token(exp_offset: int = 3600) -> str:
+        claims = {
+            "sub": "test-user-id",
+            "aud": "authenticated",
+            "iss": f"{settings.supabase_url}/auth/v1",
+            "exp": int(time.time()) + exp_offset,
+        }
+        return jwt.encode(
+            claims, private_pem, algorithm="ES256", headers={"kid": "test-kid"}
+        )
+
+    return _make_token
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    """Reset verification caches between tests."""
+    dependencies.clear_token_cache()
+    yield
+    dependencies.clear_token_cache()
+
+
+class TestValidateSupabaseJWT:
+    """Test suite for cached JWT validation."""
+
+    @pytest.mark.asyncio
+    async def test_verified_token_is_cached(self, jwks, make_token):
+        """Test repeated validation skips signature verification."""
+        token = make_token()
+
+        with patch.object(
+            dependencies, "get_supabase_public_keys", AsyncMock(return_value=jwks)
+        ):
+            with patch.object(
+                dependencies.jwt, "decode", wraps=dependencies.jwt.decode
+            ) as mock_decode:
+                first = await dependencies.validate_supabase_jwt(token)
+                second = await dependencies.validate_supabase_jwt(token)
+
+        assert first["sub"] == "test-user-id"
+        assert second == first
+        assert mock_decode.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_cache_expiry_bounded_by_token_exp(self, jwks, make_token):
+        """Test cache entries never outlive the token's exp claim."""
+        token = make_token(exp_offset=5)
+
+        with patch.object(
+            dependencies, "get_supabase_public_keys", AsyncMock(return_value=jwks)
+        ):
+            claims = await dependencies.validate_supabase_jwt(token)
+
+        expires_at, _ = dependencies._verified_token_cache[
+            dependencies._token_cache_key(token)
+        ]
+        assert expires_at == claims["exp"]
+
+    def test_signing_keys_reused_for_same_jwks(self, jwks):
+        """Test key objects are only rebuilt when the JWKS document changes."""
+        first = dependencies.get_signing_keys(jwks)
+        second = dependencies.get_signing_keys(jwks)
+
+        assert "test-kid" in first
+        assert first is second
+        assert first["test-kid"][1] == "ES256"
+        assert dependencies.get_signing_keys({"keys": list(jwks["keys"])}) is not first
@@ -0,0 +1,71 @@
+"""
+Tests for the memory-mapped embedding artifact.
+"""
+
+import numpy as np
+import pytest
+
+from agent_project.infrastructure.vector_db.artifact import (
+    ArtifactWriter,
+    EmbeddingArtifact,
+    read_current_version,
+)
+
+ROWS = [
+    ({"id": 1, "content": "Handrails", "clause_type": "code_b"}, [3.0, 4.0, 0.0]),
+    ({"id": 2, "content": "Balustrades", "clause_type": "code_b"}, [0.0, 1.0, 0.0]),
+    ({"id": 3, "content": "Insulation", "clause_type": "code_h"}, [0.0, 0.0, 2.0]),
+]
+
+
+def write(root, rows=ROWS):
+    """Write rows to a new artifact version."""
+    writer = ArtifactWriter(root, len(rows), 3, "test-model")
+    for record, embedding in rows:
+        writer.add(record, np.array(embedding))
+    return writer.finish()
+
+
+class TestEmbeddingArtifact:
+    """Test suite for writing and memory-mapping artifacts."""
+
+    def test_round_trip(self, tmp_path):
+        """Test rows are normalised, sliced by clause type and memory-mapped."""
+        version = write(tmp_path)
+        artifact = EmbeddingArtifact.open(tmp_path)
+
+        assert artifact.version == version == read_current_version(tmp_path)
+        assert isinstance(artifact.embeddings, np.memmap)
+        np.testing.assert_allclose(artifact.embeddings[0], [0.6, 0.8, 0.0])
+        assert artifact.vectors("code_b").shape == (2, 3)
+        assert artifact.vectors("code_x").shape == (0, 3)
+        assert artifact.record(2)["content"] == "Insulation"
+        assert artifact.row_range("code_h") == (2, 3)
+        artifact.close()
+
+    def test_version_tracks_content(self, tmp_path):
+        """Test unchanged exports reuse the version and changes publish a new one."""
+        first = write(tmp_path)
+        assert write(tmp_path) == first
+
+        changed = [
+            ROWS[0],
+            ROWS[1],
+            ({**ROWS[2][0], "content": "R-values"}, ROWS[2][1]),
+        ]
+        second = write(tmp_path, changed)
+
+        assert second != first
+        assert read_current_version(tmp_path) == second
+
+    def test_rejects_unsorted_clause_types(self, tmp_path):
+        """Test rows must arrive grouped by clause type."""
+        writer = ArtifactWriter(tmp_path, 3, 3, "test-model")
+        writer.add(ROWS[0][0], np.array(ROWS[0][1]))
+        writer.add(ROWS[2][0], np.array(ROWS[2][1]))
+
+        with pytest.raises(ValueError):
+            writer.add(ROWS[1][0], np.array(ROWS[1][1]))
+        writer.abort()
+
+        assert read_current_version(tmp_path) is None
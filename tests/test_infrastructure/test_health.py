@@ -0,0 +1,75 @@
+"""
+Tests for background health checks.
+"""
+
+import asyncio
+import time
+from unittest.mock import patch
+
+import pytest
+
+from agent_project.config import settings
+from agent_project.infrastructure import health
+from agent_project.infrastructure.health import HealthMonitor
+
+
+def make_check(healthy=True, delay=0.0, calls=None):
+    """Build a check coroutine function with a fixed outcome."""
+
+    async def check():
+        if calls is not None:
+            calls.append(1)
+        await asyncio.sleep(delay)
+        return healthy, {"delay": delay}
+
+    return check
+
+
+class TestHealthMonitor:
+    """Test suite for the health monitor."""
+
+    @pytest.mark.asyncio
+    async def test_checks_run_concurrently_with_timeout(self):
+        """Test slow checks time out without delaying the others."""
+        monitor = HealthMonitor()
+        monitor.register("db", make_check(delay=0.05))
+        monitor.register("cache", make_check(delay=0.05))
+        monitor.register("slow", make_check(delay=1.0), critical=False)
+
+        start = time.perf_counter()
+        with patch.object(settings, "health_check_timeout_seconds", 0.1):
+            await monitor.run_checks()
+
+        assert time.perf_counter() - start < 0.5
+        assert monitor.results["db"]["status"] == "healthy"
+        assert monitor.results["slow"]["status"] == "unhealthy"
+        assert monitor.results["slow"]["error"] == "timeout"
+        assert monitor.overall_status() == "degraded"
+
+    @pytest.mark.asyncio
+    async def test_critical_failure_is_unhealthy(self):
+        """Test a failing critical check makes the service unhealthy."""
+        monitor = HealthMonitor()
+        monitor.register("db", make_check(healthy=False))
+        monitor.register("llm", make_check())
+
+        assert monitor.overall_status() == "unknown"
+        await monitor.run_checks()
+
+        assert monitor.overall_status() == "unhealthy"
+
+    def test_health_endpoint_serves_cached_results(self, client):
+        """Test probes reuse cached results instead of re-running checks."""
+        calls = []
+        monitor = HealthMonitor()
+        monitor.register("vector_db", make_check(calls=calls))
+
+        with patch.object(health, "health_monitor", monitor), patch(
+            "agent_project.application.routers.health.health_monitor", monitor
+        ):
+            for _ in range(3):
+                response = client.get("/api/health")
+
+        assert response.status_code == 200
+        assert response.json()["services"] == {"vector_db": "healthy"}
+        assert len(calls) == 1
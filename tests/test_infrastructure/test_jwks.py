@@ -0,0 +1,71 @@
+"""
+Tests for the JWKS manager.
+"""
+
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from agent_project.config import settings
+from agent_project.infrastructure.auth.jwks import JWKSManager
+
+JWKS = {"keys": [{"kty": "EC", "kid": "test-kid", "crv": "P-256"}]}
+
+
+@pytest.fixture
+def fetch_counter():
+    """Count JWKS fetches served by the mock transport."""
+    return {"count": 0}
+
+
+@pytest.fixture
+def manager(fetch_counter):
+    """Create a JWKS manager backed by a mock transport."""
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        fetch_counter["count"] += 1
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, json=JWKS)
+
+    jwks_manager = JWKSManager(jwks_url="https://test.supabase.co/jwks.json")
+    jwks_manager._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return jwks_manager
+
+
+class TestJWKSManager:
+    """Test suite for JWKS fetching."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_fetches_are_coalesced(self, manager, fetch_counter):
+        """Test concurrent cold reads share one fetch."""
+        results = await asyncio.gather(*(manager.get_keys() for _ in range(20)))
+
+        assert fetch_counter["count"] == 1
+        assert all(result == JWKS for result in results)
+        await manager.close()
+
+    @pytest.mark.asyncio
+    async def test_refresh_scheduled_near_expiry(self, manager, fetch_counter):
+        """Test reads inside the refresh margin return cached keys immediately."""
+        await manager.get_keys()
+        manager._expires_at = time.time() + settings.jwks_refresh_margin_seconds / 2
+
+        assert await manager.get_keys() == JWKS
+        await manager._inflight
+
+        assert fetch_counter["count"] == 2
+        assert manager._expires_at > time.time() + settings.jwks_refresh_margin_seconds
+        await manager.close()
+
+    @pytest.mark.asyncio
+    async def test_unknown_kid_refetch_is_rate_limited(self, manager, fetch_counter):
+        """Test unknown kid refetches are limited to one per interval."""
+        await manager.get_keys()
+
+        await manager.refresh_for_unknown_kid("rotated-kid")
+        await manager.refresh_for_unknown_kid("rotated-kid")
+
+        assert fetch_counter["count"] == 2
+        await manager.close()
@@ -0,0 +1,154 @@
+"""
+Tests for the in-process vector index tier.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import numpy as np
+import pytest
+
+from agent_project.infrastructure.vector_db import local_index as local_index_module
+from agent_project.infrastructure.vector_db.artifact import (
+    ArtifactWriter,
+    EmbeddingArtifact,
+)
+from agent_project.infrastructure.vector_db.client import VectorDBClient
+from agent_project.infrastructure.vector_db.local_index import (
+    LocalIndexManager,
+    LocalVectorIndex,
+)
+
+
+def write_clusters(root, rows_per_type=3000, dim=16, seed=0):
+    """Write an artifact of clustered vectors for two clause types."""
+    rng = np.random.default_rng(seed)
+    centres = rng.normal(size=(20, dim))
+    writer = ArtifactWriter(root, rows_per_type * 2, dim, "test-model")
+    for clause_type in ("code_b", "code_h"):
+        for i in range(rows_per_type):
+            vector = centres[i % 20] + rng.normal(scale=0.3, size=dim)
+            writer.add({"id": i, "clause_type": clause_type}, vector)
+    return writer.finish()
+
+
+class TestLocalVectorIndex:
+    """Test suite for IVF search over the artifact."""
+
+    def test_matches_exact_search(self, tmp_path):
+        """Test IVF results agree with brute force and honour the filter."""
+        write_clusters(tmp_path)
+        artifact = EmbeddingArtifact.open(tmp_path)
+        index = LocalVectorIndex(artifact)
+        start, end = artifact.row_range("code_h")
+        rng = np.random.default_rng(1)
+
+        recalled = 0
+        for _ in range(20):
+            query = artifact.embeddings[rng.integers(start, end)] + rng.normal(
+                scale=0.05, size=artifact.dim
+            )
+            matches = index.search(query, "code_h", limit=10, nprobe=16)
+            exact = np.argsort(artifact.vectors("code_h") @ query)[::-1][:10] + start
+
+            assert all(start <= row < end for row, _ in matches)
+            assert [s for _, s in matches] == sorted(
+                (s for _, s in matches), reverse=True
+            )
+            recalled += len({row for row, _ in matches} & set(exact.tolist()))
+
+        assert recalled / 200 >= 0.9
+        artifact.close()
+
+    def test_threshold_and_unknown_clause_type(self, tmp_path):
+        """Test the similarity threshold and unknown clause types."""
+        write_clusters(tmp_path, rows_per_type=50)
+        artifact = EmbeddingArtifact.open(tmp_path)
+        index = LocalVectorIndex(artifact)
+        query = np.asarray(artifact.embeddings[0])
+
+        assert index.search(query, "code_x") == []
+        matches = index.search(query, limit=100, similarity_threshold=0.99)
+        assert matches[0] == (0, pytest.approx(1.0, abs=1e-5))
+        assert all(score >= 0.99 for _, score in matches)
+        assert index.results(matches[:1])[0][0]["clause_type"] == "code_b"
+        artifact.close()
+
+
+class TestLocalIndexTier:
+    """Test suite for serving similarity searches from the local index."""
+
+    @pytest.mark.asyncio
+    async def test_reload_on_new_version(self, tmp_path):
+        """Test the manager only rebuilds when a new version is published."""
+        write_clusters(tmp_path, rows_per_type=50)
+        manager = LocalIndexManager()
+
+        with patch.object(
+            local_index_module.settings, "embedding_artifact_path", str(tmp_path)
+        ):
+            assert await manager.reload() is True
+            assert await manager.reload() is False
+
+            version = write_clusters(tmp_path, rows_per_type=50, seed=1)
+            assert await manager.reload() is True
+            assert manager.index.version == version
+
+    @pytest.mark.asyncio
+    async def test_failed_first_load_is_retried(self, tmp_path):
+        """Test a failed load at start-up still schedules reloads."""
+        (tmp_path / "CURRENT").write_text("missing-version")
+        manager = LocalIndexManager()
+
+        with patch.object(
+            local_index_module.settings, "embedding_artifact_path", str(tmp_path)
+        ), patch.object(
+            local_index_module.settings, "local_vector_index_reload_interval_seconds", 0
+        ):
+            with pytest.raises(FileNotFoundError):
+                await manager.start()
+            version = write_clusters(tmp_path, rows_per_type=50)
+            for _ in range(500):
+                if manager.index is not None:
+                    break
+                await asyncio.sleep(0.01)
+            await manager.stop()
+
+        assert manager.index is not None and manager.index.version == version
+
+    @pytest.mark.asyncio
+    async def test_similarity_search_uses_local_index(self, tmp_path):
+        """Test searches are served locally and fall back to the RPC on error."""
+        write_clusters(tmp_path, rows_per_type=50)
+        artifact = EmbeddingArtifact.open(tmp_path)
+        index = LocalVectorIndex(artifact)
+
+        with patch("supabase.create_client", return_value=MagicMock()), patch.object(
+            local_index_module.local_index, "index", index
+        ), patch.object(
+            local_index_module.settings, "local_vector_index_enabled", True
+        ):
+            client = VectorDBClient()
+            client._llm_client = MagicMock()
+            client._llm_client.embed = AsyncMock(
+                return_value=artifact.embeddings[60].tolist()
+            )
+
+            results = await client.similarity_search("stairs", "code_h", 3, 0.0)
+            await client.similarity_search("stairs", "code_h", 3, 0.0)
+
+            assert len(results) == 3
+            assert results[0]["metadata"]["clause_type"] == "code_h"
+            assert results[0]["similarity_score"] == pytest.approx(1.0, abs=1e-5)
+            client._llm_client.embed.assert_awaited_once()
+            client.supabase.rpc.assert_not_called()
+
+            client._llm_client.embed.side_effect = RuntimeError("down")
+            client.supabase.rpc.return_value.execute.return_value.data = [
+                {"content": "From the database", "similarity": 0.9}
+            ]
+            results = await client.similarity_search("ramps", "code_h")
+
+            assert results[0]["content"] == "From the database"
+
+        artifact.close()
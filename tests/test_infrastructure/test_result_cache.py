@@ -0,0 +1,87 @@
+"""
+Tests for the vector search result cache.
+"""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from agent_project.infrastructure.vector_db import result_cache
+from agent_project.infrastructure.vector_db.client import VectorDBClient
+from agent_project.infrastructure.vector_db.result_cache import VectorResultCache
+
+
+@pytest.fixture
+def cache_settings():
+    """Enable the result cache with a small bound."""
+    with patch.object(
+        result_cache.settings, "vector_result_cache_ttl_seconds", 60
+    ), patch.object(result_cache.settings, "vector_result_cache_max_entries", 2):
+        yield result_cache.settings
+
+
+class TestVectorResultCache:
+    """Test suite for cache keys, expiry, eviction and invalidation."""
+
+    def test_key_quantizes_embedding_and_includes_filters(self):
+        """Test float noise shares a key while any filter change does not."""
+        embedding = [0.5, -0.25, 0.125, 0.8]
+        noisy = [x + 1e-5 for x in embedding]
+        key = VectorResultCache.key(embedding, "code_b", 10, 0.8)
+
+        assert VectorResultCache.key(noisy, "code_b", 10, 0.8) == key
+        assert (
+            VectorResultCache.key([x * 3 for x in embedding], "code_b", 10, 0.8) == key
+        )
+        assert VectorResultCache.key(embedding, "code_c", 10, 0.8) != key
+        assert VectorResultCache.key(embedding, "code_b", 5, 0.8) != key
+        assert VectorResultCache.key(embedding, "code_b", 10, 0.7) != key
+        assert VectorResultCache.key("Stair  Handrails", None, 10, 0.8) == (
+            VectorResultCache.key("stair handrails", None, 10, 0.8)
+        )
+
+    def test_ttl_lru_and_corpus_version(self, cache_settings):
+        """Test entries expire, evict least recently used, and clear on change."""
+        cache = VectorResultCache()
+        cache.set_corpus_version("v1")
+        cache.put("a", [{"id": 1}])
+        cache.put("b", [{"id": 2}])
+        assert cache.get("a") == [{"id": 1}]
+
+        cache.put("c", [{"id": 3}])
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+
+        with patch.object(result_cache.time, "monotonic", return_value=1e12):
+            assert cache.get("a") is None
+
+        cache.set_corpus_version("v1")
+        assert cache.get("c") is not None
+        cache.set_corpus_version("v2")
+        assert cache.get("c") is None
+        assert cache.stats()["corpus_version"] == "v2"
+
+    @pytest.mark.asyncio
+    async def test_similarity_search_served_from_cache(self, cache_settings):
+        """Test repeated searches skip the backend until the corpus changes."""
+        cache = VectorResultCache()
+        with patch("supabase.create_client", return_value=MagicMock()), patch(
+            "agent_project.infrastructure.vector_db.client.vector_result_cache",
+            cache,
+        ):
+            client = VectorDBClient()
+            client.get_corpus_version = AsyncMock(return_value="v1")
+            rpc = client.supabase.rpc.return_value.execute
+            rpc.return_value.data = [{"content": "Handrails", "similarity": 0.9}]
+
+            first = await client.similarity_search("handrails", "code_d", 5, 0.5)
+            await client._corpus_version_task
+            await client.similarity_search("handrails", "code_d", 5, 0.5)
+            second = await client.similarity_search("handrails", "code_d", 5, 0.5)
+
+            assert first == second
+            assert rpc.call_count == 2
+
+            cache.set_corpus_version("v2")
+            await client.similarity_search("handrails", "code_d", 5, 0.5)
+            assert rpc.call_count == 3
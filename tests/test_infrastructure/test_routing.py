@@ -0,0 +1,117 @@
+"""
+Tests for primary/replica connection routing.
+"""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from agent_project.infrastructure.vector_db import routing
+from agent_project.infrastructure.vector_db.routing import (
+    DIRECT,
+    PRIMARY,
+    REPLICA,
+    PoolRouter,
+    connection_options,
+    database_url,
+)
+from agent_project.infrastructure.vector_db.session_memory import SessionMemoryClient
+
+PRIMARY_URL = "postgresql://primary/db"
+REPLICA_URL = "postgresql://replica/db"
+
+
+@pytest.fixture
+def replica_settings():
+    """Configure a replica and a transaction-mode pooler."""
+    with patch.object(routing.settings, "database_url", PRIMARY_URL), patch.object(
+        routing.settings, "database_replica_url", REPLICA_URL
+    ), patch.object(routing.settings, "database_pooler_mode", "transaction"):
+        yield routing.settings
+
+
+@pytest.fixture
+def create_pool():
+    """Patch asyncpg.create_pool to return a distinct mock per call."""
+    with patch("asyncpg.create_pool", new_callable=AsyncMock) as create:
+        create.side_effect = lambda *args, **kwargs: MagicMock(close=AsyncMock())
+        yield create
+
+
+class TestRouting:
+    """Test suite for DSN selection and pooler options."""
+
+    def test_roles_fall_back_to_primary(self, replica_settings):
+        """Test unset replica and direct URLs resolve to the primary."""
+        assert database_url(REPLICA) == REPLICA_URL
+        assert database_url(DIRECT) == PRIMARY_URL
+
+        replica_settings.database_replica_url = None
+        assert database_url(REPLICA) == PRIMARY_URL
+
+    def test_transaction_pooler_disables_statement_cache(self, replica_settings):
+        """Test the statement cache is off except on a direct connection."""
+        assert connection_options(PRIMARY) == {"statement_cache_size": 0}
+        assert connection_options(REPLICA) == {"statement_cache_size": 0}
+
+        with patch.object(routing.settings, "database_direct_url", PRIMARY_URL):
+            assert connection_options(DIRECT) == {}
+
+        replica_settings.database_pooler_mode = "session"
+        assert connection_options(PRIMARY) == {}
+
+    @pytest.mark.asyncio
+    async def test_router_creates_pool_per_role(self, replica_settings, create_pool):
+        """Test reads and writes get separate pools with the pooler options."""
+        router = PoolRouter("test", min_size=1)
+
+        primary = await router.get(PRIMARY)
+        replica = await router.get(REPLICA)
+
+        assert primary is not replica
+        assert await router.get(REPLICA) is replica
+        assert create_pool.call_count == 2
+        assert create_pool.call_args_list[1].args == (REPLICA_URL,)
+        assert create_pool.call_args_list[1].kwargs == {
+            "statement_cache_size": 0,
+            "min_size": 1,
+        }
+
+    @pytest.mark.asyncio
+    async def test_failed_replica_falls_back_to_primary(
+        self, replica_settings, create_pool
+    ):
+        """Test an unreachable replica is not retried on every read."""
+        primary = MagicMock()
+        create_pool.side_effect = [OSError("replica down"), primary]
+        router = PoolRouter("test")
+
+        assert await router.get(REPLICA) is primary
+        assert await router.get(REPLICA) is primary
+        assert create_pool.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_no_replica_shares_primary_pool(self, create_pool):
+        """Test replica reads use the primary pool when no replica is set."""
+        router = PoolRouter("test")
+
+        assert await router.get(REPLICA) is await router.get(PRIMARY)
+        assert create_pool.call_count == 1
+
+
+class TestSessionReadRouting:
+    """Test suite for read-your-writes session routing."""
+
+    def test_recent_writes_read_from_primary(self, replica_settings):
+        """Test a session reads from the primary until the lag window passes."""
+        client = SessionMemoryClient()
+        assert client._read_role("s1") == REPLICA
+
+        client._record_write("s1")
+        assert client._read_role("s1") == PRIMARY
+        assert client._read_role("s2") == REPLICA
+
+        with patch.object(routing.settings, "database_replica_max_lag_seconds", 0):
+            assert client._read_role("s1") == REPLICA
+            client._record_write("s2")
+            assert list(client._recent_writes) == ["s2"]
@@ -0,0 +1,111 @@
+"""
+Tests for the section index behind direct clause lookups.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from agent_project.infrastructure.vector_db import section_index as section_index_module
+from agent_project.infrastructure.vector_db.section_index import (
+    SectionIndex,
+    SectionIndexManager,
+    match_clause_reference,
+    normalize_section,
+)
+
+ROWS = [
+    {"id": 1, "section": "B1.3", "page_number": 4},
+    {"id": 2, "section": "B1.3.10 Loads", "page_number": 9},
+    {"id": 3, "section": "b1.3.2", "page_number": 5},
+    {"id": 4, "section": "B1.3.2", "page_number": 5},
+    {"id": 5, "section": "B1.30", "page_number": 12},
+    {"id": 6, "section": "E2/AS1", "page_number": 1},
+    {"id": 7, "section": "Clause E2", "page_number": 1},
+]
+
+
+class TestClauseReferences:
+    """Test suite for reference detection and normalisation."""
+
+    @pytest.mark.parametrize(
+        "query, expected",
+        [
+            ("show me B1.3.2", "B1.3.2"),
+            ("E2/AS1", "E2/AS1"),
+            ("What does clause d1.3.3 say?", "D1.3.3"),
+            ("What is the minimum handrail height in D1.3.3?", None),
+            ("Compare B1 and B2", None),
+            ("What is the minimum R-value for Zone 3 walls?", None),
+        ],
+    )
+    def test_match_clause_reference(self, query, expected):
+        """Test only pure lookup requests are matched."""
+        assert match_clause_reference(query) == expected
+
+    def test_normalize_section(self):
+        """Test casing, prefixes and trailing headings are dropped."""
+        assert normalize_section("clause b1.3.2 Loads") == "B1.3.2"
+        assert normalize_section(" e2/as1 ") == "E2/AS1"
+
+
+class TestSectionIndex:
+    """Test suite for exact and nested section lookups."""
+
+    def test_lookup_exact_and_subsections(self):
+        """Test nested sections follow in natural order, not string order."""
+        index = SectionIndex(ROWS)
+
+        assert [row["id"] for row in index.lookup("b1.3.2")] == [3, 4]
+        assert [row["id"] for row in index.lookup("B1.3")] == [1, 3, 4, 2]
+        assert [row["id"] for row in index.lookup("B1.3", False)] == [1]
+        assert [row["id"] for row in index.lookup("E2")] == [7, 6]
+        assert index.lookup("B9") == []
+
+    @pytest.mark.asyncio
+    async def test_manager_fetches_content_and_reloads_on_change(self):
+        """Test lookups fetch content by id and reloads track corpus version."""
+        client = MagicMock()
+        client.get_corpus_version = AsyncMock(return_value="v1")
+        client.list_sections = AsyncMock(return_value=ROWS)
+        client.get_clauses = AsyncMock(return_value=[{"id": 6, "content": "Roofs"}])
+        manager = SectionIndexManager()
+
+        with patch(
+            "agent_project.infrastructure.vector_db.client.get_vector_client",
+            return_value=client,
+        ):
+            assert await manager.lookup("E2/AS1") == []
+            assert await manager.reload() is True
+            assert await manager.reload() is False
+
+            assert await manager.lookup("E2/AS1") == [{"id": 6, "content": "Roofs"}]
+            client.get_clauses.assert_awaited_once_with([6])
+
+            client.get_corpus_version.return_value = "v2"
+            assert await manager.reload() is True
+
+    @pytest.mark.asyncio
+    async def test_failed_first_load_is_retried(self):
+        """Test a failed load at start-up still schedules reloads."""
+        client = MagicMock()
+        client.get_corpus_version = AsyncMock(
+            side_effect=[ConnectionError("db unavailable"), "v1"]
+        )
+        client.list_sections = AsyncMock(return_value=ROWS)
+        manager = SectionIndexManager()
+
+        with patch(
+            "agent_project.infrastructure.vector_db.client.get_vector_client",
+            return_value=client,
+        ), patch.object(
+            section_index_module.settings, "section_index_reload_interval_seconds", 0
+        ):
+            with pytest.raises(ConnectionError):
+                await manager.start()
+            for _ in range(10):
+                await asyncio.sleep(0)
+            await manager.stop()
+
+        assert manager.index is not None and manager.index.version == "v1"
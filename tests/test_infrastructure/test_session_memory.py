@@ -0,0 +1,58 @@
+"""
+Tests for session memory message mapping.
+"""
+
+import json
+import uuid
+from datetime import datetime, timezone
+
+from agent_project.infrastructure.vector_db.session_memory import ChatMessage
+
+
+class TestChatMessage:
+    """Test suite for the slotted ChatMessage type."""
+
+    def test_from_record_positional_mapping(self):
+        """Test rows are mapped in _MESSAGE_COLUMNS order."""
+        message_id = uuid.uuid4()
+        session_id = uuid.uuid4()
+        created_at = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+        message = ChatMessage.from_record(
+            (message_id, session_id, "user", "Hello", None, created_at)
+        )
+
+        assert message.message_id == message_id
+        assert message.session_id == session_id
+        assert message.role == "user"
+        assert message.content == "Hello"
+        assert message.metadata is None
+        assert message.created_at == created_at
+
+    def test_metadata_decoded_lazily(self):
+        """Test JSONB text is only decoded when metadata is accessed."""
+        raw = json.dumps({"agent_used": "code_b"})
+        message = ChatMessage.from_record(
+            ("m1", "s1", "assistant", "Hi", raw, datetime.now(timezone.utc))
+        )
+
+        assert message._raw_metadata == raw
+        assert message.metadata == {"agent_used": "code_b"}
+        assert message._raw_metadata is None
+        assert message.metadata is message.metadata
+
+    def test_defaults_and_slots(self):
+        """Test created_at default and absence of per-instance __dict__."""
+        message = ChatMessage(
+            session_id="s1", message_id="m1", role="user", content="Hi"
+        )
+
+        assert message.created_at.tzinfo is not None
+        assert not hasattr(message, "__dict__")
+        assert message == ChatMessage(
+            session_id="s1",
+            message_id="m1",
+            role="user",
+            content="Hi",
+            created_at=message.created_at,
+        )
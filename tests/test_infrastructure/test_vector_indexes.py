@@ -0,0 +1,196 @@
+"""
+Tests for per-clause-type partial vector index management.
+"""
+
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from agent_project.infrastructure.vector_db import tuning
+from agent_project.infrastructure.vector_db.client import (
+    VectorDBClient,
+    build_index_sql,
+    build_search_sql,
+    candidate_count,
+    clause_type_index_name,
+)
+
+
+@pytest.fixture
+def vector_client():
+    """Vector DB client with a mocked Supabase client."""
+    with patch("supabase.create_client", return_value=MagicMock()):
+        yield VectorDBClient()
+
+
+def mock_pool(conn):
+    """Connection pool whose acquire() yields the given connection."""
+    pool = MagicMock()
+    pool.acquire.return_value.__aenter__ = AsyncMock(return_value=conn)
+    pool.acquire.return_value.__aexit__ = AsyncMock(return_value=False)
+    conn.transaction.return_value.__aenter__ = AsyncMock()
+    conn.transaction.return_value.__aexit__ = AsyncMock(return_value=False)
+    return pool
+
+
+class TestSearchSql:
+    """Test suite for the filtered search query."""
+
+    def test_clause_type_is_inlined(self):
+        """Test the filter is a literal so the partial index predicate matches."""
+        sql = build_search_sql("code_b")
+
+        assert "WHERE clause_type = 'code_b'" in sql
+        assert "ORDER BY embedding <=> $1::vector" in sql
+        assert "WHERE clause_type" not in build_search_sql(None)
+
+    def test_rejects_unsafe_clause_types(self):
+        """Test clause types that are not plain identifiers are rejected."""
+        assert clause_type_index_name("code_h") == "clause_embeddings_code_h_hnsw_idx"
+        for bad in ["code_b'; DROP TABLE x; --", "Code B", "code-b"]:
+            with pytest.raises(ValueError):
+                build_search_sql(bad)
+
+    @pytest.mark.parametrize(
+        "quantization, indexed, ordered",
+        [
+            (
+                "halfvec",
+                "(embedding::halfvec(1536)) halfvec_cosine_ops",
+                "embedding::halfvec(1536) <=> $1::halfvec(1536)",
+            ),
+            (
+                "binary",
+                "(binary_quantize(embedding)::bit(1536)) bit_hamming_ops",
+                "binary_quantize(embedding)::bit(1536) <~> binary_quantize($1::vector)",
+            ),
+        ],
+    )
+    def test_quantized_search_rescores(self, quantization, indexed, ordered):
+        """Test quantized searches order on the indexed expression, then rescore."""
+        with patch.object(tuning.settings, "embedding_dimensions", 1536), patch.object(
+            tuning.settings, "vector_rescore_factor", 4
+        ):
+            index_sql = build_index_sql("code_f", quantization)
+            sql = build_search_sql("code_f", quantization)
+
+            assert candidate_count(10, quantization) == 40
+            assert candidate_count(10, "none") == 10
+
+        assert f"USING hnsw ({indexed})" in index_sql
+        assert clause_type_index_name("code_f", quantization) in index_sql
+        assert f"ORDER BY {ordered}" in sql
+        assert "LIMIT $2 * 4" in sql
+        assert sql.index("LIMIT $2 * 4") < sql.index(
+            "ORDER BY embedding <=> $1::vector"
+        )
+
+        with pytest.raises(ValueError):
+            build_search_sql("code_f", "pq")
+
+
+class TestIndexManagement:
+    """Test suite for building and verifying partial indexes."""
+
+    @pytest.mark.asyncio
+    async def test_ensure_builds_missing_and_invalid(self, vector_client):
+        """Test missing indexes are created and invalid ones rebuilt."""
+        conn = AsyncMock()
+        indexes = [
+            {"name": "clause_embeddings_code_b_hnsw_idx", "valid": True},
+            {"name": "clause_embeddings_code_c_hnsw_idx", "valid": False},
+        ]
+
+        with patch("asyncpg.connect", AsyncMock(return_value=conn)), patch.object(
+            vector_client, "get_vector_indexes", AsyncMock(return_value=indexes)
+        ):
+            outcome = await vector_client.ensure_clause_type_indexes(
+                ["code_b", "code_c", "code_d"]
+            )
+
+        assert outcome == {"code_b": "exists", "code_c": "rebuilt", "code_d": "created"}
+        statements = [call.args[0] for call in conn.execute.await_args_list]
+        assert any("DROP INDEX CONCURRENTLY" in s and "code_c" in s for s in statements)
+        created = [s for s in statements if "CREATE INDEX CONCURRENTLY" in s]
+        assert len(created) == 2
+        assert "WHERE clause_type = 'code_d'" in created[1]
+        conn.close.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_explain_reports_partial_index(self, vector_client):
+        """Test EXPLAIN output is checked for the clause type's index."""
+        plan = [
+            {
+                "Plan": {
+                    "Node Type": "Subquery Scan",
+                    "Plans": [
+                        {
+                            "Node Type": "Limit",
+                            "Plans": [
+                                {
+                                    "Node Type": "Index Scan",
+                                    "Index Name": "clause_embeddings_code_e_hnsw_idx",
+                                }
+                            ],
+                        }
+                    ],
+                }
+            }
+        ]
+        conn = AsyncMock()
+        conn.transaction = MagicMock()
+        conn.fetchval.side_effect = ["[0.1,0.2]", json.dumps(plan)]
+        vector_client._pools.primary = mock_pool(conn)
+
+        result = await vector_client.explain_filtered_search("code_e")
+
+        assert result["uses_partial_index"] is True
+        assert result["indexes_used"] == ["clause_embeddings_code_e_hnsw_idx"]
+        settings_sql = [call.args[0] for call in conn.execute.await_args_list]
+        assert any(s.startswith("SET LOCAL hnsw.ef_search") for s in settings_sql)
+
+
+class TestSearchTuning:
+    """Test suite for tuned per-clause-type search parameters."""
+
+    def test_tuned_params_override_settings(self, tmp_path):
+        """Test tuned clause types use their entry and others the settings."""
+        path = tmp_path / "tuning.json"
+        path.write_text(
+            json.dumps({"clause_types": {"code_b": {"ef_search": 24, "probes": 3}}})
+        )
+
+        with patch.object(
+            tuning.settings, "vector_search_tuning_path", str(path)
+        ), patch.object(tuning.settings, "vector_hnsw_ef_search", 64), patch.object(
+            tuning.settings, "vector_ivfflat_probes", 10
+        ):
+            assert tuning.get_search_params("code_b") == {"ef_search": 24, "probes": 3}
+            assert tuning.get_search_params("code_c") == {"ef_search": 64, "probes": 10}
+
+            path.write_text("not json")
+            assert tuning.load_search_tuning() == {}
+            assert tuning.get_search_params("code_b") == {"ef_search": 64, "probes": 10}
+
+    @pytest.mark.asyncio
+    async def test_search_applies_tuned_params(self, vector_client):
+        """Test direct SQL searches set the clause type's tuned parameters."""
+        conn = AsyncMock()
+        conn.transaction = MagicMock()
+        conn.fetch.return_value = [{"content": "Stairs", "similarity": 0.9}]
+        vector_client._pools.primary = mock_pool(conn)
+        vector_client._embed_query = AsyncMock(return_value=[0.1, 0.2])
+
+        with patch(
+            "agent_project.infrastructure.vector_db.client.get_search_params",
+            return_value={"ef_search": 24, "probes": 3},
+        ):
+            rows = await vector_client._search_sql("stairs", "code_b", 30, 0.5)
+
+        assert rows == [{"content": "Stairs", "similarity": 0.9}]
+        statements = [call.args[0] for call in conn.execute.await_args_list]
+        assert statements == [
+            "SET LOCAL hnsw.ef_search = 30",
+            "SET LOCAL ivfflat.probes = 3",
+        ]
@@ -0,0 +1,152 @@
+"""
+Tests for the incremental corpus ingestion tool.
+"""
+
+import asyncio
+import importlib.util
+import time
+from argparse import Namespace
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+TOOL_PATH = Path(__file__).parents[2] / "tools" / "ingest_corpus.py"
+spec = importlib.util.spec_from_file_location("ingest_corpus", TOOL_PATH)
+ingest_corpus = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(ingest_corpus)
+
+
+class WordTokenizer:
+    """Tokenizer stand-in with one token per word."""
+
+    def count(self, text):
+        return len(text.split())
+
+    def split(self, text, max_tokens):
+        words = text.split()
+        if len(words) <= max_tokens:
+            return [text]
+        return [
+            " ".join(words[start : start + max_tokens])  # noqa: E203
+            for start in range(0, len(words), max_tokens)
+        ]
+
+
+class TestChunking:
+    """Test suite for section-aware chunking and hashing."""
+
+    def test_chunks_follow_sections_and_pages(self):
+        """Test chunks never span a clause number or form feed."""
+        text = (
+            "Preamble text.\n\n"
+            "B1.3.1 Buildings shall resist loads.\n\nMore on loads.\n\n"
+            "B1.3.2 Bracing.\fBracing continued on page two."
+        )
+
+        chunks = ingest_corpus.chunk_text(text, WordTokenizer(), max_tokens=100)
+
+        assert [(c.section, c.page_number) for c in chunks] == [
+            ("", 1),
+            ("B1.3.1", 1),
+            ("B1.3.2", 1),
+            ("B1.3.2", 2),
+        ]
+        assert chunks[1].content == (
+            "B1.3.1 Buildings shall resist loads.\n\nMore on loads."
+        )
+
+    def test_long_sections_are_split_to_token_limit(self):
+        """Test oversized paragraphs are split to at most max_tokens."""
+        text = "B2.3.1 " + " ".join(f"word{n}" for n in range(25))
+
+        chunks = ingest_corpus.chunk_text(text, WordTokenizer(), max_tokens=10)
+
+        assert len(chunks) == 3
+        assert all(len(c.content.split()) <= 10 for c in chunks)
+        assert {c.section for c in chunks} == {"B2.3.1"}
+
+    def test_hash_diff(self):
+        """Test only new chunks are embedded and only stale rows deleted."""
+        model = "text-embedding-3-small"
+        kept = ingest_corpus.Chunk("Unchanged clause", "B1.1", 1)
+        added = ingest_corpus.Chunk("Amended clause", "B1.2", 1)
+        chunks = {ingest_corpus.hash_chunk(c, model): c for c in (kept, added)}
+        stored = [
+            {"id": 1, "content_hash": ingest_corpus.hash_chunk(kept, model)},
+            {"id": 2, "content_hash": "removed-clause-hash"},
+            {"id": 3, "content_hash": None},
+        ]
+
+        new, stale = ingest_corpus.diff_chunks(chunks, stored)
+
+        assert new == [added]
+        assert stale == [2, 3]
+        assert ingest_corpus.hash_chunk(kept, "other-model") not in chunks
+
+
+class TestRateLimiter:
+    """Test suite for the token bucket."""
+
+    @pytest.mark.asyncio
+    async def test_waits_once_capacity_is_used(self):
+        """Test acquiring beyond capacity waits for the bucket to refill."""
+        limiter = ingest_corpus.RateLimiter(per_minute=600)  # 10 per second
+        await limiter.acquire(600)
+
+        with patch.object(
+            ingest_corpus.asyncio, "sleep", AsyncMock()
+        ) as sleep, patch.object(ingest_corpus.time, "monotonic") as monotonic:
+            monotonic.side_effect = [limiter.updated, limiter.updated + 0.5]
+            await limiter.acquire(5)
+
+        sleep.assert_awaited_once_with(pytest.approx(0.5))
+
+    @pytest.mark.asyncio
+    async def test_unlimited(self):
+        """Test a zero rate never waits."""
+        limiter = ingest_corpus.RateLimiter(per_minute=0)
+        start = time.monotonic()
+        for _ in range(1000):
+            await limiter.acquire(1000)
+        assert time.monotonic() - start < 0.5
+
+
+@pytest.mark.asyncio
+async def test_worker_failure_stops_ingest(tmp_path):
+    """Test a failing worker ends the run instead of blocking the producer."""
+    for n in range(30):
+        path = tmp_path / "code_b" / f"doc{n}.md"
+        path.parent.mkdir(exist_ok=True)
+        path.write_text(f"B1.{n} Clause text.")
+    args = Namespace(
+        source=str(tmp_path),
+        clause_type=None,
+        dsn="postgresql://db",
+        model="text-embedding-3-small",
+        checkpoint=None,
+        workers=2,
+        dry_run=True,
+        batch_size=64,
+        retries=0,
+        concurrency=1,
+        requests_per_minute=0,
+        tokens_per_minute=0,
+    )
+
+    with patch.object(
+        ingest_corpus.asyncpg, "create_pool", AsyncMock(return_value=MagicMock())
+    ) as create_pool, patch.object(
+        ingest_corpus, "Tokenizer", return_value=WordTokenizer()
+    ), patch.object(
+        ingest_corpus, "LLMClient"
+    ), patch.object(
+        ingest_corpus,
+        "ingest_document",
+        AsyncMock(side_effect=RuntimeError("embedding auth failed")),
+    ):
+        create_pool.return_value.close = AsyncMock()
+        with pytest.raises(RuntimeError, match="embedding auth failed"):
+            await asyncio.wait_for(ingest_corpus.ingest(args), timeout=5)
+
+    create_pool.return_value.close.assert_awaited_once()
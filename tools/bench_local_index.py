@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Benchmark the in-process vector index against exact search.
+
+Reports recall@k (against brute-force search over the same clause type) and
+per-query latency for a sweep of nprobe values. Runs on the published
+artifact under EMBEDDING_ARTIFACT_PATH, or on a synthetic clustered corpus:
+
+    python tools/bench_local_index.py --synthetic 100000 --dim 1536
+"""
+
+import argparse
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add src directory to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import numpy as np  # noqa: E402
+
+from agent_project.config import settings  # noqa: E402
+from agent_project.infrastructure.vector_db.artifact import (  # noqa: E402
+    ArtifactWriter,
+    EmbeddingArtifact,
+)
+from agent_project.infrastructure.vector_db.local_index import (  # noqa: E402
+    LocalVectorIndex,
+)
+
+CLAUSE_TYPES = ["code_b", "code_c", "code_d", "code_e", "code_f", "code_g", "code_h"]
+
+
+def build_synthetic(root: Path, count: int, dim: int) -> None:
+    """Write a clustered synthetic artifact spread across clause types."""
+    rng = np.random.default_rng(0)
+    centres = rng.normal(size=(max(count // 200, 1), dim)).astype(np.float32)
+    writer = ArtifactWriter(root, count, dim, "synthetic")
+    per_type = count // len(CLAUSE_TYPES)
+    for t, clause_type in enumerate(CLAUSE_TYPES):
+        rows = per_type if t < len(CLAUSE_TYPES) - 1 else count - per_type * t
+        for i in range(rows):
+            centre = centres[rng.integers(len(centres))]
+            vector = centre + rng.normal(scale=0.5, size=dim).astype(np.float32)
+            writer.add({"id": i, "clause_type": clause_type}, vector)
+    writer.finish()
+
+
+def percentile(values: list, fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(int(len(ordered) * fraction), len(ordered) - 1)]
+
+
+def run(artifact: EmbeddingArtifact, queries: int, k: int, nprobes: list) -> None:
+    """Time exact and IVF search and print recall and latency."""
+    rng = np.random.default_rng(1)
+
+    start = time.perf_counter()
+    index = LocalVectorIndex(artifact)
+    print(
+        f"Built index over {len(artifact)} rows x {artifact.dim} dims "
+        f"in {time.perf_counter() - start:.2f}s"
+    )
+
+    # Queries are perturbed corpus rows, filtered to their own clause type
+    workload = []
+    for row in rng.integers(0, len(artifact), queries):
+        clause_type = artifact.record(int(row))["clause_type"]
+        noise = rng.normal(scale=0.1 / np.sqrt(artifact.dim), size=artifact.dim)
+        workload.append((np.asarray(artifact.embeddings[row]) + noise, clause_type))
+
+    truth, exact_ms = [], []
+    for query, clause_type in workload:
+        begin = time.perf_counter()
+        first, _ = artifact.row_range(clause_type)
+        scores = artifact.vectors(clause_type) @ query
+        top = np.argsort(scores)[::-1][:k]
+        exact_ms.append((time.perf_counter() - begin) * 1000)
+        truth.append(set((top + first).tolist()))
+
+    print(f"{'method':<14} {'recall@' + str(k):>10} {'p50 ms':>9} {'p95 ms':>9}")
+    print(
+        f"{'exact':<14} {1.0:>10.3f} {statistics.median(exact_ms):>9.3f} "
+        f"{percentile(exact_ms, 0.95):>9.3f}"
+    )
+
+    for nprobe in nprobes:
+        recalled, latencies = 0, []
+        for (query, clause_type), expected in zip(workload, truth):
+            begin = time.perf_counter()
+            matches = index.search(query, clause_type, k, -1.0, nprobe)
+            latencies.append((time.perf_counter() - begin) * 1000)
+            recalled += len({row for row, _ in matches} & expected)
+
+        recall = recalled / sum(len(expected) for expected in truth)
+        print(
+            f"{'ivf nprobe=' + str(nprobe):<14} {recall:>10.3f} "
+            f"{statistics.median(latencies):>9.3f} {percentile(latencies, 0.95):>9.3f}"
+        )
+
+
+def main():
+    """Main CLI function."""
+    parser = argparse.ArgumentParser(description="Benchmark the local vector index")
+    parser.add_argument(
+        "--artifact",
+        default=settings.embedding_artifact_path,
+        help="Artifact root (defaults to EMBEDDING_ARTIFACT_PATH)",
+    )
+    parser.add_argument(
+        "--synthetic", type=int, help="Benchmark a synthetic corpus of N rows"
+    )
+    parser.add_argument("--dim", type=int, default=1536)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("-k", type=int, default=10)
+    parser.add_argument("--nprobe", type=int, nargs="+", default=[1, 2, 4, 8, 16, 32])
+
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        if args.synthetic:
+            root = Path(tmp)
+            print(f"Writing synthetic artifact of {args.synthetic} rows...")
+            build_synthetic(root, args.synthetic, args.dim)
+        elif args.artifact:
+            root = Path(args.artifact)
+        else:
+            parser.error("--artifact, EMBEDDING_ARTIFACT_PATH or --synthetic required")
+
+        artifact = EmbeddingArtifact.open(root)
+        try:
+            run(artifact, args.queries, args.k, args.nprobe)
+        finally:
+            artifact.close()
+
+
+if __name__ == "__main__":
+    main()
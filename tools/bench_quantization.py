@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Compare recall and latency of the vector storage modes.
+
+For a sample of stored embeddings per clause type, computes the exact top-k
+with a sequential scan, then runs the API's search SQL in each storage mode
+whose indexes exist (full precision, halfvec, binary; the quantized modes
+rescore VECTOR_RESCORE_FACTOR x k candidates) and reports recall@k, latency
+and index size:
+
+    python tools/bench_quantization.py --sample 50 --rescore-factor 2 4 8
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List
+
+# Add src directory to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import asyncpg  # noqa: E402
+from migrate_quantized_index import index_sizes  # noqa: E402
+from tune_vector_search import sample_stored_vectors, search  # noqa: E402
+
+from agent_project.config import settings  # noqa: E402
+from agent_project.infrastructure.vector_db.client import (  # noqa: E402
+    INDEX_SUFFIXES,
+    VectorDBClient,
+    clause_type_index_name,
+)
+
+
+async def run_mode(
+    conn: asyncpg.Connection,
+    vectors: Dict[str, List[str]],
+    truth: Dict[str, List[set]],
+    mode: str,
+    k: int,
+) -> Dict[str, float]:
+    """Recall@k and latency percentiles of one storage mode."""
+    found = total = 0
+    latencies = []
+    for clause_type, queries in vectors.items():
+        for vector, expected in zip(queries, truth[clause_type]):
+            start = time.perf_counter()
+            ids = await search(
+                conn,
+                clause_type,
+                vector,
+                k,
+                settings.vector_hnsw_ef_search,
+                settings.vector_ivfflat_probes,
+                quantization=mode,
+            )
+            latencies.append((time.perf_counter() - start) * 1000)
+            found += len(ids & expected)
+            total += len(expected)
+
+    latencies.sort()
+    return {
+        "recall": found / total if total else 1.0,
+        "p50_ms": statistics.median(latencies),
+        "p95_ms": latencies[min(int(len(latencies) * 0.95), len(latencies) - 1)],
+    }
+
+
+async def bench(args: argparse.Namespace) -> None:
+    """Benchmark every storage mode whose indexes exist."""
+    client = VectorDBClient()
+    indexes = await client.get_vector_indexes()
+    await client.close()
+    names = {index["name"] for index in indexes if index["valid"]}
+    sizes = index_sizes(indexes)
+
+    conn = await asyncpg.connect(args.dsn)
+    try:
+        vectors = await sample_stored_vectors(conn, args.sample)
+        truth = {
+            clause_type: [
+                await search(conn, clause_type, vector, args.k, args.k, 1, exact=True)
+                for vector in queries
+            ]
+            for clause_type, queries in vectors.items()
+        }
+
+        print(
+            f"{'mode':<18} {'recall@' + str(args.k):>9} {'p50 ms':>8} {'p95 ms':>8} {'index MiB':>10}"
+        )
+        for mode in INDEX_SUFFIXES:
+            if not all(clause_type_index_name(ct, mode) in names for ct in vectors):
+                print(f"{mode:<18} skipped: indexes missing")
+                continue
+
+            factors = [1] if mode == "none" else args.rescore_factor
+            for factor in factors:
+                settings.vector_rescore_factor = factor
+                # Warm the index pages before timing
+                await run_mode(conn, vectors, truth, mode, args.k)
+                result = await run_mode(conn, vectors, truth, mode, args.k)
+                label = mode if mode == "none" else f"{mode} x{factor}"
+                print(
+                    f"{label:<18} {result['recall']:>9.3f} {result['p50_ms']:>8.2f} "
+                    f"{result['p95_ms']:>8.2f} {sizes[mode] / 2**20:>10.1f}"
+                )
+    finally:
+        await conn.close()
+
+
+def main():
+    """Main CLI function."""
+    parser = argparse.ArgumentParser(description="Benchmark vector storage modes")
+    parser.add_argument("--dsn", default=settings.database_url)
+    parser.add_argument("--sample", type=int, default=50, help="Queries per type")
+    parser.add_argument("-k", type=int, default=settings.max_vector_results)
+    parser.add_argument(
+        "--rescore-factor",
+        type=int,
+        nargs="+",
+        default=[settings.vector_rescore_factor],
+        help="Candidate multipliers to try for the quantized modes",
+    )
+
+    args = parser.parse_args()
+    if not args.dsn:
+        parser.error("--dsn or DATABASE_URL is required")
+
+    asyncio.run(bench(args))
+
+
+if __name__ == "__main__":
+    main()
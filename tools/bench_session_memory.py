@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Benchmark session history loading (row -> ChatMessage mapping).
+
+By default runs against synthetic rows shaped like the asyncpg records
+returned by SessionMemoryClient.get_session_messages. Pass --session-id to
+also time full history loads of that session from DATABASE_URL.
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import time
+import uuid
+from datetime import datetime, timezone
+from pathlib import Path
+
+# Add src directory to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from agent_project.infrastructure.vector_db.session_memory import (  # noqa: E402
+    ChatMessage,
+    SessionMemoryClient,
+)
+
+
+def build_rows(count: int) -> list[tuple]:
+    """Build synthetic history rows in _MESSAGE_COLUMNS order."""
+    session_id = uuid.uuid4()
+    now = datetime.now(timezone.utc)
+    return [
+        (
+            uuid.uuid4(),
+            session_id,
+            "user" if i % 2 == 0 else "assistant",
+            f"Message {i} about clause B1.3.{i % 7} and its acceptable solutions",
+            json.dumps({"agent_used": "code_b", "sources": [f"B1.3.{i % 7}"]}),
+            now,
+        )
+        for i in range(count)
+    ]
+
+
+def time_it(fn, iterations: int) -> list[float]:
+    """Return per-iteration timings in microseconds."""
+    timings = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - start) * 1_000_000)
+    return timings
+
+
+def report(label: str, timings: list[float]) -> None:
+    ordered = sorted(timings)
+    p95 = ordered[int(len(ordered) * 0.95) - 1]
+    print(
+        f"{label:<32} median={statistics.median(ordered):8.1f}us "
+        f"p95={p95:8.1f}us min={ordered[0]:8.1f}us"
+    )
+
+
+def run_synthetic(messages: int, iterations: int) -> None:
+    rows = build_rows(messages)
+
+    def keyword_mapping():
+        # Previous approach: keyword construction plus eager JSON decoding
+        return [
+            ChatMessage(
+                session_id=row[1],
+                message_id=row[0],
+                role=row[2],
+                content=row[3],
+                metadata=json.loads(row[4]),
+                created_at=row[5],
+            )
+            for row in rows
+        ]
+
+    def positional_mapping():
+        from_record = ChatMessage.from_record
+        return [from_record(row) for row in rows]
+
+    def positional_mapping_with_metadata():
+        from_record = ChatMessage.from_record
+        return [from_record(row).metadata for row in rows]
+
+    print(f"Synthetic history load: {messages} messages x {iterations} iterations")
+    report("keyword + eager json", time_it(keyword_mapping, iterations))
+    report("positional (lazy metadata)", time_it(positional_mapping, iterations))
+    report(
+        "positional + metadata access",
+        time_it(positional_mapping_with_metadata, iterations),
+    )
+
+
+async def run_database(session_id: str, messages: int, iterations: int) -> None:
+    client = SessionMemoryClient()
+    try:
+        timings = []
+        for _ in range(iterations):
+            start = time.perf_counter()
+            await client.get_session_messages(session_id, limit=messages)
+            timings.append((time.perf_counter() - start) * 1_000_000)
+        report("database get_session_messages", timings)
+    finally:
+        await client.close()
+
+
+def main():
+    """Main CLI function."""
+    parser = argparse.ArgumentParser(description="Benchmark session history loads")
+    parser.add_argument("--messages", type=int, default=100)
+    parser.add_argument("--iterations", type=int, default=2000)
+    parser.add_argument(
+        "--session-id",
+        help="Existing session to load from DATABASE_URL (enables the DB benchmark)",
+    )
+
+    args = parser.parse_args()
+
+    run_synthetic(args.messages, args.iterations)
+
+    if args.session_id:
+        asyncio.run(
+            run_database(args.session_id, args.messages, max(args.iterations // 20, 1))
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Calibrate per-clause-type retrieval confidence thresholds.
+
+Runs labelled questions through the same similarity search the specialists
+use, records the top similarity score of each, and picks per clause type
+the highest threshold that still keeps --target-recall of the answerable
+questions. Questions scoring below it are answered "I don't know" without
+an LLM call (see agent_project.core.tools.confidence_gate); the report
+shows what share of out-of-scope questions that catches.
+
+Questions are JSON lines with "query", "clause_type" and "answerable":
+
+    {"query": "Minimum handrail height?", "clause_type": "code_d", "answerable": true}
+    {"query": "Best paint colour?", "clause_type": "code_d", "answerable": false}
+
+    python tools/calibrate_confidence.py --queries labelled.jsonl --out confidence.json
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+from collections import defaultdict
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+# Add src directory to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from agent_project.config import settings  # noqa: E402
+from agent_project.core.tools.confidence_gate import top_score  # noqa: E402
+from agent_project.infrastructure.vector_db.client import VectorDBClient  # noqa: E402
+
+# Search parameters the specialist agents retrieve with
+SPECIALIST_LIMIT = 5
+
+
+def read_labelled(path: Path) -> Dict[str, List[Tuple[str, bool]]]:
+    """Labelled questions grouped by clause type."""
+    labelled: Dict[str, List[Tuple[str, bool]]] = defaultdict(list)
+    for line in path.read_text().splitlines():
+        if line.strip():
+            entry = json.loads(line)
+            labelled[entry["clause_type"]].append(
+                (entry["query"], bool(entry["answerable"]))
+            )
+    return labelled
+
+
+def choose_threshold(
+    answerable: List[float], unanswerable: List[float], target_recall: float
+) -> Dict[str, float]:
+    """
+    Highest threshold keeping ``target_recall`` of answerable questions.
+
+    Returns:
+        The threshold and the resulting share of answerable questions kept
+        and of unanswerable questions gated
+    """
+    if not answerable:
+        return {"min_score": 0.0, "answerable_kept": 1.0, "gated": 0.0}
+
+    ordered = sorted(answerable, reverse=True)
+    keep = max(1, min(len(ordered), int(round(len(ordered) * target_recall))))
+    threshold = ordered[keep - 1]
+
+    return {
+        "min_score": round(threshold, 4),
+        "answerable_kept": sum(s >= threshold for s in answerable) / len(answerable),
+        "gated": (
+            sum(s < threshold for s in unanswerable) / len(unanswerable)
+            if unanswerable
+            else 0.0
+        ),
+    }
+
+
+async def calibrate(args: argparse.Namespace) -> Dict:
+    """Score every labelled question and pick thresholds."""
+    labelled = read_labelled(Path(args.queries))
+    client = VectorDBClient()
+    calibrated = {}
+    try:
+        for clause_type, questions in sorted(labelled.items()):
+            scores: Dict[bool, List[float]] = {True: [], False: []}
+            for query, answerable in questions:
+                # No threshold, so the raw top score is seen even when low
+                results = await client.similarity_search(
+                    query, clause_type, SPECIALIST_LIMIT, similarity_threshold=0.0
+                )
+                scores[answerable].append(top_score(results))
+
+            calibrated[clause_type] = {
+                **choose_threshold(scores[True], scores[False], args.target_recall),
+                "answerable": len(scores[True]),
+                "unanswerable": len(scores[False]),
+            }
+    finally:
+        await client.close()
+
+    return {
+        "target_recall": args.target_recall,
+        "calibrated_at": datetime.now(timezone.utc).isoformat(),
+        "clause_types": calibrated,
+    }
+
+
+def main():
+    """Main CLI function."""
+    parser = argparse.ArgumentParser(description="Calibrate confidence thresholds")
+    parser.add_argument("--queries", required=True, help="Labelled JSON lines")
+    parser.add_argument(
+        "--out", default=settings.retrieval_confidence_path or "confidence.json"
+    )
+    parser.add_argument(
+        "--target-recall",
+        type=float,
+        default=0.98,
+        help="Share of answerable questions that must still reach the LLM",
+    )
+
+    args = parser.parse_args()
+    result = asyncio.run(calibrate(args))
+
+    Path(args.out).write_text(json.dumps(result, indent=2))
+    print(f"\n{'clause_type':<12} {'min_score':>9} {'kept':>6} {'gated':>6} {'n':>7}")
+    for clause_type, entry in result["clause_types"].items():
+        print(
+            f"{clause_type:<12} {entry['min_score']:>9.4f} "
+            f"{entry['answerable_kept']:>6.2f} {entry['gated']:>6.2f} "
+            f"{entry['answerable']:>3}/{entry['unanswerable']:<3}"
+        )
+    print(f"\nSaved to {args.out}; set RETRIEVAL_CONFIDENCE_PATH to apply")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+Cold-start benchmark for the API server.
+
+Starts uvicorn in a fresh interpreter (as Cloud Run does when scaling from
+zero) against tools/fake_upstream.py and measures, from process spawn:
+
+- listening: first successful liveness probe (/api/health/live)
+- started:   startup probe passing, i.e. warm-up finished (/api/health/startup)
+- first request: first /api/v1/chat response, sent once the startup probe
+  passes, like the first request Cloud Run routes to a new instance
+
+Also reports the import time of the application module:
+
+    python tools/cold_start.py --runs 5
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+# Add src directory to Python path
+SRC_DIR = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(SRC_DIR))
+
+import httpx  # noqa: E402
+from fake_upstream import UpstreamConfig, create_fake_upstream  # noqa: E402
+from loadtest import (  # noqa: E402
+    ServerThread,
+    build_signing_material,
+    free_port,
+    git_commit,
+    make_tokens,
+)
+
+
+def wait_for(client: httpx.Client, path: str, deadline: float) -> float:
+    """Poll a path until it returns 200; return the time it first did."""
+    while time.perf_counter() < deadline:
+        try:
+            if client.get(path).status_code == 200:
+                return time.perf_counter()
+        except httpx.TransportError:
+            pass
+        time.sleep(0.01)
+    raise TimeoutError(f"{path} did not become available")
+
+
+def measure_import(env: Dict[str, str]) -> float:
+    """Cumulative import time of the application module in seconds."""
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-X",
+            "importtime",
+            "-c",
+            "import agent_project.application.main",
+        ],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+    for line in result.stderr.splitlines():
+        if line.rstrip().endswith("| agent_project.application.main"):
+            return int(line.split("|")[1]) / 1_000_000
+    raise RuntimeError("Could not find application import time")
+
+
+def cold_start(env: Dict[str, str], token: str, timeout: float) -> Dict[str, float]:
+    """Spawn the server once and time it until the first chat response."""
+    port = free_port()
+    base_url = f"http://127.0.0.1:{port}"
+
+    spawned = time.perf_counter()
+    process = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "uvicorn",
+            "agent_project.application.main:app",
+            "--host",
+            "127.0.0.1",
+            "--port",
+            str(port),
+            "--log-level",
+            "warning",
+        ],
+        env=env,
+    )
+
+    try:
+        deadline = spawned + timeout
+        with httpx.Client(base_url=base_url, timeout=timeout) as client:
+            listening = wait_for(client, "/api/health/live", deadline)
+            started = wait_for(client, "/api/health/startup", deadline)
+
+            request_start = time.perf_counter()
+            response = client.post(
+                "/api/v1/chat",
+                json={"content": "What are the handrail requirements for stairs?"},
+                headers={"Authorization": f"Bearer {token}"},
+            )
+            response.raise_for_status()
+            first_request = time.perf_counter()
+    finally:
+        process.terminate()
+        process.wait(timeout=30)
+
+    return {
+        "listening_ms": (listening - spawned) * 1000,
+        "started_ms": (started - spawned) * 1000,
+        "first_request_ms": (first_request - spawned) * 1000,
+        "first_request_latency_ms": (first_request - request_start) * 1000,
+    }
+
+
+def summarise(runs: List[Dict[str, float]]) -> Dict[str, Dict[str, float]]:
+    """Median, min and max of each measurement across runs."""
+    return {
+        key: {
+            "median": round(statistics.median(run[key] for run in runs), 1),
+            "min": round(min(run[key] for run in runs), 1),
+            "max": round(max(run[key] for run in runs), 1),
+        }
+        for key in runs[0]
+    }
+
+
+def main():
+    """Main CLI function."""
+    parser = argparse.ArgumentParser(description="Measure API cold-start time")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--timeout", type=float, default=60.0)
+    parser.add_argument("--output", help="Write results as JSON to this file")
+
+    args = parser.parse_args()
+
+    private_pem, jwks_document = build_signing_material()
+    upstream_port = free_port()
+    upstream_url = f"http://127.0.0.1:{upstream_port}"
+    upstream = ServerThread(
+        create_fake_upstream(
+            # Instant upstreams, so only the API server's own start-up is measured
+            UpstreamConfig(
+                llm_latency_ms=0,
+                token_rate=1_000_000,
+                db_latency_ms=0,
+                jwks=jwks_document,
+            )
+        ),
+        upstream_port,
+    )
+    upstream.start_and_wait()
+
+    env: Dict[str, Any] = {
+        **os.environ,
+        "PYTHONPATH": str(SRC_DIR),
+        "APP_ENV": "loadtest",
+        "LOG_LEVEL": "WARNING",
+        "SUPABASE_URL": upstream_url,
+        "SUPABASE_ANON_KEY": "cold-start-anon-key",
+        "SUPABASE_SERVICE_ROLE_KEY": "cold-start-service-key",
+        "OPENAI_API_KEY": "cold-start-openai-key",
+        "OPENAI_BASE_URL": f"{upstream_url}/v1",
+        "ANTHROPIC_API_KEY": "cold-start-anthropic-key",
+        "ANTHROPIC_BASE_URL": upstream_url,
+    }
+    token = make_tokens(private_pem, f"{upstream_url}/auth/v1", 1)[0]
+
+    try:
+        import_seconds = measure_import(env)
+        runs = []
+        for run in range(args.runs):
+            result = cold_start(env, token, args.timeout)
+            runs.append(result)
+            print(
+                f"Run {run + 1}: "
+                + ", ".join(f"{key}={value:.1f}" for key, value in result.items())
+            )
+    finally:
+        upstream.stop()
+
+    summary = summarise(runs)
+    print(f"\nImport agent_project.application.main: {import_seconds * 1000:.1f} ms")
+    for key, stats in summary.items():
+        print(
+            f"{key:<26} median {stats['median']:>8.1f} "
+            f"min {stats['min']:>8.1f} max {stats['max']:>8.1f}"
+        )
+
+    if args.output:
+        report = {
+            "commit": git_commit(),
+            "import_ms": round(import_seconds * 1000, 1),
+            "runs": runs,
+            "summary": summary,
+        }
+        Path(args.output).write_text(json.dumps(report, indent=2))
+        print(f"\nResults saved to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
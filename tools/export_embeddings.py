@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Export clause embeddings into a versioned, memory-mappable artifact.
+
+Streams every row of ``clause_embeddings`` (ordered by clause_type) into an
+artifact root (see agent_project.infrastructure.vector_db.artifact) and
+points its CURRENT file at the new version. Instances pick it up through
+EMBEDDING_ARTIFACT_PATH:
+
+    python tools/export_embeddings.py --out artifacts/embeddings
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+# Add src directory to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import asyncpg  # noqa: E402
+import numpy as np  # noqa: E402
+
+from agent_project.config import settings  # noqa: E402
+from agent_project.infrastructure.vector_db.artifact import (  # noqa: E402
+    RECORD_FIELDS,
+    ArtifactWriter,
+)
+
+EXPORT_QUERY = f"""
+    SELECT {", ".join(RECORD_FIELDS)}, embedding::text AS embedding
+    FROM clause_embeddings
+    WHERE embedding IS NOT NULL
+    ORDER BY clause_type, id
+"""
+
+
+def parse_vector(text: str) -> np.ndarray:
+    """Parse pgvector's text form ``[0.1,0.2,...]``."""
+    return np.fromstring(text.strip("[]"), sep=",", dtype=np.float32)
+
+
+async def export(dsn: str, out: Path, model: str, batch_size: int) -> str:
+    """Stream the table into a new artifact version and return its name."""
+    conn = await asyncpg.connect(dsn)
+    try:
+        # One snapshot for the count and the rows, so concurrent writes
+        # cannot make them disagree
+        async with conn.transaction(isolation="repeatable_read", readonly=True):
+            count = await conn.fetchval(
+                "SELECT COUNT(*) FROM clause_embeddings WHERE embedding IS NOT NULL"
+            )
+            if not count:
+                raise SystemExit("clause_embeddings has no embedded rows")
+
+            dim = await conn.fetchval(
+                "SELECT vector_dims(embedding) FROM clause_embeddings "
+                "WHERE embedding IS NOT NULL LIMIT 1"
+            )
+            print(f"Exporting {count} rows of {dim} dimensions to {out}")
+
+            writer = ArtifactWriter(out, count, dim, model)
+            try:
+                exported = 0
+                async for row in conn.cursor(EXPORT_QUERY, prefetch=batch_size):
+                    writer.add(dict(row), parse_vector(row["embedding"]))
+                    exported += 1
+                    if exported % 10000 == 0:
+                        print(f"  {exported}/{count}")
+            except BaseException:
+                writer.abort()
+                raise
+
+        return writer.finish()
+    finally:
+        await conn.close()
+
+
+def main():
+    """Main CLI function."""
+    parser = argparse.ArgumentParser(description="Export clause embeddings")
+    parser.add_argument(
+        "--out",
+        default=settings.embedding_artifact_path or "artifacts/embeddings",
+        help="Artifact root directory",
+    )
+    parser.add_argument("--dsn", default=settings.database_url)
+    parser.add_argument(
+        "--model",
+        default=settings.embedding_model,
+        help="Embedding model recorded in the manifest",
+    )
+    parser.add_argument("--batch-size", type=int, default=2000)
+
+    args = parser.parse_args()
+    if not args.dsn:
+        parser.error("--dsn or DATABASE_URL is required")
+
+    start = time.perf_counter()
+    version = asyncio.run(export(args.dsn, Path(args.out), args.model, args.batch_size))
+    print(f"Published version {version} in {time.perf_counter() - start:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,284 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for the API's upstream dependencies, used by load tests.
+
+Serves, from a single FastAPI app:
+- OpenAI chat completions (streaming and non-streaming) and embeddings
+- Anthropic Messages API
+- Supabase JWKS (/auth/v1/.well-known/jwks.json)
+- Supabase PostgREST RPC for match_documents (in-memory corpus)
+
+Latency and token throughput are configurable so the API can be measured
+against realistic provider behaviour without network calls or API spend.
+Requests served and error responses (status >= 400) are counted in
+``app.state.stats`` so callers can check the API really used the stand-ins.
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import random
+import time
+import uuid
+from dataclasses import dataclass, field
+from typing import Any, Dict, List
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+
+CLAUSE_TYPES = ["code_b", "code_c", "code_d", "code_e", "code_f", "code_g", "code_h"]
+
+INTENTS = [
+    "general_building",
+    "energy_efficiency",
+    "building_envelope",
+    "mechanical_systems",
+    "lighting",
+    "plumbing",
+    "electrical",
+    "accessibility",
+]
+
+
+@dataclass
+class UpstreamConfig:
+    """Behaviour of the fake upstream services."""
+
+    llm_latency_ms: float = 300.0
+    token_rate: float = 50.0  # tokens per second after the first token
+    response_tokens: int = 120
+    db_latency_ms: float = 20.0
+    corpus_size: int = 500
+    match_count_cap: int = 10
+    embedding_dim: int = 1536
+    jwks: Dict[str, Any] = field(default_factory=lambda: {"keys": []})
+
+
+def build_corpus(size: int) -> List[Dict[str, Any]]:
+    """Build a synthetic clause corpus spread across clause types."""
+    corpus = []
+    for i in range(size):
+        clause_type = CLAUSE_TYPES[i % len(CLAUSE_TYPES)]
+        letter = clause_type[-1].upper()
+        section = f"{letter}{1 + i % 3}.{1 + i % 5}.{1 + i % 9}"
+        corpus.append(
+            {
+                "id": i,
+                "content": f"Clause {section}: synthetic requirement text {i} " * 8,
+                "clause_type": clause_type,
+                "section": section,
+                "source": "NZBC synthetic corpus",
+                "page_number": 1 + i // 4,
+                "document_id": f"doc-{clause_type}",
+            }
+        )
+    return corpus
+
+
+def create_fake_upstream(config: UpstreamConfig) -> FastAPI:
+    """Create the fake upstream app."""
+    app = FastAPI(title="Fake upstream")
+    corpus = build_corpus(config.corpus_size)
+    words = ["clause", "building", "requirement", "compliance", "acceptable"]
+
+    app.state.stats = {"requests": 0, "errors": 0}
+
+    @app.middleware("http")
+    async def count_requests(request: Request, call_next):
+        app.state.stats["requests"] += 1
+        try:
+            response = await call_next(request)
+        except Exception:
+            app.state.stats["errors"] += 1
+            raise
+        if response.status_code >= 400:
+            app.state.stats["errors"] += 1
+        return response
+
+    def completion_text(prompt: str) -> str:
+        # Classification prompts expect a bare category name
+        if prompt.rstrip().endswith("Category:"):
+            return random.choice(INTENTS)
+        return " ".join(random.choice(words) for _ in range(config.response_tokens))
+
+    def generation_seconds() -> float:
+        return config.llm_latency_ms / 1000 + config.response_tokens / config.token_rate
+
+    @app.get("/auth/v1/.well-known/jwks.json")
+    async def jwks() -> Dict[str, Any]:
+        return config.jwks
+
+    @app.get("/rest/v1/clause_embeddings")
+    async def clause_embeddings() -> List[Dict[str, Any]]:
+        # Health check query: select id limit 1
+        await asyncio.sleep(config.db_latency_ms / 1000)
+        return [{"id": 1}]
+
+    @app.post("/rest/v1/rpc/match_documents")
+    async def match_documents(request: Request) -> JSONResponse:
+        params = await request.json()
+        await asyncio.sleep(config.db_latency_ms / 1000)
+
+        clause_type = params.get("clause_type")
+        candidates = [
+            row
+            for row in corpus
+            if clause_type is None or row["clause_type"] == clause_type
+        ]
+        count = min(int(params.get("match_count", 5)), config.match_count_cap)
+        sample = random.sample(candidates, min(count, len(candidates)))
+        rows = [
+            {**row, "similarity": round(0.95 - rank * 0.02, 4)}
+            for rank, row in enumerate(sample)
+        ]
+        return JSONResponse(rows)
+
+    @app.post("/v1/chat/completions")
+    async def openai_chat(request: Request):
+        body = await request.json()
+        prompt = body["messages"][-1]["content"]
+        text = completion_text(prompt)
+        model = body.get("model", "gpt-4-turbo-preview")
+        completion_id = f"chatcmpl-{uuid.uuid4().hex}"
+
+        if body.get("stream"):
+
+            async def stream():
+                await asyncio.sleep(config.llm_latency_ms / 1000)
+                for token in text.split(" "):
+                    chunk = {
+                        "id": completion_id,
+                        "object": "chat.completion.chunk",
+                        "created": int(time.time()),
+                        "model": model,
+                        "choices": [
+                            {
+                                "index": 0,
+                                "delta": {"content": token + " "},
+                                "finish_reason": None,
+                            }
+                        ],
+                    }
+                    yield f"data: {json.dumps(chunk)}\n\n"
+                    await asyncio.sleep(1 / config.token_rate)
+                yield "data: [DONE]\n\n"
+
+            return StreamingResponse(stream(), media_type="text/event-stream")
+
+        await asyncio.sleep(generation_seconds())
+        return JSONResponse(
+            {
+                "id": completion_id,
+                "object": "chat.completion",
+                "created": int(time.time()),
+                "model": model,
+                "choices": [
+                    {
+                        "index": 0,
+                        "message": {"role": "assistant", "content": text},
+                        "finish_reason": "stop",
+                    }
+                ],
+                "usage": {
+                    "prompt_tokens": len(prompt) // 4,
+                    "completion_tokens": len(text.split(" ")),
+                    "total_tokens": len(prompt) // 4 + len(text.split(" ")),
+                },
+            }
+        )
+
+    @app.post("/v1/embeddings")
+    async def openai_embeddings(request: Request) -> JSONResponse:
+        body = await request.json()
+        inputs = body["input"] if isinstance(body["input"], list) else [body["input"]]
+        await asyncio.sleep(config.llm_latency_ms / 1000)
+
+        data = []
+        for i, text in enumerate(inputs):
+            # Deterministic per input, so repeated queries embed identically
+            seed = hashlib.sha256(str(text).encode()).digest()
+            rng = random.Random(seed)
+            vector = [rng.gauss(0, 1) for _ in range(config.embedding_dim)]
+            data.append({"object": "embedding", "index": i, "embedding": vector})
+
+        return JSONResponse(
+            {
+                "object": "list",
+                "data": data,
+                "model": body.get("model", "text-embedding-3-small"),
+                "usage": {"prompt_tokens": len(inputs), "total_tokens": len(inputs)},
+            }
+        )
+
+    @app.post("/v1/messages")
+    async def anthropic_messages(request: Request) -> JSONResponse:
+        body = await request.json()
+        content = body["messages"][-1]["content"]
+        if isinstance(content, list):
+            content = "".join(block.get("text", "") for block in content)
+        text = completion_text(content)
+        await asyncio.sleep(generation_seconds())
+        return JSONResponse(
+            {
+                "id": f"msg_{uuid.uuid4().hex}",
+                "type": "message",
+                "role": "assistant",
+                "content": [{"type": "text", "text": text}],
+                "model": body.get("model", "claude-3-sonnet-20240229"),
+                "stop_reason": "end_turn",
+                "stop_sequence": None,
+                "usage": {
+                    "input_tokens": (len(body.get("system", "")) + len(content)) // 4,
+                    "output_tokens": len(text.split(" ")),
+                },
+            }
+        )
+
+    @app.get("/v1/models")
+    async def models() -> Dict[str, Any]:
+        # Shape accepted by both the OpenAI and Anthropic SDKs
+        model = {
+            "id": "fake-model",
+            "object": "model",
+            "type": "model",
+            "created": 0,
+            "created_at": "2024-01-01T00:00:00Z",
+            "owned_by": "fake-upstream",
+            "display_name": "Fake model",
+        }
+        return {
+            "object": "list",
+            "data": [model],
+            "has_more": False,
+            "first_id": model["id"],
+            "last_id": model["id"],
+        }
+
+    return app
+
+
+def main():
+    """Run the fake upstream standalone."""
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description="Run fake LLM/Supabase upstreams")
+    parser.add_argument("--port", type=int, default=8900)
+    parser.add_argument("--llm-latency-ms", type=float, default=300.0)
+    parser.add_argument("--token-rate", type=float, default=50.0)
+    parser.add_argument("--response-tokens", type=int, default=120)
+    parser.add_argument("--db-latency-ms", type=float, default=20.0)
+
+    args = parser.parse_args()
+
+    config = UpstreamConfig(
+        llm_latency_ms=args.llm_latency_ms,
+        token_rate=args.token_rate,
+        response_tokens=args.response_tokens,
+        db_latency_ms=args.db_latency_ms,
+    )
+    uvicorn.run(create_fake_upstream(config), host="127.0.0.1", port=args.port)
+
+
+if __name__ == "__main__":
+    main()
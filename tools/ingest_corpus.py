@@ -0,0 +1,502 @@
+#!/usr/bin/env python3
+"""
+Incremental corpus ingestion into ``clause_embeddings``.
+
+Streams source documents, splits them into section-aligned chunks and hashes
+each chunk. Only chunks whose hash is not already stored for the document are
+embedded, in concurrent rate-limited batches; stored chunks that no longer
+appear are deleted. Each document's changes are written in one transaction
+by COPY into a staging table, so an amendment touching a few clauses only
+re-embeds those clauses.
+
+Sources (--source DIR, searched recursively):
+- *.md / *.txt: plain text; a line starting with a clause number such as
+  "B1.3.4" or a markdown heading starts a new chunk, form feeds start a page
+- *.jsonl: pre-split chunks, one JSON object per line with "content" and
+  optional "section" and "page_number"
+
+The clause type is the first directory below --source (docs/code_b/...)
+unless --clause-type is given. With --checkpoint, finished documents are
+recorded so an interrupted run resumes where it stopped:
+
+    python tools/ingest_corpus.py --source docs/ --checkpoint ingest.json
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import os
+import re
+import sys
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Tuple
+
+# Add src directory to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import asyncpg  # noqa: E402
+
+from agent_project.config import settings  # noqa: E402
+from agent_project.infrastructure.llm.client import LLMClient  # noqa: E402
+from agent_project.infrastructure.vector_db.client import (  # noqa: E402
+    CLAUSE_TYPE_PATTERN,
+)
+
+SOURCE_SUFFIXES = {".md", ".txt", ".jsonl"}
+
+# A clause number (optionally after a markdown heading) starts a new section
+SECTION_PATTERN = re.compile(r"^\s*(?:#+\s*)?(?:Clause\s+)?([A-H]\d+(?:\.\d+)*)\b")
+
+SETUP_STATEMENTS = [
+    "ALTER TABLE clause_embeddings ADD COLUMN IF NOT EXISTS content_hash text",
+    "CREATE INDEX CONCURRENTLY IF NOT EXISTS clause_embeddings_document_hash_idx "
+    "ON clause_embeddings (document_id, content_hash)",
+]
+
+STAGING_TABLE = "clause_embeddings_ingest"
+STAGING_COLUMNS = [
+    "content",
+    "clause_type",
+    "source",
+    "section",
+    "page_number",
+    "document_id",
+    "content_hash",
+    "embedding",
+]
+
+
+@dataclass
+class Chunk:
+    """One embeddable piece of a document."""
+
+    content: str
+    section: str
+    page_number: Optional[int]
+    content_hash: str = ""
+
+
+@dataclass
+class Document:
+    """A source file and where its chunks are stored."""
+
+    path: Path
+    document_id: str
+    clause_type: str
+    file_hash: str
+
+
+@dataclass
+class IngestStats:
+    """Counters for the throughput report."""
+
+    documents: int = 0
+    resumed: int = 0
+    chunks: int = 0
+    unchanged: int = 0
+    embedded: int = 0
+    deleted: int = 0
+    tokens: int = 0
+    started: float = field(default_factory=time.perf_counter)
+
+    def report(self) -> str:
+        elapsed = time.perf_counter() - self.started
+        return (
+            f"{self.documents} documents ({self.resumed} resumed from checkpoint), "
+            f"{self.chunks} chunks: {self.unchanged} unchanged, "
+            f"{self.embedded} embedded, {self.deleted} deleted "
+            f"in {elapsed:.1f}s | {self.chunks / elapsed:.1f} chunks/s, "
+            f"{self.embedded / elapsed:.1f} embedded/s, "
+            f"{self.tokens / elapsed:.0f} tokens/s"
+        )
+
+
+class Tokenizer:
+    """Token counting and splitting for the embedding model."""
+
+    def __init__(self, model: str):
+        import tiktoken
+
+        try:
+            self.encoding = tiktoken.encoding_for_model(model)
+        except KeyError:
+            self.encoding = tiktoken.get_encoding("cl100k_base")
+
+    def count(self, text: str) -> int:
+        return len(self.encoding.encode(text))
+
+    def split(self, text: str, max_tokens: int) -> List[str]:
+        tokens = self.encoding.encode(text)
+        return [
+            self.encoding.decode(tokens[start : start + max_tokens])  # noqa: E203
+            for start in range(0, len(tokens), max_tokens)
+        ]
+
+
+class RateLimiter:
+    """Token bucket allowing ``per_minute`` units per minute (0 = unlimited)."""
+
+    def __init__(self, per_minute: float):
+        self.rate = per_minute / 60
+        self.capacity = per_minute
+        self.available = per_minute
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self, amount: float = 1) -> None:
+        if self.rate <= 0:
+            return
+
+        amount = min(amount, self.capacity)
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.available = min(
+                    self.capacity, self.available + (now - self.updated) * self.rate
+                )
+                self.updated = now
+                if self.available >= amount:
+                    self.available -= amount
+                    return
+                await asyncio.sleep((amount - self.available) / self.rate)
+
+
+class Embedder:
+    """Embeds chunks in concurrent, rate-limited batches with retries."""
+
+    def __init__(self, args: argparse.Namespace, tokenizer: Tokenizer):
+        self.llm = LLMClient()
+        self.model = args.model
+        self.tokenizer = tokenizer
+        self.batch_size = args.batch_size
+        self.retries = args.retries
+        self.semaphore = asyncio.Semaphore(args.concurrency)
+        self.requests = RateLimiter(args.requests_per_minute)
+        self.tokens = RateLimiter(args.tokens_per_minute)
+
+    async def _embed_batch(self, texts: List[str]) -> List[List[float]]:
+        tokens = sum(self.tokenizer.count(text) for text in texts)
+        async with self.semaphore:
+            for attempt in range(self.retries + 1):
+                await self.requests.acquire()
+                await self.tokens.acquire(tokens)
+                try:
+                    return await self.llm.embed_many(texts, self.model)
+                except Exception as e:
+                    if attempt == self.retries:
+                        raise
+                    delay = 2**attempt
+                    print(f"  embedding batch failed ({e}); retrying in {delay}s")
+                    await asyncio.sleep(delay)
+        raise AssertionError("unreachable")
+
+    async def embed(self, texts: List[str]) -> List[List[float]]:
+        batches = [
+            texts[start : start + self.batch_size]  # noqa: E203
+            for start in range(0, len(texts), self.batch_size)
+        ]
+        results = await asyncio.gather(*(self._embed_batch(b) for b in batches))
+        return [embedding for batch in results for embedding in batch]
+
+
+def file_digest(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def discover(source: Path, clause_type: Optional[str]) -> Iterator[Document]:
+    """Yield source documents in a stable order."""
+    for root, dirs, files in os.walk(source):
+        dirs.sort()
+        for name in sorted(files):
+            path = Path(root) / name
+            if path.suffix.lower() not in SOURCE_SUFFIXES:
+                continue
+
+            relative = path.relative_to(source)
+            doc_clause_type = clause_type or (
+                relative.parts[0] if len(relative.parts) > 1 else ""
+            )
+            if not CLAUSE_TYPE_PATTERN.match(doc_clause_type):
+                print(f"Skipping {relative}: no clause type (use --clause-type)")
+                continue
+
+            yield Document(
+                path=path,
+                document_id=relative.as_posix(),
+                clause_type=doc_clause_type,
+                file_hash=file_digest(path),
+            )
+
+
+def chunk_text(text: str, tokenizer: Tokenizer, max_tokens: int) -> List[Chunk]:
+    """Split text into chunks that never span a section or page boundary."""
+    chunks: List[Chunk] = []
+    section, page = "", 1
+    paragraphs: List[str] = []
+    size = 0
+
+    def flush() -> None:
+        nonlocal paragraphs, size
+        content = "\n\n".join(paragraphs).strip()
+        if content:
+            for part in tokenizer.split(content, max_tokens):
+                chunks.append(Chunk(part.strip(), section, page))
+        paragraphs, size = [], 0
+
+    for page_text in text.split("\f"):
+        for paragraph in re.split(r"\n\s*\n", page_text):
+            paragraph = paragraph.strip()
+            if not paragraph:
+                continue
+
+            match = SECTION_PATTERN.match(paragraph)
+            if match and match.group(1) != section:
+                flush()
+                section = match.group(1)
+
+            tokens = tokenizer.count(paragraph)
+            if paragraphs and size + tokens > max_tokens:
+                flush()
+            paragraphs.append(paragraph)
+            size += tokens
+        flush()
+        page += 1
+
+    return chunks
+
+
+def load_chunks(doc: Document, tokenizer: Tokenizer, max_tokens: int) -> List[Chunk]:
+    """Read and chunk one document."""
+    if doc.path.suffix.lower() == ".jsonl":
+        chunks = []
+        for line in doc.path.read_text().splitlines():
+            if line.strip():
+                entry = json.loads(line)
+                chunks.append(
+                    Chunk(
+                        entry["content"].strip(),
+                        entry.get("section") or "",
+                        entry.get("page_number"),
+                    )
+                )
+        return chunks
+
+    return chunk_text(doc.path.read_text(), tokenizer, max_tokens)
+
+
+def hash_chunk(chunk: Chunk, model: str) -> str:
+    """Content hash; includes the model so a model change re-embeds."""
+    payload = f"{model}\n{chunk.section}\n{chunk.page_number}\n{chunk.content}"
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def diff_chunks(
+    chunks: Dict[str, Chunk], stored: List[Mapping[str, Any]]
+) -> Tuple[List[Chunk], List[Any]]:
+    """
+    Compare a document's chunks with its stored rows.
+
+    Args:
+        chunks: Current chunks keyed by content hash
+        stored: Stored rows with "id" and "content_hash"
+
+    Returns:
+        Chunks to embed and ids of stored rows to delete
+    """
+    stored_hashes = {row["content_hash"] for row in stored}
+    # Rows without a hash were loaded out of band; replace them
+    stale = [row["id"] for row in stored if row["content_hash"] not in chunks]
+    new = [chunk for h, chunk in chunks.items() if h not in stored_hashes]
+    return new, stale
+
+
+class Checkpoint:
+    """Documents already ingested, keyed by document id and file hash."""
+
+    def __init__(self, path: Optional[Path], model: str):
+        self.path = path
+        self.model = model
+        self.documents: Dict[str, str] = {}
+        if path and path.exists():
+            data = json.loads(path.read_text())
+            if data.get("model") == model:
+                self.documents = data.get("documents", {})
+
+    def done(self, doc: Document) -> bool:
+        return self.documents.get(doc.document_id) == doc.file_hash
+
+    def record(self, doc: Document) -> None:
+        self.documents[doc.document_id] = doc.file_hash
+        if self.path:
+            tmp = self.path.with_suffix(".tmp")
+            tmp.write_text(
+                json.dumps({"model": self.model, "documents": self.documents})
+            )
+            os.replace(tmp, self.path)
+
+
+async def ingest_document(
+    pool: asyncpg.Pool,
+    embedder: Embedder,
+    doc: Document,
+    args: argparse.Namespace,
+    stats: IngestStats,
+) -> None:
+    """Diff one document against the table and apply the changes."""
+    chunks: Dict[str, Chunk] = {}
+    for chunk in load_chunks(doc, embedder.tokenizer, args.chunk_tokens):
+        chunk.content_hash = hash_chunk(chunk, args.model)
+        chunks.setdefault(chunk.content_hash, chunk)
+
+    async with pool.acquire() as conn:
+        stored = await conn.fetch(
+            "SELECT id, content_hash FROM clause_embeddings WHERE document_id = $1",
+            doc.document_id,
+        )
+    new, stale = diff_chunks(chunks, stored)
+
+    stats.chunks += len(chunks)
+    stats.unchanged += len(chunks) - len(new)
+    if args.dry_run:
+        print(f"{doc.document_id}: would embed {len(new)}, delete {len(stale)}")
+        return
+
+    embeddings = await embedder.embed([chunk.content for chunk in new])
+    records = [
+        (
+            chunk.content,
+            doc.clause_type,
+            doc.path.name,
+            chunk.section,
+            chunk.page_number,
+            doc.document_id,
+            chunk.content_hash,
+            "[" + ",".join(map(str, embedding)) + "]",
+        )
+        for chunk, embedding in zip(new, embeddings)
+    ]
+
+    async with pool.acquire() as conn:
+        async with conn.transaction():
+            if records:
+                await conn.execute(
+                    f"""
+                    CREATE TEMP TABLE IF NOT EXISTS {STAGING_TABLE} (
+                        content text, clause_type text, source text, section text,
+                        page_number integer, document_id text, content_hash text,
+                        embedding text
+                    ) ON COMMIT DELETE ROWS
+                    """
+                )
+                await conn.copy_records_to_table(
+                    STAGING_TABLE, records=records, columns=STAGING_COLUMNS
+                )
+                columns = ", ".join(STAGING_COLUMNS[:-1])
+                await conn.execute(
+                    f"INSERT INTO clause_embeddings ({columns}, embedding) "
+                    f"SELECT {columns}, embedding::vector FROM {STAGING_TABLE}"
+                )
+            if stale:
+                await conn.execute(
+                    "DELETE FROM clause_embeddings WHERE id = ANY($1)", stale
+                )
+
+    stats.embedded += len(new)
+    stats.deleted += len(stale)
+    stats.tokens += sum(embedder.tokenizer.count(c.content) for c in new)
+    if new or stale:
+        print(f"{doc.document_id}: embedded {len(new)}, deleted {len(stale)}")
+
+
+async def ingest(args: argparse.Namespace) -> IngestStats:
+    """Ingest every document under the source directory."""
+    stats = IngestStats()
+    checkpoint = Checkpoint(
+        Path(args.checkpoint) if args.checkpoint else None, args.model
+    )
+    embedder = Embedder(args, Tokenizer(args.model))
+
+    pool = await asyncpg.create_pool(args.dsn, min_size=1, max_size=args.workers)
+    try:
+        if not args.dry_run:
+            async with pool.acquire() as conn:
+                for statement in SETUP_STATEMENTS:
+                    await conn.execute(statement)
+
+        queue: "asyncio.Queue[Optional[Document]]" = asyncio.Queue(args.workers * 2)
+
+        async def worker() -> None:
+            while (doc := await queue.get()) is not None:
+                await ingest_document(pool, embedder, doc, args, stats)
+                if not args.dry_run:
+                    checkpoint.record(doc)
+
+        async def produce() -> None:
+            for doc in discover(Path(args.source), args.clause_type):
+                stats.documents += 1
+                if checkpoint.done(doc):
+                    stats.resumed += 1
+                    continue
+                # Bounded queue: documents are read as workers free up
+                await queue.put(doc)
+                if stats.documents % 50 == 0:
+                    print(f"[progress] {stats.report()}")
+            for _ in range(args.workers):
+                await queue.put(None)
+
+        tasks = [asyncio.create_task(produce())]
+        tasks += [asyncio.create_task(worker()) for _ in range(args.workers)]
+        try:
+            # Stop at the first failure rather than leave the producer
+            # blocked on a queue no worker is reading
+            done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+            for task in done:
+                task.result()
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+    finally:
+        await pool.close()
+
+    return stats
+
+
+def main():
+    """Main CLI function."""
+    parser = argparse.ArgumentParser(description="Ingest documents incrementally")
+    parser.add_argument("--source", required=True, help="Source document directory")
+    parser.add_argument("--clause-type", help="Clause type for every document")
+    parser.add_argument("--dsn", default=settings.database_url)
+    parser.add_argument("--model", default=settings.embedding_model)
+    parser.add_argument("--checkpoint", help="Resume file for finished documents")
+    parser.add_argument("--chunk-tokens", type=int, default=400)
+    parser.add_argument("--batch-size", type=int, default=64, help="Texts/request")
+    parser.add_argument("--concurrency", type=int, default=4, help="Parallel requests")
+    parser.add_argument("--workers", type=int, default=4, help="Parallel documents")
+    parser.add_argument("--requests-per-minute", type=float, default=3000)
+    parser.add_argument("--tokens-per-minute", type=float, default=1_000_000)
+    parser.add_argument("--retries", type=int, default=5)
+    parser.add_argument(
+        "--dry-run", action="store_true", help="Report changes without writing"
+    )
+
+    args = parser.parse_args()
+    if not args.dsn:
+        parser.error("--dsn or DATABASE_URL is required")
+    if args.clause_type and not CLAUSE_TYPE_PATTERN.match(args.clause_type):
+        parser.error(f"Invalid clause type: {args.clause_type}")
+
+    stats = asyncio.run(ingest(args))
+    print(f"\nDone: {stats.report()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,506 @@
+#!/usr/bin/env python3
+"""
+Load-test and latency benchmark for the chat API.
+
+Boots create_app() in-process against tools/fake_upstream.py, which stands
+in for OpenAI, Anthropic and Supabase (JWKS + match_documents RPC), then
+drives concurrent /api/v1/chat and /api/v1/chat/stream traffic with real
+ES256 bearer tokens.
+
+Reports throughput, latency percentiles, time-to-first-byte for streams and
+event-loop lag of the API server, and saves the results as JSON so runs can
+be compared between commits:
+
+    python tools/loadtest.py --scenario mixed --concurrency 40 --requests 800
+    python tools/loadtest.py --compare loadtest-abc1234.json
+
+The chat endpoints answer upstream failures with a 200 and an apology, so a
+response only counts as successful if its text carries none of the agents'
+error or fallback answers. The run exits non-zero when any request failed,
+or when the fake upstream returned errors the responses did not show.
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import random
+import socket
+import subprocess
+import sys
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+# Add src directory to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import httpx  # noqa: E402
+import uvicorn  # noqa: E402
+from cryptography.hazmat.primitives import serialization  # noqa: E402
+from cryptography.hazmat.primitives.asymmetric import ec  # noqa: E402
+from fake_upstream import UpstreamConfig, create_fake_upstream  # noqa: E402
+from jose import jwk, jwt  # noqa: E402
+
+QUERIES = [
+    "What is the minimum R-value for roof insulation in climate zone 3?",
+    "Do I need a handrail on an accessible ramp?",
+    "How should the hot water system be sized for a house?",
+    "What are the requirements for emergency lighting in exit ways?",
+    "Which ventilation rates apply to a commercial kitchen?",
+    "Can I use PVC conduit for the switchboard cabling?",
+    "What durability period applies to cladding?",
+    "Tell me about the rules for my project",  # vague: falls back to LLM tier
+]
+
+KID = "loadtest-kid"
+
+# Answers the agents give instead of raising when retrieval or the LLM fails
+FAILURE_MARKERS = (
+    "I encountered an error",
+    "Error: ",
+    "I don’t know.",
+)
+
+
+class ServerThread(threading.Thread):
+    """Run a uvicorn server on its own event loop in a background thread."""
+
+    def __init__(self, app, port: int, sample_loop_lag: bool = False):
+        super().__init__(daemon=True)
+        self.server = uvicorn.Server(
+            uvicorn.Config(
+                app,
+                host="127.0.0.1",
+                port=port,
+                log_level="warning",
+                access_log=False,
+                lifespan="on",
+            )
+        )
+        self.sample_loop_lag = sample_loop_lag
+        self.lag_samples: List[float] = []
+
+    def run(self) -> None:
+        asyncio.run(self._serve())
+
+    async def _serve(self) -> None:
+        if self.sample_loop_lag:
+            asyncio.get_running_loop().create_task(self._sample_lag())
+        await self.server.serve()
+
+    async def _sample_lag(self, interval: float = 0.01) -> None:
+        while not self.server.should_exit:
+            start = time.perf_counter()
+            await asyncio.sleep(interval)
+            self.lag_samples.append(time.perf_counter() - start - interval)
+
+    def start_and_wait(self, timeout: float = 30.0) -> None:
+        self.start()
+        deadline = time.time() + timeout
+        while not self.server.started:
+            if time.time() > deadline or not self.is_alive():
+                raise RuntimeError("Server failed to start")
+            time.sleep(0.05)
+
+    def stop(self) -> None:
+        self.server.should_exit = True
+        self.join(timeout=10)
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def git_commit() -> str:
+    try:
+        return (
+            subprocess.check_output(
+                ["git", "rev-parse", "--short", "HEAD"], stderr=subprocess.DEVNULL
+            )
+            .decode()
+            .strip()
+        )
+    except Exception:
+        return "unknown"
+
+
+def build_signing_material() -> tuple[bytes, Dict[str, Any]]:
+    """Create an ES256 key pair and the matching JWKS document."""
+    private_key = ec.generate_private_key(ec.SECP256R1())
+    private_pem = private_key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    )
+    public_pem = private_key.public_key().public_bytes(
+        serialization.Encoding.PEM, serialization.PublicFormat.SubjectPublicKeyInfo
+    )
+    public_jwk = jwk.construct(public_pem, "ES256").to_dict()
+    public_jwk.update({"kid": KID, "use": "sig"})
+    return private_pem, {"keys": [public_jwk]}
+
+
+def make_tokens(private_pem: bytes, issuer: str, count: int) -> List[str]:
+    """Sign a pool of user tokens, like distinct users hitting one instance."""
+    now = int(time.time())
+    return [
+        jwt.encode(
+            {
+                "sub": f"loadtest-user-{i}",
+                "aud": "authenticated",
+                "iss": issuer,
+                "exp": now + 3600,
+                "role": "authenticated",
+            },
+            private_pem,
+            algorithm="ES256",
+            headers={"kid": KID},
+        )
+        for i in range(count)
+    ]
+
+
+def is_failed_answer(text: str) -> bool:
+    """Whether a chat answer is an agent's error or fallback text."""
+    return any(marker in text for marker in FAILURE_MARKERS)
+
+
+def percentile(values: List[float], pct: float) -> Optional[float]:
+    """Nearest-rank percentile."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, math.ceil(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def distribution_ms(values: List[float]) -> Dict[str, Optional[float]]:
+    """Summarise a list of durations in seconds as milliseconds."""
+    if not values:
+        return {"p50": None, "p95": None, "p99": None, "mean": None, "max": None}
+    return {
+        "p50": round(percentile(values, 50) * 1000, 2),
+        "p95": round(percentile(values, 95) * 1000, 2),
+        "p99": round(percentile(values, 99) * 1000, 2),
+        "mean": round(sum(values) / len(values) * 1000, 2),
+        "max": round(max(values) * 1000, 2),
+    }
+
+
+async def send_chat(client: httpx.AsyncClient, token: str) -> Dict[str, Any]:
+    start = time.perf_counter()
+    response = await client.post(
+        "/api/v1/chat",
+        json={"content": random.choice(QUERIES)},
+        headers={"Authorization": f"Bearer {token}"},
+    )
+    latency = time.perf_counter() - start
+    failed = response.status_code == 200 and is_failed_answer(
+        response.json().get("response", "")
+    )
+    return {
+        "kind": "chat",
+        "status": response.status_code,
+        "latency": latency,
+        "ttfb": None,
+        "failed": failed,
+    }
+
+
+async def send_stream(client: httpx.AsyncClient, token: str) -> Dict[str, Any]:
+    start = time.perf_counter()
+    ttfb = None
+    body = []
+    async with client.stream(
+        "POST",
+        "/api/v1/chat/stream",
+        json={"content": random.choice(QUERIES)},
+        headers={"Authorization": f"Bearer {token}"},
+    ) as response:
+        async for chunk in response.aiter_bytes():
+            if ttfb is None and chunk:
+                ttfb = time.perf_counter() - start
+            body.append(chunk)
+    return {
+        "kind": "stream",
+        "status": response.status_code,
+        "latency": time.perf_counter() - start,
+        "ttfb": ttfb,
+        "failed": is_failed_answer(b"".join(body).decode(errors="replace")),
+    }
+
+
+async def drive(
+    base_url: str,
+    scenario: str,
+    concurrency: int,
+    total_requests: int,
+    duration: Optional[float],
+    tokens: List[str],
+) -> tuple[List[Dict[str, Any]], float]:
+    """Run closed-loop workers until the request budget or duration is used."""
+    senders = {"chat": [send_chat], "stream": [send_stream]}.get(
+        scenario, [send_chat, send_stream]
+    )
+    results: List[Dict[str, Any]] = []
+    issued = 0
+    deadline = time.perf_counter() + duration if duration else None
+
+    limits = httpx.Limits(
+        max_connections=concurrency, max_keepalive_connections=concurrency
+    )
+    async with httpx.AsyncClient(
+        base_url=base_url, limits=limits, timeout=120.0
+    ) as client:
+
+        async def worker(worker_id: int) -> None:
+            nonlocal issued
+            while True:
+                if deadline is not None:
+                    if time.perf_counter() >= deadline:
+                        return
+                elif issued >= total_requests:
+                    return
+                issued += 1
+                sender = senders[issued % len(senders)]
+                token = tokens[worker_id % len(tokens)]
+                try:
+                    results.append(await sender(client, token))
+                except Exception as e:
+                    results.append(
+                        {
+                            "kind": sender.__name__.removeprefix("send_"),
+                            "status": 0,
+                            "latency": 0.0,
+                            "ttfb": None,
+                            "error": type(e).__name__,
+                        }
+                    )
+
+        start = time.perf_counter()
+        await asyncio.gather(*(worker(i) for i in range(concurrency)))
+        elapsed = time.perf_counter() - start
+
+    return results, elapsed
+
+
+def summarise(
+    results: List[Dict[str, Any]], elapsed: float, lag_samples: List[float]
+) -> Dict[str, Any]:
+    summary: Dict[str, Any] = {
+        "elapsed_seconds": round(elapsed, 3),
+        "total_requests": len(results),
+        "rps": round(len(results) / elapsed, 2) if elapsed else 0.0,
+        "endpoints": {},
+        "event_loop_lag_ms": distribution_ms(lag_samples),
+    }
+
+    for kind in sorted({result["kind"] for result in results}):
+        subset = [result for result in results if result["kind"] == kind]
+        ok = [
+            result
+            for result in subset
+            if result["status"] == 200 and not result.get("failed")
+        ]
+        summary["endpoints"][kind] = {
+            "requests": len(subset),
+            "errors": len(subset) - len(ok),
+            "rps": round(len(ok) / elapsed, 2) if elapsed else 0.0,
+            "latency_ms": distribution_ms([result["latency"] for result in ok]),
+            "ttfb_ms": distribution_ms(
+                [result["ttfb"] for result in ok if result["ttfb"] is not None]
+            ),
+        }
+
+    return summary
+
+
+def print_summary(summary: Dict[str, Any]) -> None:
+    print(
+        f"Total: {summary['total_requests']} requests in "
+        f"{summary['elapsed_seconds']}s ({summary['rps']} rps)"
+    )
+    for kind, stats in summary["endpoints"].items():
+        latency = stats["latency_ms"]
+        print(
+            f"  {kind:<7} n={stats['requests']:<6} errors={stats['errors']:<4} "
+            f"rps={stats['rps']:<8} p50={latency['p50']}ms p95={latency['p95']}ms "
+            f"p99={latency['p99']}ms"
+        )
+        if stats["ttfb_ms"]["p50"] is not None:
+            ttfb = stats["ttfb_ms"]
+            print(
+                f"          time-to-first-byte p50={ttfb['p50']}ms "
+                f"p95={ttfb['p95']}ms p99={ttfb['p99']}ms"
+            )
+    lag = summary["event_loop_lag_ms"]
+    print(f"  event loop lag p50={lag['p50']}ms p99={lag['p99']}ms max={lag['max']}ms")
+
+
+def check_upstream(summary: Dict[str, Any], upstream_errors: int) -> List[str]:
+    """Reasons the run failed, from client-side errors and upstream counters."""
+    problems = []
+    errors = sum(stats["errors"] for stats in summary["endpoints"].values())
+    if errors:
+        problems.append(f"{errors} of {summary['total_requests']} requests failed")
+    if upstream_errors and not errors:
+        problems.append(
+            f"fake upstream returned {upstream_errors} errors but every "
+            "response looked successful"
+        )
+    return problems
+
+
+def compare(current: Dict[str, Any], baseline_path: str) -> None:
+    """Print relative changes against a previously saved run."""
+    baseline = json.loads(Path(baseline_path).read_text())
+    print(f"\nCompared with {baseline_path} (commit {baseline.get('commit')}):")
+
+    def delta(new, old) -> str:
+        if new is None or old in (None, 0):
+            return "n/a"
+        return f"{(new - old) / old * 100:+.1f}%"
+
+    print(f"  rps {delta(current['results']['rps'], baseline['results']['rps'])}")
+    for kind, stats in current["results"]["endpoints"].items():
+        old = baseline["results"]["endpoints"].get(kind)
+        if not old:
+            continue
+        for metric in ("latency_ms", "ttfb_ms"):
+            for pct in ("p50", "p95", "p99"):
+                change = delta(stats[metric][pct], old[metric][pct])
+                if change != "n/a":
+                    print(f"  {kind} {metric} {pct} {change}")
+    old_lag = baseline["results"]["event_loop_lag_ms"]
+    new_lag = current["results"]["event_loop_lag_ms"]
+    print(f"  event loop lag p99 {delta(new_lag['p99'], old_lag['p99'])}")
+
+
+def main():
+    """Main CLI function."""
+    parser = argparse.ArgumentParser(description="Load-test the chat API")
+    parser.add_argument(
+        "--scenario", choices=["chat", "stream", "mixed"], default="mixed"
+    )
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--requests", type=int, default=400)
+    parser.add_argument(
+        "--duration", type=float, help="Run for N seconds instead of --requests"
+    )
+    parser.add_argument("--warmup", type=int, default=10)
+    parser.add_argument("--users", type=int, default=50, help="Distinct JWTs to use")
+    parser.add_argument("--llm-latency-ms", type=float, default=300.0)
+    parser.add_argument("--token-rate", type=float, default=50.0)
+    parser.add_argument("--response-tokens", type=int, default=120)
+    parser.add_argument("--db-latency-ms", type=float, default=20.0)
+    parser.add_argument("--provider", choices=["openai", "anthropic"], default="openai")
+    parser.add_argument(
+        "--output", help="Results file (default loadtest-<commit>.json)"
+    )
+    parser.add_argument("--compare", help="Baseline results file to compare against")
+
+    args = parser.parse_args()
+
+    private_pem, jwks_document = build_signing_material()
+    upstream_port = free_port()
+    upstream_url = f"http://127.0.0.1:{upstream_port}"
+
+    # Settings are read at import time, so point them at the stand-ins first
+    os.environ.update(
+        {
+            "APP_ENV": "loadtest",
+            "LOG_LEVEL": "WARNING",
+            "SUPABASE_URL": upstream_url,
+            "SUPABASE_ANON_KEY": "loadtest-anon-key",
+            "SUPABASE_SERVICE_ROLE_KEY": "loadtest-service-key",
+            "OPENAI_API_KEY": "loadtest-openai-key",
+            "OPENAI_BASE_URL": f"{upstream_url}/v1",
+            "ANTHROPIC_API_KEY": "loadtest-anthropic-key",
+            "ANTHROPIC_BASE_URL": upstream_url,
+            "DEFAULT_LLM_PROVIDER": args.provider,
+        }
+    )
+
+    from agent_project.application.main import create_app
+
+    upstream_app = create_fake_upstream(
+        UpstreamConfig(
+            llm_latency_ms=args.llm_latency_ms,
+            token_rate=args.token_rate,
+            response_tokens=args.response_tokens,
+            db_latency_ms=args.db_latency_ms,
+            jwks=jwks_document,
+        )
+    )
+    upstream = ServerThread(upstream_app, upstream_port)
+    api_port = free_port()
+    api = ServerThread(create_app(), api_port, sample_loop_lag=True)
+
+    upstream.start_and_wait()
+    api.start_and_wait()
+    base_url = f"http://127.0.0.1:{api_port}"
+    tokens = make_tokens(private_pem, f"{upstream_url}/auth/v1", args.users)
+
+    try:
+        print(f"Warming up with {args.warmup} requests...")
+        asyncio.run(drive(base_url, args.scenario, 1, args.warmup, None, tokens))
+        api.lag_samples.clear()
+        warmup_errors = upstream_app.state.stats["errors"]
+
+        print(
+            f"Running {args.scenario} scenario: concurrency={args.concurrency} "
+            + (
+                f"duration={args.duration}s"
+                if args.duration
+                else f"requests={args.requests}"
+            )
+        )
+        results, elapsed = asyncio.run(
+            drive(
+                base_url,
+                args.scenario,
+                args.concurrency,
+                args.requests,
+                args.duration,
+                tokens,
+            )
+        )
+        lag_samples = list(api.lag_samples)
+        upstream_errors = upstream_app.state.stats["errors"] - warmup_errors
+    finally:
+        api.stop()
+        upstream.stop()
+
+    summary = summarise(results, elapsed, lag_samples)
+    summary["upstream_errors"] = upstream_errors
+    print_summary(summary)
+
+    commit = git_commit()
+    report = {
+        "commit": commit,
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "config": vars(args),
+        "results": summary,
+    }
+    output = Path(args.output or f"loadtest-{commit}.json")
+    output.write_text(json.dumps(report, indent=2))
+    print(f"\nResults saved to {output}")
+
+    if args.compare:
+        compare(report, args.compare)
+
+    problems = check_upstream(summary, upstream_errors)
+    for problem in problems:
+        print(f"FAILED: {problem}", file=sys.stderr)
+    if problems:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
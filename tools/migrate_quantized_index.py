@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Migrate the per-clause-type vector indexes to a quantized representation.
+
+Full-precision embeddings stay in ``clause_embeddings.embedding`` for
+rescoring; the new partial HNSW indexes are built on an expression over that
+column (``embedding::halfvec(D)`` or ``binary_quantize(embedding)::bit(D)``),
+so no table rewrite or new column is needed. Steps:
+
+1. Build the quantized indexes concurrently (searches continue meanwhile).
+2. Check with EXPLAIN that quantized searches are planned on them.
+3. Report index sizes before and after.
+4. With --drop-full, drop the full-precision indexes. Only do this once
+   every instance runs with VECTOR_QUANTIZATION set to the new mode, or
+   their searches fall back to sequential scans.
+
+    python tools/migrate_quantized_index.py --mode halfvec
+"""
+
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+from typing import Dict, List
+
+# Add src directory to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from agent_project.infrastructure.vector_db.client import (  # noqa: E402
+    INDEX_SUFFIXES,
+    VectorDBClient,
+)
+
+
+def index_sizes(indexes: List[Dict]) -> Dict[str, int]:
+    """Total index bytes per storage mode."""
+    sizes = {mode: 0 for mode in INDEX_SUFFIXES}
+    for index in indexes:
+        # Longest suffix first: "halfvec_hnsw_idx" also ends in "hnsw_idx"
+        for mode, suffix in sorted(
+            INDEX_SUFFIXES.items(), key=lambda item: -len(item[1])
+        ):
+            if index["name"].endswith(f"_{suffix}"):
+                sizes[mode] += index["size_bytes"] or 0
+                break
+    return sizes
+
+
+def print_sizes(label: str, sizes: Dict[str, int]) -> None:
+    print(
+        f"{label}: "
+        + ", ".join(f"{mode}={size / 2**20:.1f} MiB" for mode, size in sizes.items())
+    )
+
+
+async def migrate(args: argparse.Namespace) -> int:
+    """Run the migration and return the process exit code."""
+    client = VectorDBClient()
+    try:
+        clause_types = args.clause_type or await client.list_clause_types()
+        print_sizes(
+            "Index sizes before", index_sizes(await client.get_vector_indexes())
+        )
+
+        print(f"Building {args.mode} indexes for {', '.join(clause_types)}")
+        outcome = await client.ensure_clause_type_indexes(clause_types, args.mode)
+        for clause_type, result in outcome.items():
+            print(f"  {clause_type}: {result}")
+
+        failed = []
+        for clause_type in clause_types:
+            plan = await client.explain_filtered_search(clause_type, args.mode)
+            status = "ok" if plan["uses_partial_index"] else "NOT USED"
+            print(f"  {clause_type}: {status} ({', '.join(plan['indexes_used'])})")
+            if not plan["uses_partial_index"]:
+                failed.append(clause_type)
+
+        sizes = index_sizes(await client.get_vector_indexes())
+        print_sizes("Index sizes after", sizes)
+        if sizes["none"]:
+            print(f"{args.mode} / full size: {sizes[args.mode] / sizes['none']:.2f}")
+
+        if failed:
+            print(f"Not dropping anything: plans do not use {failed}")
+            return 1
+
+        if args.drop_full and args.mode != "none":
+            dropped = await client.drop_clause_type_indexes(clause_types, "none")
+            print(f"Dropped {len(dropped)} full-precision indexes")
+        else:
+            print(f"Set VECTOR_QUANTIZATION={args.mode} to search the new indexes")
+        return 0
+    finally:
+        await client.close()
+
+
+def main():
+    """Main CLI function."""
+    parser = argparse.ArgumentParser(description="Migrate to quantized indexes")
+    parser.add_argument("--mode", choices=sorted(INDEX_SUFFIXES), required=True)
+    parser.add_argument("--clause-type", nargs="+", help="Only these clause types")
+    parser.add_argument(
+        "--drop-full",
+        action="store_true",
+        help="Drop the full-precision indexes after a successful migration",
+    )
+
+    args = parser.parse_args()
+    sys.exit(asyncio.run(migrate(args)))
+
+
+if __name__ == "__main__":
+    main()
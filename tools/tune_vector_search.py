@@ -0,0 +1,283 @@
+#!/usr/bin/env python3
+"""
+Tune ANN search parameters per clause type for a target recall.
+
+For each clause type, takes a sample of queries, computes their exact top-k
+with a sequential scan, then sweeps ``hnsw.ef_search`` and ``ivfflat.probes``
+over the same search SQL the API runs. The cheapest setting (lowest median
+latency) that reaches the target recall is saved to a JSON file for
+VECTOR_SEARCH_TUNING_PATH (see agent_project.infrastructure.vector_db.tuning).
+
+Queries come from one of:
+- --queries FILE: JSON lines with "query" and "clause_type"
+- --log-file FILE: JSON application logs ("Performing vector similarity search")
+- neither: stored embeddings sampled from clause_embeddings
+
+    python tools/tune_vector_search.py --target-recall 0.95 --out tuning.json
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import statistics
+import sys
+import time
+from collections import defaultdict
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Optional, Set
+
+# Add src directory to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import asyncpg  # noqa: E402
+
+from agent_project.config import settings  # noqa: E402
+from agent_project.infrastructure.vector_db.client import (  # noqa: E402
+    apply_search_params,
+    build_search_sql,
+    candidate_count,
+)
+
+EF_SEARCH_VALUES = [10, 16, 24, 32, 48, 64, 100, 150, 200, 300, 400]
+PROBES_VALUES = [1, 2, 4, 6, 8, 10, 15, 20, 30, 50]
+
+SEARCH_LOG_EVENT = "Performing vector similarity search"
+
+
+def read_queries(path: Path, from_logs: bool) -> Dict[str, List[str]]:
+    """Read query texts grouped by clause type from a fixture or log file."""
+    queries: Dict[str, List[str]] = defaultdict(list)
+    for line in path.read_text().splitlines():
+        try:
+            entry = json.loads(line)
+        except ValueError:
+            continue
+        if from_logs and entry.get("event") != SEARCH_LOG_EVENT:
+            continue
+        if entry.get("query") and entry.get("clause_type"):
+            queries[entry["clause_type"]].append(entry["query"])
+    return queries
+
+
+async def embed_queries(
+    queries: Dict[str, List[str]], sample: int
+) -> Dict[str, List[str]]:
+    """Embed up to ``sample`` distinct queries per clause type."""
+    from agent_project.infrastructure.llm.client import LLMClient
+
+    llm = LLMClient()
+    vectors: Dict[str, List[str]] = {}
+    for clause_type, texts in queries.items():
+        chosen = random.sample(sorted(set(texts)), min(sample, len(set(texts))))
+        embeddings = [await llm.embed(text) for text in chosen]
+        vectors[clause_type] = [
+            "[" + ",".join(map(str, embedding)) + "]" for embedding in embeddings
+        ]
+    return vectors
+
+
+async def sample_stored_vectors(
+    conn: asyncpg.Connection, sample: int
+) -> Dict[str, List[str]]:
+    """Sample stored embeddings per clause type to use as queries."""
+    rows = await conn.fetch(
+        """
+        SELECT clause_type, embedding::text AS embedding FROM (
+            SELECT clause_type, embedding,
+                   row_number() OVER (PARTITION BY clause_type ORDER BY random()) AS n
+            FROM clause_embeddings
+            WHERE embedding IS NOT NULL AND clause_type IS NOT NULL
+        ) sampled
+        WHERE n <= $1
+        """,
+        sample,
+    )
+    vectors: Dict[str, List[str]] = defaultdict(list)
+    for row in rows:
+        vectors[row["clause_type"]].append(row["embedding"])
+    return vectors
+
+
+async def search(
+    conn: asyncpg.Connection,
+    clause_type: str,
+    vector: str,
+    k: int,
+    ef_search: int,
+    probes: int,
+    exact: bool = False,
+    quantization: Optional[str] = None,
+) -> Set[int]:
+    """Run the API's search query and return the matched ids."""
+    # Exact search is always full precision; otherwise default to the
+    # configured VECTOR_QUANTIZATION, as the API does
+    if exact:
+        quantization = "none"
+    async with conn.transaction(readonly=True):
+        if exact:
+            # Disabling index scans leaves the sequential scan: exact top-k
+            await conn.execute("SET LOCAL enable_indexscan = off")
+        await apply_search_params(
+            conn, candidate_count(k, quantization), ef_search, probes
+        )
+        rows = await conn.fetch(
+            build_search_sql(clause_type, quantization), vector, k, -1.0
+        )
+    return {row["id"] for row in rows}
+
+
+async def measure(
+    conn: asyncpg.Connection,
+    clause_type: str,
+    vectors: List[str],
+    truth: List[Set[int]],
+    k: int,
+    ef_search: int,
+    probes: int,
+) -> Dict[str, float]:
+    """Recall@k and median latency of one parameter setting."""
+    found, latencies = 0, []
+    for vector, expected in zip(vectors, truth):
+        start = time.perf_counter()
+        ids = await search(conn, clause_type, vector, k, ef_search, probes)
+        latencies.append((time.perf_counter() - start) * 1000)
+        found += len(ids & expected)
+
+    total = sum(len(expected) for expected in truth)
+    return {
+        "recall": round(found / total if total else 1.0, 4),
+        "p50_ms": round(statistics.median(latencies), 3),
+    }
+
+
+def cheapest(results: List[Dict], target_recall: float) -> Optional[Dict]:
+    """Fastest setting meeting the target, else the most accurate one."""
+    meeting = [r for r in results if r["recall"] >= target_recall]
+    if meeting:
+        return min(meeting, key=lambda r: (r["p50_ms"], r["value"]))
+    return max(results, key=lambda r: (r["recall"], -r["p50_ms"])) if results else None
+
+
+async def tune_clause_type(
+    conn: asyncpg.Connection,
+    clause_type: str,
+    vectors: List[str],
+    k: int,
+    target_recall: float,
+) -> Dict[str, float]:
+    """Sweep ef_search and probes for one clause type."""
+    truth = [
+        await search(conn, clause_type, vector, k, k, 1, exact=True)
+        for vector in vectors
+    ]
+    # Warm the index pages so the first setting is not charged for I/O
+    await measure(conn, clause_type, vectors, truth, k, max(EF_SEARCH_VALUES), 1)
+
+    ef_results = []
+    for ef_search in (v for v in EF_SEARCH_VALUES if v >= k):
+        result = await measure(
+            conn,
+            clause_type,
+            vectors,
+            truth,
+            k,
+            ef_search,
+            settings.vector_ivfflat_probes,
+        )
+        ef_results.append({"value": ef_search, **result})
+        print(f"  {clause_type} ef_search={ef_search:<4} {result}")
+
+    probe_results = []
+    for probes in PROBES_VALUES:
+        result = await measure(
+            conn, clause_type, vectors, truth, k, settings.vector_hnsw_ef_search, probes
+        )
+        probe_results.append({"value": probes, **result})
+        print(f"  {clause_type} probes={probes:<4}    {result}")
+
+    best_ef = cheapest(ef_results, target_recall)
+    best_probes = cheapest(probe_results, target_recall)
+
+    # Only the parameter of the index type in use moves recall; report that one
+    def spread(results: List[Dict]) -> float:
+        return max(r["recall"] for r in results) - min(r["recall"] for r in results)
+
+    chosen = best_ef if spread(ef_results) >= spread(probe_results) else best_probes
+    return {
+        "ef_search": best_ef["value"],
+        "probes": best_probes["value"],
+        "recall": chosen["recall"],
+        "p50_ms": chosen["p50_ms"],
+        "queries": len(vectors),
+    }
+
+
+async def tune(args: argparse.Namespace) -> Dict:
+    """Tune every clause type that has sample queries."""
+    conn = await asyncpg.connect(args.dsn)
+    try:
+        if args.queries or args.log_file:
+            source = Path(args.queries or args.log_file)
+            vectors = await embed_queries(
+                read_queries(source, from_logs=bool(args.log_file)), args.sample
+            )
+        else:
+            vectors = await sample_stored_vectors(conn, args.sample)
+
+        tuned = {}
+        for clause_type in sorted(vectors):
+            if args.clause_type and clause_type not in args.clause_type:
+                continue
+            print(f"Tuning {clause_type} on {len(vectors[clause_type])} queries")
+            tuned[clause_type] = await tune_clause_type(
+                conn, clause_type, vectors[clause_type], args.k, args.target_recall
+            )
+    finally:
+        await conn.close()
+
+    return {
+        "target_recall": args.target_recall,
+        "k": args.k,
+        "tuned_at": datetime.now(timezone.utc).isoformat(),
+        "clause_types": tuned,
+    }
+
+
+def main():
+    """Main CLI function."""
+    parser = argparse.ArgumentParser(description="Tune ANN search parameters")
+    parser.add_argument("--dsn", default=settings.database_url)
+    parser.add_argument(
+        "--out",
+        default=settings.vector_search_tuning_path or "vector_search_tuning.json",
+    )
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument("--queries", help="JSON lines of query/clause_type")
+    source.add_argument("--log-file", help="JSON application log to sample from")
+    parser.add_argument("--sample", type=int, default=100, help="Queries per type")
+    parser.add_argument("--clause-type", nargs="+", help="Only tune these types")
+    parser.add_argument("--target-recall", type=float, default=0.95)
+    parser.add_argument("-k", type=int, default=settings.max_vector_results)
+
+    args = parser.parse_args()
+    if not args.dsn:
+        parser.error("--dsn or DATABASE_URL is required")
+
+    result = asyncio.run(tune(args))
+
+    Path(args.out).write_text(json.dumps(result, indent=2))
+    print(
+        f"\n{'clause_type':<12} {'ef_search':>9} {'probes':>6} {'recall':>7} {'p50 ms':>8}"
+    )
+    for clause_type, params in result["clause_types"].items():
+        print(
+            f"{clause_type:<12} {params['ef_search']:>9} {params['probes']:>6} "
+            f"{params['recall']:>7.3f} {params['p50_ms']:>8.3f}"
+        )
+    print(f"\nSaved to {args.out}; set VECTOR_SEARCH_TUNING_PATH to apply")
+
+
+if __name__ == "__main__":
+    main()